@@ -0,0 +1,31 @@
+"""Cover per-technician active work-order counts with a partial index.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_work_orders_org_tech_active
+            ON work_orders(organization_id, assigned_technician_id, status)
+            WHERE assigned_technician_id IS NOT NULL
+              AND status IN ('open', 'in_progress', 'paused', 'escalated');
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_work_orders_org_tech_active;")
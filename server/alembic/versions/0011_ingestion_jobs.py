@@ -0,0 +1,59 @@
+"""Durable queue table for background ingestion jobs.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingestion_jobs (
+            id BIGSERIAL PRIMARY KEY,
+            organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+            created_by BIGINT REFERENCES users(id) ON DELETE SET NULL,
+            source TEXT NOT NULL CHECK (source IN ('csv', 'webhook')),
+            status TEXT NOT NULL DEFAULT 'queued'
+                CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+            payload JSONB NOT NULL,
+            total_rows INTEGER NOT NULL DEFAULT 0,
+            processed_rows INTEGER NOT NULL DEFAULT 0,
+            created_count INTEGER NOT NULL DEFAULT 0,
+            created_work_order_ids JSONB NOT NULL DEFAULT '[]'::jsonb,
+            row_errors JSONB NOT NULL DEFAULT '[]'::jsonb,
+            error TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            locked_by TEXT,
+            locked_at TIMESTAMP WITH TIME ZONE,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()) NOT NULL,
+            started_at TIMESTAMP WITH TIME ZONE,
+            finished_at TIMESTAMP WITH TIME ZONE
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_org ON ingestion_jobs(organization_id, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_pending
+            ON ingestion_jobs(created_at, id)
+            WHERE status IN ('queued', 'running');
+
+        ALTER TABLE ingestion_jobs ENABLE ROW LEVEL SECURITY;
+
+        DROP POLICY IF EXISTS ingestion_jobs_isolation ON ingestion_jobs;
+        CREATE POLICY ingestion_jobs_isolation ON ingestion_jobs
+            USING (organization_id = techsync_current_org_id());
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ingestion_jobs;")
@@ -0,0 +1,44 @@
+"""Make (organization_id, external_ref) unique for idempotent ingestion.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Duplicates created by earlier webhook retries would block the unique
+    # index. Keep the oldest order on the reference and suffix the rest so
+    # they stay traceable.
+    op.execute(
+        """
+        UPDATE work_orders AS wo
+        SET external_ref = wo.external_ref || '#dup-' || wo.id
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY organization_id, external_ref ORDER BY created_at, id
+            ) AS position
+            FROM work_orders
+            WHERE external_ref IS NOT NULL
+        ) AS ranked
+        WHERE wo.id = ranked.id AND ranked.position > 1;
+
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_work_orders_org_external_ref
+            ON work_orders(organization_id, external_ref)
+            WHERE external_ref IS NOT NULL;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_work_orders_org_external_ref;")
@@ -0,0 +1,136 @@
+"""Daily rollups behind the operations report.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS work_order_service_daily_rollups (
+            organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+            day DATE NOT NULL,
+            service_type TEXT NOT NULL,
+            cost_work_order_count INTEGER NOT NULL DEFAULT 0,
+            estimated_cost_cents BIGINT NOT NULL DEFAULT 0,
+            actual_cost_cents BIGINT NOT NULL DEFAULT 0,
+            actual_cost_count INTEGER NOT NULL DEFAULT 0,
+            invoice_reference_count INTEGER NOT NULL DEFAULT 0,
+            latest_cost_work_order_at TIMESTAMP WITH TIME ZONE,
+            completed_count INTEGER NOT NULL DEFAULT 0,
+            cycle_seconds_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+            cycle_seconds_min DOUBLE PRECISION,
+            cycle_seconds_max DOUBLE PRECISION,
+            latest_completed_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (organization_id, day, service_type)
+        );
+
+        CREATE TABLE IF NOT EXISTS work_order_property_daily_rollups (
+            organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+            day DATE NOT NULL,
+            property_id BIGINT NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
+            total_work_orders INTEGER NOT NULL DEFAULT 0,
+            open_count INTEGER NOT NULL DEFAULT 0,
+            in_progress_count INTEGER NOT NULL DEFAULT 0,
+            completed_count INTEGER NOT NULL DEFAULT 0,
+            latest_work_order_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (organization_id, day, property_id)
+        );
+
+        -- No foreign key: rows are written from work_orders triggers, which
+        -- also fire while an organization is being cascade-deleted.
+        CREATE TABLE IF NOT EXISTS dashboard_rollup_dirty_days (
+            organization_id BIGINT NOT NULL,
+            day DATE NOT NULL,
+            marked_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()) NOT NULL,
+            PRIMARY KEY (organization_id, day)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_work_orders_org_completed_at
+            ON work_orders(organization_id, completed_at)
+            WHERE completed_at IS NOT NULL;
+
+        CREATE OR REPLACE FUNCTION techsync_mark_rollup_days()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                INSERT INTO dashboard_rollup_dirty_days (organization_id, day)
+                SELECT OLD.organization_id, changed.day
+                FROM unnest(ARRAY[
+                    (OLD.created_at AT TIME ZONE 'UTC')::date,
+                    (OLD.completed_at AT TIME ZONE 'UTC')::date
+                ]) AS changed(day)
+                WHERE changed.day IS NOT NULL
+                ON CONFLICT DO NOTHING;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO dashboard_rollup_dirty_days (organization_id, day)
+                SELECT NEW.organization_id, changed.day
+                FROM unnest(ARRAY[
+                    (NEW.created_at AT TIME ZONE 'UTC')::date,
+                    (NEW.completed_at AT TIME ZONE 'UTC')::date
+                ]) AS changed(day)
+                WHERE changed.day IS NOT NULL
+                ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS work_orders_mark_rollup_days ON work_orders;
+        CREATE TRIGGER work_orders_mark_rollup_days
+            AFTER INSERT OR DELETE OR UPDATE OF
+                status, service_type, property_id, estimated_cost_cents, actual_cost_cents,
+                invoice_reference, created_at, completed_at
+            ON work_orders
+            FOR EACH ROW
+            EXECUTE FUNCTION techsync_mark_rollup_days();
+
+        -- Backfill: every day with history starts dirty and is built by the
+        -- rollup refresher, most recent days first.
+        INSERT INTO dashboard_rollup_dirty_days (organization_id, day)
+        SELECT organization_id, (created_at AT TIME ZONE 'UTC')::date FROM work_orders
+        UNION
+        SELECT organization_id, (completed_at AT TIME ZONE 'UTC')::date FROM work_orders WHERE completed_at IS NOT NULL
+        ON CONFLICT DO NOTHING;
+
+        ALTER TABLE work_order_service_daily_rollups ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE work_order_property_daily_rollups ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE dashboard_rollup_dirty_days ENABLE ROW LEVEL SECURITY;
+
+        DROP POLICY IF EXISTS work_order_service_daily_rollups_isolation ON work_order_service_daily_rollups;
+        CREATE POLICY work_order_service_daily_rollups_isolation ON work_order_service_daily_rollups
+            USING (organization_id = techsync_current_org_id());
+        DROP POLICY IF EXISTS work_order_property_daily_rollups_isolation ON work_order_property_daily_rollups;
+        CREATE POLICY work_order_property_daily_rollups_isolation ON work_order_property_daily_rollups
+            USING (organization_id = techsync_current_org_id());
+        DROP POLICY IF EXISTS dashboard_rollup_dirty_days_isolation ON dashboard_rollup_dirty_days;
+        CREATE POLICY dashboard_rollup_dirty_days_isolation ON dashboard_rollup_dirty_days
+            USING (organization_id = techsync_current_org_id());
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DROP TRIGGER IF EXISTS work_orders_mark_rollup_days ON work_orders;
+        DROP FUNCTION IF EXISTS techsync_mark_rollup_days();
+        DROP INDEX IF EXISTS idx_work_orders_org_completed_at;
+        DROP TABLE IF EXISTS dashboard_rollup_dirty_days;
+        DROP TABLE IF EXISTS work_order_property_daily_rollups;
+        DROP TABLE IF EXISTS work_order_service_daily_rollups;
+        """
+    )
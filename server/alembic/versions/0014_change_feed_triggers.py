@@ -0,0 +1,147 @@
+"""Change-feed NOTIFY triggers for cross-worker cache invalidation.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> column holding the owning organization id.
+NOTIFYING_TABLES = {
+    "organizations": "id",
+    "users": "organization_id",
+    "technicians": "organization_id",
+    "work_orders": "organization_id",
+    "org_priority_rules": "organization_id",
+}
+
+NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION techsync_notify_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    org_column TEXT := TG_ARGV[0];
+    message TEXT;
+BEGIN
+    -- One notification per statement, organization and 500 ids (NOTIFY
+    -- payloads are capped at 8000 bytes). Updates report the union of the
+    -- columns that actually changed and skip rows where nothing did.
+    IF TG_OP = 'UPDATE' THEN
+        FOR message IN
+            WITH changed AS (
+                SELECT
+                    (to_jsonb(n) ->> org_column)::BIGINT AS organization_id,
+                    n.id,
+                    ARRAY(
+                        SELECT f.key
+                        FROM jsonb_each(to_jsonb(n)) AS f
+                        WHERE f.value IS DISTINCT FROM to_jsonb(o) -> f.key
+                    ) AS fields
+                FROM changed_rows AS n
+                JOIN previous_rows AS o ON o.id = n.id
+            ),
+            numbered AS (
+                SELECT
+                    organization_id,
+                    id,
+                    fields,
+                    (ROW_NUMBER() OVER (PARTITION BY organization_id ORDER BY id) - 1) / 500 AS chunk
+                FROM changed
+                WHERE cardinality(fields) > 0
+            ),
+            chunk_fields AS (
+                SELECT organization_id, chunk, json_agg(DISTINCT field) AS fields
+                FROM numbered, unnest(numbered.fields) AS field
+                GROUP BY organization_id, chunk
+            )
+            SELECT json_build_object(
+                'table', TG_TABLE_NAME,
+                'op', TG_OP,
+                'organization_id', numbered.organization_id,
+                'ids', json_agg(numbered.id ORDER BY numbered.id),
+                'fields', MIN(chunk_fields.fields::text)::json,
+                'origin', current_setting('techsync.origin', true)
+            )::text
+            FROM numbered
+            JOIN chunk_fields USING (organization_id, chunk)
+            GROUP BY numbered.organization_id, numbered.chunk
+        LOOP
+            PERFORM pg_notify('techsync_changes', message);
+        END LOOP;
+    ELSE
+        FOR message IN
+            WITH numbered AS (
+                SELECT
+                    (to_jsonb(r) ->> org_column)::BIGINT AS organization_id,
+                    r.id,
+                    (ROW_NUMBER() OVER (PARTITION BY to_jsonb(r) ->> org_column ORDER BY r.id) - 1) / 500 AS chunk
+                FROM changed_rows AS r
+            )
+            SELECT json_build_object(
+                'table', TG_TABLE_NAME,
+                'op', TG_OP,
+                'organization_id', organization_id,
+                'ids', json_agg(id ORDER BY id),
+                'fields', '[]'::json,
+                'origin', current_setting('techsync.origin', true)
+            )::text
+            FROM numbered
+            GROUP BY organization_id, chunk
+        LOOP
+            PERFORM pg_notify('techsync_changes', message);
+        END LOOP;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _triggers(table: str, org_column: str) -> str:
+    # Transition tables allow a single event per trigger, hence three.
+    return f"""
+        DROP TRIGGER IF EXISTS {table}_notify_insert ON {table};
+        CREATE TRIGGER {table}_notify_insert
+            AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS changed_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION techsync_notify_changes('{org_column}');
+        DROP TRIGGER IF EXISTS {table}_notify_update ON {table};
+        CREATE TRIGGER {table}_notify_update
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS previous_rows NEW TABLE AS changed_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION techsync_notify_changes('{org_column}');
+        DROP TRIGGER IF EXISTS {table}_notify_delete ON {table};
+        CREATE TRIGGER {table}_notify_delete
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS changed_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION techsync_notify_changes('{org_column}');
+    """
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION)
+    for table, org_column in NOTIFYING_TABLES.items():
+        op.execute(_triggers(table, org_column))
+
+
+def downgrade() -> None:
+    for table in NOTIFYING_TABLES:
+        op.execute(
+            f"""
+            DROP TRIGGER IF EXISTS {table}_notify_insert ON {table};
+            DROP TRIGGER IF EXISTS {table}_notify_update ON {table};
+            DROP TRIGGER IF EXISTS {table}_notify_delete ON {table};
+            """
+        )
+    op.execute("DROP FUNCTION IF EXISTS techsync_notify_changes();")
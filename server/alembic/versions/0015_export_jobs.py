@@ -0,0 +1,59 @@
+"""Durable queue table for background export jobs.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS export_jobs (
+            id BIGSERIAL PRIMARY KEY,
+            organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+            created_by BIGINT REFERENCES users(id) ON DELETE SET NULL,
+            kind TEXT NOT NULL CHECK (kind IN ('tenant', 'clients', 'properties', 'vendors')),
+            status TEXT NOT NULL DEFAULT 'queued'
+                CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+            file_name TEXT NOT NULL,
+            content_type TEXT NOT NULL,
+            storage_backend TEXT CHECK (storage_backend IN ('local', 's3')),
+            storage_key TEXT,
+            bytes_written BIGINT NOT NULL DEFAULT 0,
+            size_bytes BIGINT,
+            error TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            locked_by TEXT,
+            locked_at TIMESTAMP WITH TIME ZONE,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()) NOT NULL,
+            started_at TIMESTAMP WITH TIME ZONE,
+            finished_at TIMESTAMP WITH TIME ZONE
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_export_jobs_org ON export_jobs(organization_id, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_export_jobs_pending
+            ON export_jobs(created_at, id)
+            WHERE status IN ('queued', 'running');
+
+        ALTER TABLE export_jobs ENABLE ROW LEVEL SECURITY;
+
+        DROP POLICY IF EXISTS export_jobs_isolation ON export_jobs;
+        CREATE POLICY export_jobs_isolation ON export_jobs
+            USING (organization_id = techsync_current_org_id());
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS export_jobs;")
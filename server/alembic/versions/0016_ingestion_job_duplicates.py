@@ -0,0 +1,29 @@
+"""Record rows skipped as duplicates by background ingestion jobs.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_jobs
+            ADD COLUMN IF NOT EXISTS duplicate_rows JSONB NOT NULL DEFAULT '[]'::jsonb;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE ingestion_jobs DROP COLUMN IF EXISTS duplicate_rows;")
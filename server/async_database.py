@@ -0,0 +1,68 @@
+"""Asyncio Postgres helpers for repository reads made on the event loop.
+
+Mirrors the read helpers in ``database`` but runs on SQLAlchemy's asyncio
+engine over asyncpg, so ``async def`` dependencies and endpoints can await
+Postgres instead of blocking the loop. Writes stay on the synchronous helpers
+and the request unit of work.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from core.config import settings
+from database import DatabaseNotConfigured, _coerce_params, _validate_identifier, _where_clause
+
+# libpq connection options that asyncpg does not understand.
+_LIBPQ_ONLY_QUERY_KEYS = {"channel_binding", "options", "application_name", "connect_timeout"}
+
+
+def async_database_url(database_url: str) -> URL:
+    """Translate the libpq/psycopg2 DATABASE_URL into its asyncpg equivalent."""
+    url = make_url(database_url)
+    query = {key: value for key, value in url.query.items() if key not in _LIBPQ_ONLY_QUERY_KEYS}
+    sslmode = query.pop("sslmode", None)
+    if sslmode and "ssl" not in query:
+        query["ssl"] = sslmode
+    return url.set(drivername="postgresql+asyncpg", query=query)
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    if not settings.DATABASE_URL:
+        raise DatabaseNotConfigured("DATABASE_URL is not configured.")
+    return create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        pool_pre_ping=True,
+        pool_size=settings.ASYNC_DATABASE_POOL_SIZE,
+        max_overflow=settings.ASYNC_DATABASE_MAX_OVERFLOW,
+    )
+
+
+async def fetch_one(sql: str, params: dict[str, Any] | None = None) -> dict | None:
+    async with get_async_engine().connect() as conn:
+        result = await conn.execute(text(sql), _coerce_params(params or {}))
+        row = result.mappings().first()
+        return dict(row) if row else None
+
+
+async def fetch_all(sql: str, params: dict[str, Any] | None = None) -> list[dict]:
+    async with get_async_engine().connect() as conn:
+        result = await conn.execute(text(sql), _coerce_params(params or {}))
+        return [dict(row) for row in result.mappings().all()]
+
+
+async def fetch_scalar(sql: str, params: dict[str, Any] | None = None) -> Any:
+    async with get_async_engine().connect() as conn:
+        result = await conn.execute(text(sql), _coerce_params(params or {}))
+        return result.scalar()
+
+
+async def select_one(table: str, where: dict[str, Any]) -> dict | None:
+    _validate_identifier(table)
+    params: dict[str, Any] = {}
+    where_sql = _where_clause(where, params)
+    return await fetch_one(f"SELECT * FROM {table} WHERE {where_sql} LIMIT 1", params)
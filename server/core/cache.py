@@ -0,0 +1,202 @@
+"""Small in-process TTL caches plus the invalidation hooks that keep them honest."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Any, Callable, Hashable
+
+from logger import logger
+
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    name: str
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire ``ttl_seconds`` after being set.
+
+    Like the rate limiter this is scoped to one API process: every worker has
+    its own copy, so the TTL is the upper bound on how long another worker can
+    serve a value that was invalidated elsewhere.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] | None = None,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock or time.monotonic
+        self._lock = Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value or ``MISSING``; counts a hit or a miss."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def update(self, key: Hashable, apply: Callable[[Any], Any]) -> bool:
+        """Replace a live entry with ``apply(value)`` without extending its TTL
+        or touching the hit/miss counters. Returns False when nothing is cached."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                return False
+            self._entries[key] = (entry[0], apply(entry[1]))
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                name=self.name,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl_seconds,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapses concurrent loads of the same key into one: the first caller
+    runs ``load()`` and everyone who asks for that key meanwhile waits for and
+    shares its result (or exception). Nothing is remembered once the load
+    finishes -- pair it with a TTLCache for that."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = load()
+            return call.value
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+_caches: dict[str, TTLCache] = {}
+_subscribers: dict[str, list[Callable[..., None]]] = {}
+_registry_lock = Lock()
+
+
+def register_cache(cache: TTLCache) -> TTLCache:
+    with _registry_lock:
+        _caches[cache.name] = cache
+    return cache
+
+
+def registered_caches() -> list[TTLCache]:
+    with _registry_lock:
+        return list(_caches.values())
+
+
+def on_invalidate(topic: str, callback: Callable[..., None]) -> None:
+    """Subscribe ``callback(**keys)`` to invalidations published on ``topic``
+    (e.g. "user" with user_id/organization_id, "organization" with
+    organization_id, "technician" with organization_id/technician_id/fields)."""
+    with _registry_lock:
+        _subscribers.setdefault(topic, []).append(callback)
+
+
+def publish_invalidation(topic: str, **keys: Any) -> None:
+    with _registry_lock:
+        callbacks = list(_subscribers.get(topic, ()))
+    for callback in callbacks:
+        try:
+            callback(**keys)
+        except Exception:
+            logger.exception(
+                "cache.invalidation_failed",
+                extra={"event": "cache_invalidation_failed", "topic": topic},
+            )
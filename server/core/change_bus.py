@@ -0,0 +1,99 @@
+"""In-process bus for domain changes that live views follow (RF-25).
+
+Invalidation topics in ``core.cache`` tell caches to forget; the bus instead
+tells open streams (the dispatch board SSE endpoint) *what* changed so they
+can send deltas. Publishers are request and worker threads; subscribers are
+coroutines, so delivery hops onto the subscriber's event loop. Changes made
+by other processes are republished here by ``core.change_feed``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from threading import Lock
+
+from logger import logger
+
+
+@dataclass(frozen=True)
+class WorkOrdersChanged:
+    """Work orders of one org were created or changed (status, assignment or
+    any other field); consumers re-read the rows they care about."""
+
+    organization_id: int
+    work_order_ids: tuple[int, ...]
+
+
+class Subscription:
+    """One subscriber's bounded inbox. When it fills up, further changes are
+    dropped and ``overflowed`` is set: the subscriber has to resynchronise
+    from scratch rather than trust its deltas."""
+
+    def __init__(self, organization_id: int, max_pending: int):
+        self.organization_id = organization_id
+        self.overflowed = False
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[WorkOrdersChanged] = asyncio.Queue(max_pending)
+
+    def _deliver(self, change: WorkOrdersChanged) -> None:
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def next(self, timeout: float) -> list[WorkOrdersChanged]:
+        """Wait up to ``timeout`` seconds for a change, then return it with
+        everything else already pending ([] on timeout)."""
+        try:
+            changes = [await asyncio.wait_for(self._queue.get(), timeout=max(0.0, timeout))]
+        except asyncio.TimeoutError:
+            return []
+        while not self._queue.empty():
+            changes.append(self._queue.get_nowait())
+        return changes
+
+    def reset(self) -> None:
+        """Forget pending changes, e.g. after reloading full state."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.overflowed = False
+
+
+class ChangeBus:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._subscriptions: dict[int, set[Subscription]] = {}
+
+    def subscribe(self, organization_id: int, max_pending: int = 1000) -> Subscription:
+        """Must be called from the event loop that will consume the changes."""
+        subscription = Subscription(organization_id, max_pending)
+        with self._lock:
+            self._subscriptions.setdefault(organization_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.organization_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.organization_id]
+
+    def subscriber_count(self, organization_id: int) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(organization_id, ()))
+
+    def publish(self, change: WorkOrdersChanged) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(change.organization_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._deliver, change)
+            except RuntimeError:
+                # The subscriber's loop is gone (shutdown); it can't be waiting.
+                logger.warning("change_bus.closed_loop", extra={"event": "change_bus_closed_loop"})
+                self.unsubscribe(subscription)
+
+
+bus = ChangeBus()
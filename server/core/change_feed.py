@@ -0,0 +1,177 @@
+"""Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+``core.cache`` invalidations and ``core.change_bus`` events only reach the
+process that made the change. Statement-level triggers on the tables our
+caches are built from (migration 0014) NOTIFY ``CHANNEL`` with the table,
+operation, organization, row ids and -- for updates -- the columns that
+changed; Postgres delivers a notification only if its transaction commits.
+Every worker runs a ``ChangeFeedListener`` that turns each notification into
+a ``ChangeEvent`` and hands it to the handlers registered with ``on_change``.
+
+Each pooled connection tags its session with ``techsync.origin`` (see
+``database.get_engine``), so a worker skips the events for its own writes:
+the repositories already published those locally after commit. Writes made
+outside the API (psql, migrations) carry no origin and reach every worker.
+"""
+
+from __future__ import annotations
+
+import json
+import select
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from core.cache import publish_invalidation, registered_caches
+from core.change_bus import WorkOrdersChanged
+from core.change_bus import bus as change_bus
+from core.worker import process_identity
+from database import get_engine
+from logger import logger
+
+CHANNEL = "techsync_changes"
+# How long one poll blocks waiting for a notification; bounds stop() latency.
+LISTEN_WAIT_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """One trigger notification: up to 500 rows of one table and organization
+    touched by a single statement. ``fields`` is empty for inserts and deletes."""
+
+    table: str
+    operation: str
+    organization_id: int
+    ids: tuple[int, ...]
+    fields: tuple[str, ...] = ()
+    origin: Optional[str] = None
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "ChangeEvent":
+        message = json.loads(payload)
+        return cls(
+            table=message["table"],
+            operation=message["op"],
+            organization_id=int(message["organization_id"]),
+            ids=tuple(int(id) for id in message.get("ids") or ()),
+            fields=tuple(message.get("fields") or ()),
+            origin=message.get("origin") or None,
+        )
+
+
+_handlers: dict[str, list[Callable[[ChangeEvent], None]]] = {}
+_handlers_lock = threading.Lock()
+
+
+def on_change(table: str, handler: Callable[[ChangeEvent], None]) -> None:
+    """Call ``handler(event)`` for every change to ``table`` made by another process."""
+    with _handlers_lock:
+        _handlers.setdefault(table, []).append(handler)
+
+
+def dispatch(payload: str) -> None:
+    try:
+        event = ChangeEvent.from_payload(payload)
+    except (ValueError, KeyError, TypeError):
+        logger.warning("change_feed.bad_payload", extra={"event": "change_feed_bad_payload"})
+        return
+    if event.origin == process_identity():
+        return
+    with _handlers_lock:
+        handlers = list(_handlers.get(event.table, ()))
+    for handler in handlers:
+        try:
+            handler(event)
+        except Exception:
+            logger.exception(
+                "change_feed.handler_failed",
+                extra={"event": "change_feed_handler_failed", "table": event.table},
+            )
+
+
+# The feed replays the same invalidation topics the repositories publish
+# locally, so cache owners subscribe once through ``core.cache.on_invalidate``.
+
+
+def _technicians_changed(event: ChangeEvent) -> None:
+    for technician_id in event.ids:
+        publish_invalidation(
+            "technician", organization_id=event.organization_id, technician_id=technician_id, fields=event.fields
+        )
+
+
+def _users_changed(event: ChangeEvent) -> None:
+    for user_id in event.ids:
+        publish_invalidation("user", user_id=user_id, organization_id=event.organization_id)
+
+
+def _organizations_changed(event: ChangeEvent) -> None:
+    publish_invalidation("organization", organization_id=event.organization_id)
+
+
+def _priority_rules_changed(event: ChangeEvent) -> None:
+    publish_invalidation("priority_rules", organization_id=event.organization_id)
+
+
+def _work_orders_changed(event: ChangeEvent) -> None:
+    change_bus.publish(WorkOrdersChanged(event.organization_id, event.ids))
+    publish_invalidation("work_order", organization_id=event.organization_id, work_order_ids=event.ids)
+
+
+on_change("technicians", _technicians_changed)
+on_change("users", _users_changed)
+on_change("organizations", _organizations_changed)
+on_change("org_priority_rules", _priority_rules_changed)
+on_change("work_orders", _work_orders_changed)
+
+
+class ChangeFeedListener:
+    """``poll`` for a ``PollingWorker``: LISTENs on a dedicated connection and
+    dispatches whatever arrives within ``LISTEN_WAIT_SECONDS``.
+
+    Returns True while the connection is healthy so the worker keeps listening
+    without sleeping; a failure drops the connection and falls back to the
+    worker interval as the reconnect backoff. Every (re)connect clears the
+    registered caches, since notifications sent while disconnected are lost.
+    """
+
+    def __init__(self, channel: str = CHANNEL, wait_seconds: float = LISTEN_WAIT_SECONDS):
+        self.channel = channel
+        self.wait_seconds = wait_seconds
+        self._connection: Any = None
+
+    def _connect(self):
+        raw = get_engine().raw_connection()
+        # Keep the LISTENing session out of the pool.
+        raw.detach()
+        connection = raw.driver_connection
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        for cache in registered_caches():
+            cache.clear()
+        logger.info("change_feed.listening", extra={"event": "change_feed_listening", "channel": self.channel})
+        return connection
+
+    def poll(self) -> bool:
+        if self._connection is None:
+            self._connection = self._connect()
+        connection = self._connection
+        try:
+            readable, _, _ = select.select([connection], [], [], self.wait_seconds)
+            if readable:
+                connection.poll()
+        except Exception:
+            self.close()
+            raise
+        while connection.notifies:
+            dispatch(connection.notifies.pop(0).payload)
+        return True
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
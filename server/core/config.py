@@ -3,6 +3,7 @@ Centralized environment configuration for the TechSync Ops API.
 """
 
 import os
+import tempfile
 from urllib.parse import urlparse
 
 
@@ -43,6 +44,8 @@ class Settings:
     IS_HOSTED: bool = IS_HOSTED
 
     DATABASE_URL: str | None = os.getenv("DATABASE_URL")
+    ASYNC_DATABASE_POOL_SIZE: int = int(os.getenv("ASYNC_DATABASE_POOL_SIZE", "10"))
+    ASYNC_DATABASE_MAX_OVERFLOW: int = int(os.getenv("ASYNC_DATABASE_MAX_OVERFLOW", "20"))
     STORAGE_BUCKET: str | None = os.getenv("STORAGE_BUCKET")
     STORAGE_REGION: str = os.getenv("STORAGE_REGION", "auto")
     STORAGE_ENDPOINT_URL: str | None = os.getenv("STORAGE_ENDPOINT_URL")
@@ -80,6 +83,63 @@ class Settings:
     SMTP_PASSWORD: str | None = os.getenv("SMTP_PASSWORD")
     SMTP_USE_TLS: bool = _bool_env("SMTP_USE_TLS", True)
 
+    PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "10"))
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+
+    WORKLOAD_CACHE_TTL_SECONDS: float = float(os.getenv("WORKLOAD_CACHE_TTL_SECONDS", "30"))
+    WORKLOAD_CACHE_MAX_ORGS: int = int(os.getenv("WORKLOAD_CACHE_MAX_ORGS", "1000"))
+
+    DASHBOARD_METRICS_CACHE_TTL_SECONDS: float = float(os.getenv("DASHBOARD_METRICS_CACHE_TTL_SECONDS", "5"))
+    DASHBOARD_METRICS_CACHE_MAX_ORGS: int = int(os.getenv("DASHBOARD_METRICS_CACHE_MAX_ORGS", "1000"))
+
+    DISPATCH_BOARD_STREAM_RESYNC_SECONDS: float = float(os.getenv("DISPATCH_BOARD_STREAM_RESYNC_SECONDS", "300"))
+    DISPATCH_BOARD_STREAM_MAX_PENDING: int = int(os.getenv("DISPATCH_BOARD_STREAM_MAX_PENDING", "1000"))
+
+    ROSTER_CACHE_TTL_SECONDS: float = float(os.getenv("ROSTER_CACHE_TTL_SECONDS", "60"))
+    ROSTER_CACHE_MAX_ORGS: int = int(os.getenv("ROSTER_CACHE_MAX_ORGS", "1000"))
+    TECHNICIAN_INDEX_CACHE_TTL_SECONDS: float = float(os.getenv("TECHNICIAN_INDEX_CACHE_TTL_SECONDS", "300"))
+    TECHNICIAN_INDEX_CACHE_MAX_ORGS: int = int(os.getenv("TECHNICIAN_INDEX_CACHE_MAX_ORGS", "1000"))
+    MATCHING_CANDIDATE_COUNT: int = int(os.getenv("MATCHING_CANDIDATE_COUNT", "25"))
+    MATCHING_CANDIDATE_RADIUS_KM: float = float(os.getenv("MATCHING_CANDIDATE_RADIUS_KM", "60"))
+
+    PRIORITY_RULE_CACHE_TTL_SECONDS: float = float(os.getenv("PRIORITY_RULE_CACHE_TTL_SECONDS", "300"))
+    PRIORITY_RULE_CACHE_MAX_ORGS: int = int(os.getenv("PRIORITY_RULE_CACHE_MAX_ORGS", "1000"))
+    CHANGE_FEED_LISTENER_ENABLED: bool = _bool_env("CHANGE_FEED_LISTENER_ENABLED", True)
+    CHANGE_FEED_RECONNECT_SECONDS: float = float(os.getenv("CHANGE_FEED_RECONNECT_SECONDS", "5"))
+
+    AUDIT_WRITE_MODE: str = os.getenv("AUDIT_WRITE_MODE", "sync").strip().lower()
+    AUDIT_QUEUE_MAX_EVENTS: int = int(os.getenv("AUDIT_QUEUE_MAX_EVENTS", "10000"))
+    AUDIT_QUEUE_PUT_TIMEOUT_SECONDS: float = float(os.getenv("AUDIT_QUEUE_PUT_TIMEOUT_SECONDS", "1"))
+    AUDIT_DRAIN_BATCH_SIZE: int = int(os.getenv("AUDIT_DRAIN_BATCH_SIZE", "1000"))
+    AUDIT_DRAIN_POLL_SECONDS: float = float(os.getenv("AUDIT_DRAIN_POLL_SECONDS", "0.5"))
+    AUDIT_DRAIN_MAX_ATTEMPTS: int = int(os.getenv("AUDIT_DRAIN_MAX_ATTEMPTS", "3"))
+
+    OPERATIONS_REPORT_MAX_WORKERS: int = int(os.getenv("OPERATIONS_REPORT_MAX_WORKERS", "5"))
+    OPERATIONS_REPORT_SECTION_TIMEOUT_SECONDS: float = float(os.getenv("OPERATIONS_REPORT_SECTION_TIMEOUT_SECONDS", "10"))
+    DASHBOARD_ROLLUP_WORKER_ENABLED: bool = _bool_env("DASHBOARD_ROLLUP_WORKER_ENABLED", True)
+    DASHBOARD_ROLLUP_REFRESH_SECONDS: float = float(os.getenv("DASHBOARD_ROLLUP_REFRESH_SECONDS", "30"))
+    DASHBOARD_ROLLUP_BATCH_DAYS: int = int(os.getenv("DASHBOARD_ROLLUP_BATCH_DAYS", "200"))
+    DASHBOARD_ROLLUP_INLINE_REFRESH_DAYS: int = int(os.getenv("DASHBOARD_ROLLUP_INLINE_REFRESH_DAYS", "31"))
+
+    INGESTION_BATCH_SIZE: int = int(os.getenv("INGESTION_BATCH_SIZE", "500"))
+    INGESTION_CSV_MAX_ROWS: int = int(os.getenv("INGESTION_CSV_MAX_ROWS", "50000"))
+    INGESTION_WEBHOOK_BATCH_MAX: int = int(os.getenv("INGESTION_WEBHOOK_BATCH_MAX", "500"))
+    INGESTION_WORKER_ENABLED: bool = _bool_env("INGESTION_WORKER_ENABLED", True)
+    INGESTION_WORKER_POLL_SECONDS: float = float(os.getenv("INGESTION_WORKER_POLL_SECONDS", "2"))
+    INGESTION_JOB_LEASE_SECONDS: int = int(os.getenv("INGESTION_JOB_LEASE_SECONDS", "300"))
+    INGESTION_JOB_MAX_ATTEMPTS: int = int(os.getenv("INGESTION_JOB_MAX_ATTEMPTS", "3"))
+
+    EXPORT_WORKER_ENABLED: bool = _bool_env("EXPORT_WORKER_ENABLED", True)
+    EXPORT_WORKER_POLL_SECONDS: float = float(os.getenv("EXPORT_WORKER_POLL_SECONDS", "2"))
+    EXPORT_JOB_LEASE_SECONDS: int = int(os.getenv("EXPORT_JOB_LEASE_SECONDS", "300"))
+    EXPORT_JOB_MAX_ATTEMPTS: int = int(os.getenv("EXPORT_JOB_MAX_ATTEMPTS", "3"))
+    EXPORT_JOB_MAX_RUNNING_PER_ORG: int = int(os.getenv("EXPORT_JOB_MAX_RUNNING_PER_ORG", "1"))
+    EXPORT_JOB_MAX_PENDING_PER_ORG: int = int(os.getenv("EXPORT_JOB_MAX_PENDING_PER_ORG", "5"))
+    EXPORT_STORAGE_BACKEND: str = os.getenv("EXPORT_STORAGE_BACKEND", "local").strip().lower()
+    EXPORT_LOCAL_DIR: str = os.getenv("EXPORT_LOCAL_DIR", os.path.join(tempfile.gettempdir(), "techsync-exports"))
+    EXPORT_PART_BYTES: int = int(os.getenv("EXPORT_PART_BYTES", str(8 * 1024 * 1024)))
+    EXPORT_DOWNLOAD_URL_SECONDS: int = int(os.getenv("EXPORT_DOWNLOAD_URL_SECONDS", "900"))
+
     RATE_LIMIT_ENABLED: bool = _bool_env("RATE_LIMIT_ENABLED", True)
     RATE_LIMIT_TRUST_PROXY_HEADERS: bool = _bool_env("RATE_LIMIT_TRUST_PROXY_HEADERS", False)
     RATE_LIMIT_LOGIN_MAX: int = int(os.getenv("RATE_LIMIT_LOGIN_MAX", "5"))
@@ -105,6 +165,10 @@ def _validate_public_https_url(name: str, url: str | None) -> None:
 def _validate_settings(value: Settings) -> None:
     if value.EMAIL_DELIVERY_METHOD not in {"log", "smtp"}:
         raise ValueError("EMAIL_DELIVERY_METHOD must be either 'log' or 'smtp'")
+    if value.AUDIT_WRITE_MODE not in {"sync", "async"}:
+        raise ValueError("AUDIT_WRITE_MODE must be either 'sync' or 'async'")
+    if value.EXPORT_STORAGE_BACKEND not in {"local", "s3"}:
+        raise ValueError("EXPORT_STORAGE_BACKEND must be either 'local' or 's3'")
 
     if not value.IS_HOSTED:
         return
@@ -0,0 +1,86 @@
+"""Background polling threads for queue-style work (ingestion jobs, etc.).
+
+Each API process can run its own pollers; the queues they drain are claimed
+in the database, so running several processes only adds throughput.
+Serverless deployments that cannot keep a thread alive turn the pollers off
+and run ``python -m <module>`` entrypoints instead.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+from typing import Callable
+
+from logger import logger
+
+
+def process_identity() -> str:
+    """Host and process id; tags this process's database sessions."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def worker_identity(name: str) -> str:
+    """Stable id for leases/locks: host, process and poller name."""
+    return f"{process_identity()}:{name}"
+
+
+class PollingWorker:
+    """Daemon thread that calls ``poll()`` until stopped.
+
+    ``poll`` returns True when it did some work, in which case it is called
+    again immediately; otherwise the thread sleeps ``interval_seconds``.
+    Exceptions are logged and treated like an empty poll so one bad job (or
+    a database blip) cannot kill the thread. ``close`` runs on the worker
+    thread once it stops, e.g. to release a dedicated connection.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        poll: Callable[[], bool],
+        interval_seconds: float,
+        close: Callable[[], None] | None = None,
+    ):
+        self.name = name
+        self._poll = poll
+        self._close = close
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name=f"techsync-{self.name}", daemon=True)
+        self._thread.start()
+        logger.info("worker.started", extra={"event": "worker_started", "worker": self.name})
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("worker.stopped", extra={"event": "worker_stopped", "worker": self.name})
+
+    def run_once(self) -> bool:
+        try:
+            return bool(self._poll())
+        except Exception:
+            logger.exception("worker.poll_failed", extra={"event": "worker_poll_failed", "worker": self.name})
+            return False
+
+    def run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if not self.run_once():
+                    self._stop.wait(self.interval_seconds)
+        finally:
+            if self._close is not None:
+                self._close()
@@ -1,17 +1,31 @@
-"""Direct Postgres helpers for TechSync repositories."""
+"""Direct Postgres helpers for TechSync repositories.
+
+Outside a unit of work every helper checks out its own pooled connection
+(and writes commit immediately). Inside ``unit_of_work()`` -- which the API
+opens once per request -- all helpers share one connection and one
+transaction that is committed once at the end.
+"""
 
 import json
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import lru_cache
-from typing import Any
+from typing import Any, Callable, Iterator
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine, RowMapping
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine, RowMapping
 
 from core.config import settings
+from core.worker import process_identity
+from logger import logger
 
 _IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 JSONB_COLUMNS = {"settings"}
+# Upper bound on rows per multi-row INSERT statement in insert_rows().
+MAX_ROWS_PER_INSERT = 1000
+# Rows fetched per round trip by fetch_iter()'s server-side cursor.
+FETCH_ITER_BATCH_SIZE = 2000
 
 
 class DatabaseNotConfigured(Exception):
@@ -22,7 +36,190 @@ class DatabaseNotConfigured(Exception):
 def get_engine() -> Engine:
     if not settings.DATABASE_URL:
         raise DatabaseNotConfigured("DATABASE_URL is not configured.")
-    return create_engine(settings.DATABASE_URL, pool_pre_ping=True, future=True)
+    engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, future=True)
+    event.listen(engine, "connect", _tag_session_origin)
+    return engine
+
+
+def _tag_session_origin(dbapi_connection, _connection_record) -> None:
+    """Record which process owns the session, so the change feed can skip
+    notifications for this process's own writes (see ``core.change_feed``)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SELECT set_config('techsync.origin', %s, false)", (process_identity(),))
+    finally:
+        cursor.close()
+    dbapi_connection.commit()
+
+
+class UnitOfWork:
+    """One pooled connection and one transaction shared by every repository
+    helper while the unit is bound. The connection is checked out lazily, so
+    requests that never touch the database never hit the pool.
+
+    Not safe for concurrent use from several threads; code that fans work out
+    to threads should use its own connections."""
+
+    def __init__(self) -> None:
+        self._connection: Connection | None = None
+        self._buffers: dict[str, tuple[list, Callable[[list], None]]] = {}
+        self._after_commit: list[Callable[[], None]] = []
+        # Scratch space for in-process state that is only published once the
+        # transaction commits (see workload_service.record_changes).
+        self.state: dict[str, Any] = {}
+        self.closed = False
+
+    @property
+    def connection(self) -> Connection:
+        if self.closed:
+            raise RuntimeError("Unit of work is already closed")
+        if self._connection is None:
+            self._connection = get_engine().connect()
+        return self._connection
+
+    def buffer(self, name: str, flush: Callable[[list], None]) -> list:
+        """Per-unit list for write-behind rows; ``flush(rows)`` runs with
+        whatever is left in it just before the transaction commits."""
+        if name not in self._buffers:
+            self._buffers[name] = ([], flush)
+        return self._buffers[name][0]
+
+    def add_after_commit(self, callback: Callable[[], None]) -> None:
+        self._after_commit.append(callback)
+
+    def commit(self) -> None:
+        buffers, self._buffers, self.state = self._buffers, {}, {}
+        try:
+            for rows, flush in buffers.values():
+                if rows:
+                    flush(rows)
+            if self._connection is not None and self._connection.in_transaction():
+                self._connection.commit()
+        except BaseException:
+            self.rollback()
+            raise
+        # The transaction is already durable: a failing callback (say, a cache
+        # invalidation) is logged and must neither skip the rest nor fail the
+        # request that made the write.
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception(
+                    "database.after_commit_failed",
+                    extra={
+                        "event": "database_after_commit_failed",
+                        "callback": getattr(callback, "__qualname__", repr(callback)),
+                    },
+                )
+
+    def rollback(self) -> None:
+        self._buffers, self.state = {}, {}
+        self._after_commit = []
+        if self._connection is not None and self._connection.in_transaction():
+            self._connection.rollback()
+
+    def close(self) -> None:
+        self.closed = True
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+_current_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar("techsync_unit_of_work", default=None)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    unit = _current_unit_of_work.get()
+    if unit is None or unit.closed:
+        return None
+    return unit
+
+
+def bind_unit_of_work(unit: UnitOfWork) -> None:
+    """Make ``unit`` the active unit of work for the current context. Closing
+    the unit unbinds it, so no reset token has to be carried around."""
+    _current_unit_of_work.set(unit)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """Run the enclosed repository calls on one connection and commit once.
+    Joins the active unit of work instead of nesting when one is bound."""
+    existing = current_unit_of_work()
+    if existing is not None:
+        yield existing
+        return
+
+    unit = UnitOfWork()
+    token = _current_unit_of_work.set(unit)
+    try:
+        yield unit
+        unit.commit()
+    except BaseException:
+        unit.rollback()
+        raise
+    finally:
+        unit.close()
+        _current_unit_of_work.reset(token)
+
+
+@contextmanager
+def outside_unit_of_work() -> Iterator[None]:
+    """Run the enclosed helpers on their own pooled connections even while a
+    unit of work is bound -- for writes that must not join (or outlive) the
+    request's transaction, and for work fanned out to other threads."""
+    token = _current_unit_of_work.set(None)
+    try:
+        yield
+    finally:
+        _current_unit_of_work.reset(token)
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the active unit of work commits (dropped on
+    rollback), or immediately when there is none -- e.g. cache invalidation
+    that must not race ahead of the write it reflects."""
+    unit = current_unit_of_work()
+    if unit is None:
+        callback()
+    else:
+        unit.add_after_commit(callback)
+
+
+@contextmanager
+def savepoint() -> Iterator[None]:
+    """Let a statement fail inside a unit of work without aborting the whole
+    transaction (Postgres refuses further statements after an error). A no-op
+    outside a unit of work, where every write is its own transaction."""
+    unit = current_unit_of_work()
+    if unit is None:
+        yield
+        return
+    with unit.connection.begin_nested():
+        yield
+
+
+def set_statement_timeout(seconds: float) -> None:
+    """Make Postgres cancel any statement in the active unit of work that runs
+    longer than ``seconds``. Transaction-local, so it ends with the unit and
+    never leaks to the next borrower of the pooled connection."""
+    execute(
+        "SELECT set_config('statement_timeout', :timeout, true)",
+        {"timeout": f"{max(1, int(seconds * 1000))}ms"},
+    )
+
+
+@contextmanager
+def _connect(write: bool = False) -> Iterator[Connection]:
+    unit = current_unit_of_work()
+    if unit is not None:
+        yield unit.connection
+        return
+    engine = get_engine()
+    with (engine.begin() if write else engine.connect()) as conn:
+        yield conn
 
 
 def row_to_dict(row: RowMapping | None) -> dict | None:
@@ -32,24 +229,42 @@ def row_to_dict(row: RowMapping | None) -> dict | None:
 
 
 def fetch_one(sql: str, params: dict[str, Any] | None = None) -> dict | None:
-    with get_engine().connect() as conn:
+    with _connect() as conn:
         row = conn.execute(text(sql), _coerce_params(params or {})).mappings().first()
         return row_to_dict(row)
 
 
 def fetch_all(sql: str, params: dict[str, Any] | None = None) -> list[dict]:
-    with get_engine().connect() as conn:
+    with _connect() as conn:
         rows = conn.execute(text(sql), _coerce_params(params or {})).mappings().all()
         return [dict(row) for row in rows]
 
 
-def fetch_scalar(sql: str, params: dict[str, Any] | None = None) -> Any:
+def fetch_iter(
+    sql: str, params: dict[str, Any] | None = None, batch_size: int = FETCH_ITER_BATCH_SIZE
+) -> Iterator[dict]:
+    """Yield rows one at a time from a named (server-side) cursor that pulls
+    ``batch_size`` rows per round trip, so memory stays flat however many
+    rows match. Nothing runs until the first ``next()``.
+
+    Always reads on its own pooled connection, held until the iterator is
+    exhausted or closed: streamed responses are consumed after the request's
+    unit of work has already committed and closed."""
     with get_engine().connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+            text(sql), _coerce_params(params or {})
+        )
+        for row in result.mappings():
+            yield dict(row)
+
+
+def fetch_scalar(sql: str, params: dict[str, Any] | None = None) -> Any:
+    with _connect() as conn:
         return conn.execute(text(sql), _coerce_params(params or {})).scalar()
 
 
 def execute(sql: str, params: dict[str, Any] | None = None) -> None:
-    with get_engine().begin() as conn:
+    with _connect(write=True) as conn:
         conn.execute(text(sql), _coerce_params(params or {}))
 
 
@@ -65,6 +280,54 @@ def insert_row(table: str, payload: dict[str, Any]) -> dict:
     return fetch_one_in_transaction(sql, payload)
 
 
+def insert_rows(
+    table: str,
+    payloads: list[dict[str, Any]],
+    returning: bool = True,
+    on_conflict: str | None = None,
+) -> list[dict]:
+    """Multi-row INSERT for bulk paths. Every payload must have the same keys
+    as the first one. Large batches are split into statements of at most
+    MAX_ROWS_PER_INSERT rows on one connection; RETURNING rows come back in
+    payload order. ``on_conflict`` is a trusted, caller-written
+    ``ON CONFLICT ...`` clause; rows it skips are not returned."""
+    if not payloads:
+        return []
+    _validate_identifier(table)
+    columns = list(payloads[0].keys())
+    for column in columns:
+        _validate_identifier(column)
+
+    column_sql = ", ".join(columns)
+    inserted: list[dict] = []
+    with _connect(write=True) as conn:
+        for start in range(0, len(payloads), MAX_ROWS_PER_INSERT):
+            params: dict[str, Any] = {}
+            values_sql = []
+            for index, payload in enumerate(payloads[start : start + MAX_ROWS_PER_INSERT]):
+                placeholders = []
+                for column in columns:
+                    param_name = f"{column}_{index}"
+                    value = payload[column]
+                    if column in JSONB_COLUMNS:
+                        params[param_name] = json.dumps(value or {})
+                        placeholders.append(f"CAST(:{param_name} AS jsonb)")
+                    else:
+                        params[param_name] = value
+                        placeholders.append(f":{param_name}")
+                values_sql.append(f"({', '.join(placeholders)})")
+
+            sql = f"INSERT INTO {table} ({column_sql}) VALUES {', '.join(values_sql)}"
+            if on_conflict:
+                sql += f" {on_conflict}"
+            if returning:
+                rows = conn.execute(text(sql + " RETURNING *"), params).mappings().all()
+                inserted.extend(dict(row) for row in rows)
+            else:
+                conn.execute(text(sql), params)
+    return inserted
+
+
 def update_row(table: str, patch: dict[str, Any], where: dict[str, Any]) -> dict | None:
     _validate_identifier(table)
     if not patch:
@@ -89,7 +352,7 @@ def delete_rows(table: str, where: dict[str, Any]) -> list[dict]:
     params: dict[str, Any] = {}
     where_sql = _where_clause(where, params)
     sql = f"DELETE FROM {table} WHERE {where_sql} RETURNING *"
-    with get_engine().begin() as conn:
+    with _connect(write=True) as conn:
         rows = conn.execute(text(sql), _coerce_params(params)).mappings().all()
         return [dict(row) for row in rows]
 
@@ -103,11 +366,18 @@ def select_one(table: str, where: dict[str, Any]) -> dict | None:
 
 
 def fetch_one_in_transaction(sql: str, params: dict[str, Any]) -> dict:
-    with get_engine().begin() as conn:
+    with _connect(write=True) as conn:
         row = conn.execute(text(sql), _coerce_params(params)).mappings().first()
         return dict(row) if row else None
 
 
+def fetch_all_in_transaction(sql: str, params: dict[str, Any]) -> list[dict]:
+    """fetch_all for writes that return rows (UPDATE/INSERT ... RETURNING)."""
+    with _connect(write=True) as conn:
+        rows = conn.execute(text(sql), _coerce_params(params)).mappings().all()
+        return [dict(row) for row in rows]
+
+
 def _where_clause(where: dict[str, Any], params: dict[str, Any]) -> str:
     parts = []
     for column, value in where.items():
@@ -3,16 +3,81 @@ FastAPI dependencies for authentication, tenant scoping, and role checks
 (RF-02, RF-05).
 """
 
+import asyncio
+from typing import AsyncIterator
+
 from fastapi import Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from core.cache import MISSING, TTLCache, on_invalidate, register_cache
+from core.config import settings
 from core.security import decode_token
+from database import UnitOfWork, bind_unit_of_work
 from models.user import User
 from repositories import organizations as organizations_repo
 from repositories import users as users_repo
 
 security = HTTPBearer()
 
+# (user_id, organization_id) -> (user row, organization row). Saves the two
+# primary-key lookups every authenticated request would otherwise make.
+principal_cache = register_cache(
+    TTLCache(
+        "principals",
+        max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    )
+)
+
+
+def _invalidate_user(user_id: int, organization_id: int, **_: object) -> None:
+    principal_cache.invalidate((user_id, organization_id))
+
+
+def _invalidate_organization(organization_id: int, **_: object) -> None:
+    principal_cache.invalidate_where(lambda key: key[1] == organization_id)
+
+
+on_invalidate("user", _invalidate_user)
+on_invalidate("organization", _invalidate_organization)
+
+
+async def _load_principal(user_id: int, organization_id: int) -> tuple[dict | None, dict | None]:
+    key = (user_id, organization_id)
+    cached = principal_cache.get(key)
+    if cached is not MISSING:
+        return cached
+
+    user_row, organization = await asyncio.gather(
+        users_repo.get_by_id_in_org_async(user_id, organization_id),
+        organizations_repo.get_by_id_async(organization_id),
+    )
+    if user_row is not None:
+        principal_cache.set(key, (user_row, organization))
+    return user_row, organization
+
+
+async def database_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Request-scoped unit of work: every repository call made while handling
+    the request shares one pooled connection, and writes commit once when the
+    endpoint succeeds (or roll back together when it raises).
+
+    Kept async so the binding is made in the request task itself; sync
+    endpoints and dependencies run in the threadpool with a copy of that
+    context and therefore see the same unit."""
+    unit = UnitOfWork()
+    bind_unit_of_work(unit)
+    try:
+        yield unit
+    except BaseException:
+        await run_in_threadpool(unit.rollback)
+        raise
+    else:
+        await run_in_threadpool(unit.commit)
+    finally:
+        unit.close()
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -26,7 +91,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_row = users_repo.get_by_id_in_org(payload["user_id"], payload["organization_id"])
+    user_row, _organization = await _load_principal(payload["user_id"], payload["organization_id"])
     if user_row is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
@@ -45,17 +110,22 @@ async def get_current_user(
 
 async def get_current_organization(current_user: User = Depends(get_current_user)) -> dict:
     """Loads the caller's organization row and rejects requests against a
-    soft-deleted tenant (RNF-13)."""
-    organization = organizations_repo.get_by_id(current_user.organization_id)
+    soft-deleted tenant (RNF-13). Normally answered from the principal cache
+    filled by get_current_user."""
+    cached = principal_cache.get((current_user.id, current_user.organization_id))
+    if cached is not MISSING:
+        organization = cached[1]
+    else:
+        organization = await organizations_repo.get_by_id_async(current_user.organization_id)
     if organization is None or organization.get("deleted_at"):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
-    return organization
+    return dict(organization)
 
 
 async def get_organization_from_api_key(x_api_key: str = Header(...)) -> dict:
     """RF-11: authenticate external webhook callers by per-org API key, not a
     user JWT -- the caller is an external system, not a logged-in user."""
-    organization = organizations_repo.get_by_api_key(x_api_key)
+    organization = await organizations_repo.get_by_api_key_async(x_api_key)
     if organization is None or organization.get("deleted_at"):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
     return organization
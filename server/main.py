@@ -5,12 +5,18 @@ Business logic lives in services/, data access in repositories/, request/respons
 shapes in models/, and HTTP wiring in routers/ (RNF-09: modular structure).
 """
 
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from core.cache import registered_caches
+from core.change_feed import ChangeFeedListener
 from core.config import settings
+from core.worker import PollingWorker
 from database import DatabaseNotConfigured
+from dependencies import database_unit_of_work
 from logger import logger
 from routers import (
     auth,
@@ -26,12 +32,60 @@ from routers import (
     vendors,
     work_orders,
 )
+from repositories import work_order_events as events_repo
+from services import dashboard_rollup_service, export_job_service, ingestion_service
 from services.attachment_storage_service import StorageNotConfigured
 
+
+def background_workers() -> list[PollingWorker]:
+    """Queue pollers this process should run; none without a database."""
+    workers: list[PollingWorker] = []
+    if not settings.DATABASE_URL:
+        return workers
+    if settings.CHANGE_FEED_LISTENER_ENABLED:
+        listener = ChangeFeedListener()
+        workers.append(
+            PollingWorker("change-feed", listener.poll, settings.CHANGE_FEED_RECONNECT_SECONDS, close=listener.close)
+        )
+    if settings.AUDIT_WRITE_MODE == "async":
+        workers.append(
+            PollingWorker("audit-writer", events_repo.drain, settings.AUDIT_DRAIN_POLL_SECONDS, close=events_repo.drain_all)
+        )
+    if settings.DASHBOARD_ROLLUP_WORKER_ENABLED:
+        workers.append(
+            PollingWorker(
+                "dashboard-rollups", dashboard_rollup_service.refresh_dirty_days, settings.DASHBOARD_ROLLUP_REFRESH_SECONDS
+            )
+        )
+    if settings.INGESTION_WORKER_ENABLED:
+        workers.append(
+            PollingWorker("ingestion", ingestion_service.run_next_job, settings.INGESTION_WORKER_POLL_SECONDS)
+        )
+    if settings.EXPORT_WORKER_ENABLED:
+        workers.append(PollingWorker("exports", export_job_service.run_next_job, settings.EXPORT_WORKER_POLL_SECONDS))
+    return workers
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    workers = background_workers()
+    for worker in workers:
+        worker.start()
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.stop(timeout=10)
+
+
 app = FastAPI(
     title="TechSync Ops API",
     version="1.2.0",
     description="Multi-tenant maintenance operations backend for PMCs and field-service teams.",
+    # Function scope commits before the response is sent, so a client never
+    # sees a 2xx for a write that later failed to commit.
+    dependencies=[Depends(database_unit_of_work, scope="function")],
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -57,6 +111,13 @@ def health_check():
     return {"status": "ok", "service": "techsync-ops-api"}
 
 
+@app.get("/health/caches")
+def cache_stats():
+    """Per-process hit/miss counters for the in-memory caches, for tuning TTLs
+    and sizes. Counters reset when the worker restarts."""
+    return {"caches": [cache.stats() for cache in registered_caches()]}
+
+
 @app.get("/")
 def root_check():
     return {
@@ -1,7 +1,7 @@
 """Pydantic schemas for admin dashboard metrics and operations reporting (RF-25)."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 
@@ -73,12 +73,21 @@ class CostSummaryMetric(BaseModel):
     latest_work_order_at: Optional[datetime] = None
 
 
+class UnavailableReportSection(BaseModel):
+    section: str
+    reason: Literal["timeout", "error"]
+
+
 class OperationsReport(BaseModel):
+    freshness: datetime
     stale_work_orders: list[StaleWorkOrderMetric]
     overloaded_technicians: list[OverloadedTechnicianMetric]
     property_hotspots: list[PropertyHotspotMetric]
     completion_cycles: list[CompletionCycleMetric]
     cost_summary: list[CostSummaryMetric]
+    # Sections listed here came back empty because they failed or ran past
+    # their time budget; the rest of the report is still accurate.
+    unavailable_sections: list[UnavailableReportSection] = []
 
 
 class DispatchBoardWorkOrder(BaseModel):
@@ -124,3 +133,25 @@ class DispatchBoard(BaseModel):
     summary: DispatchBoardSummary
     unassigned_work_orders: list[DispatchBoardWorkOrder]
     technician_lanes: list[DispatchBoardTechnicianLane]
+
+
+class DispatchBoardCardDelta(BaseModel):
+    """A card moved, changed or left the board. The client drops the card
+    wherever it was and, unless ``work_order`` is null, puts the new version
+    in the lane of ``technician_id`` (null: the unassigned column)."""
+
+    work_order_id: int
+    technician_id: Optional[int] = None
+    work_order: Optional[DispatchBoardWorkOrder] = None
+
+
+class DispatchBoardLaneDelta(BaseModel):
+    """Lane header after a change; its cards arrive as card deltas."""
+
+    technician_id: int
+    full_name: str
+    email: str
+    availability_status: str
+    max_daily_jobs: int
+    active_work_order_count: int
+    utilization_percent: float
@@ -0,0 +1,33 @@
+"""Pydantic schemas for background export jobs (RNF-13)."""
+
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+ExportJobKind = Literal["tenant", "clients", "properties", "vendors"]
+ExportJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class ExportJobCreate(BaseModel):
+    kind: ExportJobKind = "tenant"
+
+
+class ExportJob(BaseModel):
+    """Progress of a background export (GET /organizations/me/exports/{id}).
+    ``download_url`` is set once the artifact is complete; it accepts HTTP
+    Range requests, so an interrupted download can resume."""
+
+    id: int
+    kind: ExportJobKind
+    status: ExportJobStatus
+    file_name: str
+    content_type: str
+    bytes_written: int
+    size_bytes: Optional[int] = None
+    download_url: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
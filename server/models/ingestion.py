@@ -1,6 +1,7 @@
 """Pydantic schemas for the data ingestion layer (RF-09, RF-11, RF-12)."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -38,12 +39,76 @@ class RowError(BaseModel):
     errors: list[str]
 
 
+class DuplicateRow(BaseModel):
+    """A row skipped because its external_ref already belongs to a work order
+    (an earlier import, or an earlier row of the same one)."""
+
+    external_ref: str
+    work_order_id: Optional[int] = None
+
+
 class IngestionResult(BaseModel):
     created_count: int
+    duplicate_count: int
     failed_count: int
     created_work_order_ids: list[int]
+    duplicate_rows: list[DuplicateRow]
     failed_rows: list[RowError]
 
 
+IngestionJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class IngestionJob(BaseModel):
+    """Progress of a background ingestion job (GET /ingestion/jobs/{id})."""
+
+    id: int
+    source: str
+    status: IngestionJobStatus
+    total_rows: int
+    processed_rows: int
+    created_count: int
+    duplicate_count: int
+    failed_count: int
+    created_work_order_ids: list[int]
+    duplicate_rows: list[DuplicateRow]
+    failed_rows: list[RowError]
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class IngestionJobAccepted(BaseModel):
+    detail: str
+    status: IngestionJobStatus
+    job_id: int
+
+
 class WebhookWorkOrderPayload(WorkOrderIngestRow):
     pass
+
+
+class WebhookBatchPayload(BaseModel):
+    """Items are validated one by one so a bad item does not reject the batch."""
+
+    items: list[dict[str, Any]] = Field(..., min_length=1)
+
+
+WebhookItemStatus = Literal["created", "duplicate", "invalid"]
+
+
+class WebhookBatchItemResult(BaseModel):
+    index: int
+    status: WebhookItemStatus
+    external_ref: Optional[str] = None
+    work_order_id: Optional[int] = None
+    errors: list[str] = Field(default_factory=list)
+
+
+class WebhookBatchResult(BaseModel):
+    created_count: int
+    duplicate_count: int
+    failed_count: int
+    results: list[WebhookBatchItemResult]
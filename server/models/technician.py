@@ -53,3 +53,10 @@ class Technician(BaseModel):
     longitude: Optional[float] = None
     availability_status: AvailabilityStatus
     max_daily_jobs: int
+
+
+class NearbyTechnician(Technician):
+    """A dispatch candidate from GET /technicians/nearby."""
+
+    distance_km: float
+    active_work_order_count: int
@@ -1,7 +1,7 @@
 """Pydantic schemas for work orders (RF-09, RF-12, RF-18, RF-19, RF-20, RF-21)."""
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -145,6 +145,60 @@ class WorkOrder(BaseModel):
     updated_at: datetime
 
 
+class WorkOrderPage(BaseModel):
+    """One keyset page of GET /work-orders. ``items`` are full work orders, or
+    only the requested columns (plus id and created_at) when ``fields`` is
+    passed. ``next_cursor`` is opaque and None on the last page."""
+
+    items: list[dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+class WorkOrderAutoAssignBatch(BaseModel):
+    """Omit ``work_order_ids`` to assign every open, unassigned work order."""
+
+    work_order_ids: Optional[list[int]] = Field(None, min_length=1, max_length=5000)
+
+
+class WorkOrderAssignment(BaseModel):
+    work_order_id: int
+    technician_id: int
+
+
+class WorkOrderAutoAssignBatchResult(BaseModel):
+    assigned_count: int
+    assignments: list[WorkOrderAssignment]
+    # Candidates left unassigned because no eligible technician had capacity.
+    unassigned_work_order_ids: list[int]
+    # Requested ids that are missing, not open, or already assigned.
+    skipped_work_order_ids: list[int]
+
+
+BulkOutcome = Literal["updated", "unchanged", "not_found", "invalid_transition", "proof_required", "conflict"]
+MAX_BULK_WORK_ORDERS = 5000
+
+
+class WorkOrderBulkStatusUpdate(WorkOrderStatusUpdate):
+    work_order_ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_WORK_ORDERS)
+
+
+class WorkOrderBulkAssign(WorkOrderAssign):
+    work_order_ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_WORK_ORDERS)
+
+
+class WorkOrderBulkItemResult(BaseModel):
+    work_order_id: int
+    outcome: BulkOutcome
+    # Status after the call; None when the work order was not found.
+    status: Optional[Status] = None
+
+
+class WorkOrderBulkResult(BaseModel):
+    updated_count: int
+    # One entry per distinct requested id, in request order.
+    results: list[WorkOrderBulkItemResult]
+
+
 class WorkOrderDuplicateWarning(BaseModel):
     id: int
     title: str
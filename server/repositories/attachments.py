@@ -1,6 +1,8 @@
 """Data access for work order attachments (RF-19)."""
 
-from database import fetch_all, fetch_scalar, insert_row
+from typing import Iterator
+
+from database import fetch_all, fetch_iter, fetch_scalar, insert_row
 
 
 def create(organization_id: int, work_order_id: int, uploaded_by: int, patch: dict) -> dict:
@@ -27,8 +29,9 @@ def list_for_work_order(organization_id: int, work_order_id: int) -> list[dict]:
     )
 
 
-def list_metadata_by_org(organization_id: int) -> list[dict]:
-    return fetch_all(
+def iter_metadata_by_org(organization_id: int) -> Iterator[dict]:
+    """Attachment metadata (never storage paths) streamed for the tenant export."""
+    return fetch_iter(
         """
         SELECT
             id,
@@ -47,12 +50,15 @@ def list_metadata_by_org(organization_id: int) -> list[dict]:
 
 
 def has_for_work_order(organization_id: int, work_order_id: int) -> bool:
-    count = fetch_scalar(
-        """
-        SELECT COUNT(*)
-        FROM work_order_attachments
-        WHERE organization_id = :organization_id AND work_order_id = :work_order_id
-        """,
-        {"organization_id": organization_id, "work_order_id": work_order_id},
+    return bool(
+        fetch_scalar(
+            """
+            SELECT EXISTS (
+                SELECT 1
+                FROM work_order_attachments
+                WHERE organization_id = :organization_id AND work_order_id = :work_order_id
+            )
+            """,
+            {"organization_id": organization_id, "work_order_id": work_order_id},
+        )
     )
-    return int(count or 0) > 0
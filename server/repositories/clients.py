@@ -1,8 +1,8 @@
 """Data access for PMC clients, always scoped by organization_id."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from database import fetch_all, fetch_one, insert_row, update_row
+from database import fetch_all, fetch_iter, fetch_one, insert_row, update_row
 
 
 def create(organization_id: int, patch: dict) -> dict:
@@ -29,16 +29,21 @@ def get_by_email_in_org(email: str, organization_id: int) -> Optional[dict]:
     )
 
 
-def list_by_org(organization_id: int, active_only: bool = False) -> list[dict]:
+def _list_query(organization_id: int, active_only: bool) -> tuple[str, dict]:
     where = ["organization_id = :organization_id"]
     params = {"organization_id": organization_id}
     if active_only:
         where.append("is_active = true")
+    return f"SELECT * FROM clients WHERE {' AND '.join(where)} ORDER BY display_name ASC", params
 
-    return fetch_all(
-        f"SELECT * FROM clients WHERE {' AND '.join(where)} ORDER BY display_name ASC",
-        params,
-    )
+
+def list_by_org(organization_id: int, active_only: bool = False) -> list[dict]:
+    return fetch_all(*_list_query(organization_id, active_only))
+
+
+def iter_by_org(organization_id: int, active_only: bool = False) -> Iterator[dict]:
+    """Same rows as list_by_org, streamed for exports."""
+    return fetch_iter(*_list_query(organization_id, active_only))
 
 
 def update(client_id: int, organization_id: int, patch: dict) -> Optional[dict]:
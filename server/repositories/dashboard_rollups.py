@@ -0,0 +1,254 @@
+"""Data access for the daily rollups behind the operations report (RF-25).
+
+A work_orders trigger marks (organization_id, day) buckets dirty whenever a
+row's status, service type, property, costs or timestamps change; the
+refresher claims dirty days and rebuilds just those buckets from
+work_orders. Report reads sum at most one row per day and group, so their
+cost depends on the report window, not on how much history the org has.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from database import execute, fetch_all, fetch_all_in_transaction, fetch_scalar
+
+_DAY_KEYS = """
+    keys AS (
+        SELECT organization_id, day
+        FROM unnest(CAST(:organization_ids AS BIGINT[]), CAST(:days AS DATE[])) AS k(organization_id, day)
+    )
+"""
+# Half-open UTC range covering the key's day.
+_IN_DAY = "{column} >= (k.day AT TIME ZONE 'UTC') AND {column} < ((k.day + 1) AT TIME ZONE 'UTC')"
+
+
+def claim_dirty_days(limit: int, organization_id: Optional[int] = None) -> list[tuple[int, date]]:
+    """Remove up to ``limit`` dirty days (most recent first) and return them.
+    Claimed rows stay locked until the caller's transaction ends, so
+    concurrent refreshers skip them; a write that lands meanwhile re-marks
+    its day once the claim commits."""
+    org_filter = "WHERE organization_id = :organization_id" if organization_id is not None else ""
+    rows = fetch_all_in_transaction(
+        f"""
+        DELETE FROM dashboard_rollup_dirty_days AS dirty
+        USING (
+            SELECT organization_id, day
+            FROM dashboard_rollup_dirty_days
+            {org_filter}
+            ORDER BY day DESC
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        ) AS claimed
+        WHERE dirty.organization_id = claimed.organization_id AND dirty.day = claimed.day
+        RETURNING dirty.organization_id, dirty.day
+        """,
+        {"organization_id": organization_id, "limit": limit},
+    )
+    return [(row["organization_id"], row["day"]) for row in rows]
+
+
+def rebuild_days(days: list[tuple[int, date]]) -> None:
+    """Recompute the service and property rollups for the given
+    (organization_id, day) buckets from work_orders."""
+    if not days:
+        return
+    params = {
+        "organization_ids": [organization_id for organization_id, _day in days],
+        "days": [day for _organization_id, day in days],
+    }
+    for table in ("work_order_service_daily_rollups", "work_order_property_daily_rollups"):
+        execute(
+            f"""
+            WITH {_DAY_KEYS}
+            DELETE FROM {table} AS r
+            USING keys AS k
+            WHERE r.organization_id = k.organization_id AND r.day = k.day
+            """,
+            params,
+        )
+
+    execute(
+        f"""
+        WITH {_DAY_KEYS},
+        costs AS (
+            SELECT
+                wo.organization_id,
+                k.day,
+                COALESCE(NULLIF(wo.service_type, ''), 'general') AS service_type,
+                COUNT(*) AS cost_work_order_count,
+                COALESCE(SUM(wo.estimated_cost_cents), 0) AS estimated_cost_cents,
+                COALESCE(SUM(wo.actual_cost_cents), 0) AS actual_cost_cents,
+                COUNT(wo.actual_cost_cents) AS actual_cost_count,
+                COUNT(wo.invoice_reference) AS invoice_reference_count,
+                MAX(wo.created_at) AS latest_cost_work_order_at
+            FROM keys AS k
+            JOIN work_orders AS wo
+                ON wo.organization_id = k.organization_id
+               AND {_IN_DAY.format(column="wo.created_at")}
+            WHERE wo.estimated_cost_cents IS NOT NULL OR wo.actual_cost_cents IS NOT NULL
+            GROUP BY 1, 2, 3
+        ),
+        cycles AS (
+            SELECT
+                wo.organization_id,
+                k.day,
+                COALESCE(NULLIF(wo.service_type, ''), 'general') AS service_type,
+                COUNT(*) AS completed_count,
+                SUM(EXTRACT(EPOCH FROM (wo.completed_at - wo.created_at))) AS cycle_seconds_sum,
+                MIN(EXTRACT(EPOCH FROM (wo.completed_at - wo.created_at))) AS cycle_seconds_min,
+                MAX(EXTRACT(EPOCH FROM (wo.completed_at - wo.created_at))) AS cycle_seconds_max,
+                MAX(wo.completed_at) AS latest_completed_at
+            FROM keys AS k
+            JOIN work_orders AS wo
+                ON wo.organization_id = k.organization_id
+               AND {_IN_DAY.format(column="wo.completed_at")}
+            WHERE wo.status = 'completed' AND wo.completed_at >= wo.created_at
+            GROUP BY 1, 2, 3
+        )
+        INSERT INTO work_order_service_daily_rollups (
+            organization_id, day, service_type,
+            cost_work_order_count, estimated_cost_cents, actual_cost_cents, actual_cost_count,
+            invoice_reference_count, latest_cost_work_order_at,
+            completed_count, cycle_seconds_sum, cycle_seconds_min, cycle_seconds_max, latest_completed_at
+        )
+        SELECT
+            COALESCE(c.organization_id, y.organization_id),
+            COALESCE(c.day, y.day),
+            COALESCE(c.service_type, y.service_type),
+            COALESCE(c.cost_work_order_count, 0),
+            COALESCE(c.estimated_cost_cents, 0),
+            COALESCE(c.actual_cost_cents, 0),
+            COALESCE(c.actual_cost_count, 0),
+            COALESCE(c.invoice_reference_count, 0),
+            c.latest_cost_work_order_at,
+            COALESCE(y.completed_count, 0),
+            COALESCE(y.cycle_seconds_sum, 0),
+            y.cycle_seconds_min,
+            y.cycle_seconds_max,
+            y.latest_completed_at
+        FROM costs AS c
+        FULL OUTER JOIN cycles AS y
+            ON y.organization_id = c.organization_id AND y.day = c.day AND y.service_type = c.service_type
+        """,
+        params,
+    )
+
+    execute(
+        f"""
+        WITH {_DAY_KEYS}
+        INSERT INTO work_order_property_daily_rollups (
+            organization_id, day, property_id,
+            total_work_orders, open_count, in_progress_count, completed_count, latest_work_order_at
+        )
+        SELECT
+            wo.organization_id,
+            k.day,
+            wo.property_id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE wo.status = 'open'),
+            COUNT(*) FILTER (WHERE wo.status = 'in_progress'),
+            COUNT(*) FILTER (WHERE wo.status = 'completed'),
+            MAX(wo.created_at)
+        FROM keys AS k
+        JOIN work_orders AS wo
+            ON wo.organization_id = k.organization_id
+           AND {_IN_DAY.format(column="wo.created_at")}
+        JOIN properties AS p
+            ON p.id = wo.property_id
+           AND p.organization_id = wo.organization_id
+        GROUP BY 1, 2, 3
+        """,
+        params,
+    )
+
+
+def freshness(organization_id: int) -> datetime:
+    """Rollups include every change made before this instant: the oldest
+    pending dirty mark for the org, or now when nothing is pending."""
+    return fetch_scalar(
+        """
+        SELECT COALESCE(MIN(marked_at), TIMEZONE('utc'::text, NOW()))
+        FROM dashboard_rollup_dirty_days
+        WHERE organization_id = :organization_id
+        """,
+        {"organization_id": organization_id},
+    )
+
+
+def _since_day(since_days: int) -> date:
+    # Rollups are daily, so a window covers whole UTC days.
+    return (datetime.now(timezone.utc) - timedelta(days=since_days)).date()
+
+
+def list_property_hotspots(organization_id: int, since_days: int = 90, limit: int = 10) -> list[dict]:
+    return fetch_all(
+        """
+        SELECT
+            p.id AS property_id,
+            p.name AS property_name,
+            p.address_line1,
+            SUM(r.total_work_orders) AS total_work_orders,
+            SUM(r.open_count) AS open_count,
+            SUM(r.in_progress_count) AS in_progress_count,
+            SUM(r.completed_count) AS completed_count,
+            MAX(r.latest_work_order_at) AS latest_work_order_at
+        FROM work_order_property_daily_rollups AS r
+        JOIN properties AS p
+            ON p.id = r.property_id
+           AND p.organization_id = r.organization_id
+        WHERE r.organization_id = :organization_id
+          AND r.day >= :since_day
+        GROUP BY p.id, p.name, p.address_line1
+        HAVING SUM(r.total_work_orders) > 0
+        ORDER BY total_work_orders DESC, latest_work_order_at DESC
+        LIMIT :limit
+        """,
+        {"organization_id": organization_id, "since_day": _since_day(since_days), "limit": limit},
+    )
+
+
+def list_completion_cycles(organization_id: int, since_days: int = 90, limit: int = 10) -> list[dict]:
+    return fetch_all(
+        """
+        SELECT
+            service_type,
+            SUM(completed_count) AS completed_count,
+            ROUND((SUM(cycle_seconds_sum) / SUM(completed_count) / 3600.0)::numeric, 1) AS average_cycle_hours,
+            ROUND((MIN(cycle_seconds_min) / 3600.0)::numeric, 1) AS fastest_cycle_hours,
+            ROUND((MAX(cycle_seconds_max) / 3600.0)::numeric, 1) AS slowest_cycle_hours,
+            MAX(latest_completed_at) AS latest_completed_at
+        FROM work_order_service_daily_rollups
+        WHERE organization_id = :organization_id
+          AND day >= :since_day
+          AND completed_count > 0
+        GROUP BY service_type
+        ORDER BY average_cycle_hours DESC, completed_count DESC
+        LIMIT :limit
+        """,
+        {"organization_id": organization_id, "since_day": _since_day(since_days), "limit": limit},
+    )
+
+
+def list_cost_summary(organization_id: int, since_days: int = 90, limit: int = 10) -> list[dict]:
+    return fetch_all(
+        """
+        SELECT
+            service_type,
+            SUM(cost_work_order_count) AS work_order_count,
+            SUM(estimated_cost_cents) AS estimated_cost_cents,
+            SUM(actual_cost_cents) AS actual_cost_cents,
+            SUM(actual_cost_cents) - SUM(estimated_cost_cents) AS variance_cents,
+            ROUND(SUM(actual_cost_cents)::numeric / NULLIF(SUM(actual_cost_count), 0), 0)
+                AS average_actual_cost_cents,
+            SUM(invoice_reference_count) AS invoice_reference_count,
+            MAX(latest_cost_work_order_at) AS latest_work_order_at
+        FROM work_order_service_daily_rollups
+        WHERE organization_id = :organization_id
+          AND day >= :since_day
+          AND cost_work_order_count > 0
+        GROUP BY service_type
+        ORDER BY actual_cost_cents DESC, estimated_cost_cents DESC, work_order_count DESC
+        LIMIT :limit
+        """,
+        {"organization_id": organization_id, "since_day": _since_day(since_days), "limit": limit},
+    )
@@ -0,0 +1,189 @@
+"""Data access for the durable export job queue (RNF-13).
+
+Claims follow the ingestion queue: ``FOR UPDATE SKIP LOCKED`` plus a lease
+renewed on every progress update. Unlike ingestion, a tenant may only have
+a few exports running at once, and counting them is only reliable if claims
+do not race each other -- so claims (and, per tenant, enqueues) are
+serialized with transaction-scoped advisory locks, which the caller must
+take inside the same unit of work.
+"""
+
+from typing import Optional
+
+from database import execute, fetch_one, fetch_one_in_transaction, fetch_scalar
+
+STATUS_COLUMNS = """
+    id, organization_id, created_by, kind, status, file_name, content_type,
+    storage_backend, storage_key, bytes_written, size_bytes, error, attempts,
+    created_at, started_at, finished_at
+"""
+
+
+def lock_claims() -> None:
+    """Serialize claim_next across workers until the unit of work ends."""
+    execute("SELECT pg_advisory_xact_lock(hashtextextended('export_jobs.claim', 0))")
+
+
+def lock_org_queue(organization_id: int) -> None:
+    """Serialize enqueues for one tenant until the unit of work ends."""
+    execute(
+        "SELECT pg_advisory_xact_lock(hashtextextended('export_jobs.enqueue', :organization_id))",
+        {"organization_id": organization_id},
+    )
+
+
+def count_pending(organization_id: int) -> int:
+    count = fetch_scalar(
+        """
+        SELECT COUNT(*)
+        FROM export_jobs
+        WHERE organization_id = :organization_id AND status IN ('queued', 'running')
+        """,
+        {"organization_id": organization_id},
+    )
+    return int(count or 0)
+
+
+def create(organization_id: int, created_by: int | None, kind: str, file_name: str, content_type: str) -> dict:
+    return fetch_one_in_transaction(
+        f"""
+        INSERT INTO export_jobs (organization_id, created_by, kind, file_name, content_type)
+        VALUES (:organization_id, :created_by, :kind, :file_name, :content_type)
+        RETURNING {STATUS_COLUMNS}
+        """,
+        {
+            "organization_id": organization_id,
+            "created_by": created_by,
+            "kind": kind,
+            "file_name": file_name,
+            "content_type": content_type,
+        },
+    )
+
+
+def get_by_id_in_org(job_id: int, organization_id: int) -> Optional[dict]:
+    return fetch_one(
+        f"SELECT {STATUS_COLUMNS} FROM export_jobs WHERE id = :job_id AND organization_id = :organization_id",
+        {"job_id": job_id, "organization_id": organization_id},
+    )
+
+
+def claim_next(worker_id: str, lease_seconds: int, max_attempts: int, max_running_per_org: int) -> Optional[dict]:
+    """Lease the oldest queued (or abandoned) job whose tenant is below
+    ``max_running_per_org`` live exports. Call after lock_claims()."""
+    return fetch_one_in_transaction(
+        """
+        WITH live AS (
+            SELECT organization_id, COUNT(*) AS running
+            FROM export_jobs
+            WHERE status = 'running' AND locked_at >= NOW() - make_interval(secs => :lease_seconds)
+            GROUP BY organization_id
+        ),
+        next_job AS (
+            SELECT job.id
+            FROM export_jobs AS job
+            LEFT JOIN live ON live.organization_id = job.organization_id
+            WHERE job.attempts < :max_attempts
+              AND (
+                job.status = 'queued'
+                OR (job.status = 'running' AND job.locked_at < NOW() - make_interval(secs => :lease_seconds))
+              )
+              AND COALESCE(live.running, 0) < :max_running_per_org
+            ORDER BY job.created_at, job.id
+            LIMIT 1
+            FOR UPDATE OF job SKIP LOCKED
+        )
+        UPDATE export_jobs AS job
+        SET status = 'running',
+            attempts = job.attempts + 1,
+            bytes_written = 0,
+            locked_by = :worker_id,
+            locked_at = NOW(),
+            started_at = COALESCE(job.started_at, NOW())
+        FROM next_job
+        WHERE job.id = next_job.id
+        RETURNING job.*
+        """,
+        {
+            "worker_id": worker_id,
+            "lease_seconds": lease_seconds,
+            "max_attempts": max_attempts,
+            "max_running_per_org": max_running_per_org,
+        },
+    )
+
+
+def fail_abandoned(lease_seconds: int, max_attempts: int) -> Optional[dict]:
+    """Give up on a job whose workers kept dying before it finished."""
+    return fetch_one_in_transaction(
+        """
+        UPDATE export_jobs
+        SET status = 'failed',
+            error = 'Job was abandoned by its worker too many times',
+            locked_by = NULL,
+            locked_at = NULL,
+            finished_at = NOW()
+        WHERE id = (
+            SELECT id
+            FROM export_jobs
+            WHERE status = 'running'
+              AND attempts >= :max_attempts
+              AND locked_at < NOW() - make_interval(secs => :lease_seconds)
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id
+        """,
+        {"lease_seconds": lease_seconds, "max_attempts": max_attempts},
+    )
+
+
+def record_progress(job_id: int, worker_id: str, bytes_written: int) -> Optional[dict]:
+    """Report bytes stored so far and renew the lease. Returns None when
+    ``worker_id`` no longer holds the job."""
+    return fetch_one_in_transaction(
+        """
+        UPDATE export_jobs
+        SET bytes_written = :bytes_written,
+            locked_at = NOW()
+        WHERE id = :job_id AND status = 'running' AND locked_by = :worker_id
+        RETURNING id, bytes_written
+        """,
+        {"job_id": job_id, "worker_id": worker_id, "bytes_written": bytes_written},
+    )
+
+
+def finish(
+    job_id: int,
+    worker_id: str,
+    status: str,
+    storage_backend: str | None = None,
+    storage_key: str | None = None,
+    size_bytes: int | None = None,
+    error: str | None = None,
+) -> Optional[dict]:
+    return fetch_one_in_transaction(
+        """
+        UPDATE export_jobs
+        SET status = :status,
+            storage_backend = :storage_backend,
+            storage_key = :storage_key,
+            size_bytes = :size_bytes,
+            bytes_written = COALESCE(:size_bytes, bytes_written),
+            error = :error,
+            locked_by = NULL,
+            locked_at = NULL,
+            finished_at = NOW()
+        WHERE id = :job_id AND status = 'running' AND locked_by = :worker_id
+        RETURNING id, status
+        """,
+        {
+            "job_id": job_id,
+            "worker_id": worker_id,
+            "status": status,
+            "storage_backend": storage_backend,
+            "storage_key": storage_key,
+            "size_bytes": size_bytes,
+            "error": error,
+        },
+    )
@@ -0,0 +1,152 @@
+"""Data access for the durable ingestion job queue (RF-09, RF-11).
+
+Jobs are claimed with ``FOR UPDATE SKIP LOCKED`` so any number of worker
+processes can poll the same table without handing one job to two workers.
+A claim is a lease: ``locked_at`` is refreshed on every progress update, and
+a running job whose lease is older than ``lease_seconds`` is reclaimed and
+resumes from ``processed_rows``.
+"""
+
+import json
+from typing import Optional
+
+from database import fetch_one, fetch_one_in_transaction
+
+# Everything but the (potentially large) row payload, for status polling.
+STATUS_COLUMNS = """
+    id, organization_id, created_by, source, status, total_rows, processed_rows,
+    created_count, created_work_order_ids, row_errors, duplicate_rows, error, attempts,
+    created_at, started_at, finished_at
+"""
+
+
+def create(
+    organization_id: int,
+    created_by: int | None,
+    source: str,
+    rows: list[dict],
+    row_errors: list[dict],
+) -> dict:
+    return fetch_one_in_transaction(
+        f"""
+        INSERT INTO ingestion_jobs (organization_id, created_by, source, payload, total_rows, row_errors)
+        VALUES (
+            :organization_id, :created_by, :source,
+            CAST(:payload AS jsonb), :total_rows, CAST(:row_errors AS jsonb)
+        )
+        RETURNING {STATUS_COLUMNS}
+        """,
+        {
+            "organization_id": organization_id,
+            "created_by": created_by,
+            "source": source,
+            "payload": json.dumps({"rows": rows}),
+            "total_rows": len(rows),
+            "row_errors": json.dumps(row_errors),
+        },
+    )
+
+
+def get_by_id_in_org(job_id: int, organization_id: int) -> Optional[dict]:
+    return fetch_one(
+        f"SELECT {STATUS_COLUMNS} FROM ingestion_jobs WHERE id = :job_id AND organization_id = :organization_id",
+        {"job_id": job_id, "organization_id": organization_id},
+    )
+
+
+def claim_next(worker_id: str, lease_seconds: int, max_attempts: int) -> Optional[dict]:
+    """Lease the oldest queued (or abandoned) job to ``worker_id``."""
+    return fetch_one_in_transaction(
+        """
+        WITH next_job AS (
+            SELECT id
+            FROM ingestion_jobs
+            WHERE attempts < :max_attempts
+              AND (
+                status = 'queued'
+                OR (status = 'running' AND locked_at < NOW() - make_interval(secs => :lease_seconds))
+              )
+            ORDER BY created_at, id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE ingestion_jobs AS job
+        SET status = 'running',
+            attempts = job.attempts + 1,
+            locked_by = :worker_id,
+            locked_at = NOW(),
+            started_at = COALESCE(job.started_at, NOW())
+        FROM next_job
+        WHERE job.id = next_job.id
+        RETURNING job.*
+        """,
+        {"worker_id": worker_id, "lease_seconds": lease_seconds, "max_attempts": max_attempts},
+    )
+
+
+def fail_abandoned(lease_seconds: int, max_attempts: int) -> Optional[dict]:
+    """Give up on a job whose workers kept dying before it finished."""
+    return fetch_one_in_transaction(
+        """
+        UPDATE ingestion_jobs
+        SET status = 'failed',
+            error = 'Job was abandoned by its worker too many times',
+            locked_by = NULL,
+            locked_at = NULL,
+            finished_at = NOW()
+        WHERE id = (
+            SELECT id
+            FROM ingestion_jobs
+            WHERE status = 'running'
+              AND attempts >= :max_attempts
+              AND locked_at < NOW() - make_interval(secs => :lease_seconds)
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id
+        """,
+        {"lease_seconds": lease_seconds, "max_attempts": max_attempts},
+    )
+
+
+def record_progress(
+    job_id: int, worker_id: str, processed_rows: int, created_ids: list[int], duplicate_rows: list[dict]
+) -> Optional[dict]:
+    """Advance a batch and renew the lease. Returns None when ``worker_id``
+    no longer holds the job, so the caller can roll back its batch."""
+    return fetch_one_in_transaction(
+        """
+        UPDATE ingestion_jobs
+        SET processed_rows = :processed_rows,
+            created_count = created_count + :created_count,
+            created_work_order_ids = created_work_order_ids || CAST(:created_ids AS jsonb),
+            duplicate_rows = duplicate_rows || CAST(:duplicate_rows AS jsonb),
+            locked_at = NOW()
+        WHERE id = :job_id AND status = 'running' AND locked_by = :worker_id
+        RETURNING id, processed_rows
+        """,
+        {
+            "job_id": job_id,
+            "worker_id": worker_id,
+            "processed_rows": processed_rows,
+            "created_count": len(created_ids),
+            "created_ids": json.dumps(created_ids),
+            "duplicate_rows": json.dumps(duplicate_rows),
+        },
+    )
+
+
+def finish(job_id: int, worker_id: str, status: str, error: str | None = None) -> Optional[dict]:
+    return fetch_one_in_transaction(
+        """
+        UPDATE ingestion_jobs
+        SET status = :status,
+            error = :error,
+            locked_by = NULL,
+            locked_at = NULL,
+            finished_at = NOW()
+        WHERE id = :job_id AND status = 'running' AND locked_by = :worker_id
+        RETURNING id, status
+        """,
+        {"job_id": job_id, "worker_id": worker_id, "status": status, "error": error},
+    )
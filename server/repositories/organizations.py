@@ -4,8 +4,10 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import async_database
+from core.cache import publish_invalidation
 from core.config import settings
-from database import delete_rows, fetch_one, insert_row, select_one, update_row
+from database import after_commit, delete_rows, fetch_one, insert_row, select_one, update_row
 
 
 def slugify(name: str) -> str:
@@ -49,14 +51,28 @@ def get_by_api_key(api_key: str) -> Optional[dict]:
     return select_one("organizations", {"api_key": api_key})
 
 
+async def get_by_api_key_async(api_key: str) -> Optional[dict]:
+    return await async_database.select_one("organizations", {"api_key": api_key})
+
+
+def _invalidate_cached(organization_id: int) -> None:
+    after_commit(lambda: publish_invalidation("organization", organization_id=organization_id))
+
+
 def regenerate_api_key(organization_id: int) -> Optional[dict]:
-    return update_row("organizations", {"api_key": secrets.token_urlsafe(24)}, {"id": organization_id})
+    row = update_row("organizations", {"api_key": secrets.token_urlsafe(24)}, {"id": organization_id})
+    _invalidate_cached(organization_id)
+    return row
 
 
 def get_by_id(organization_id: int) -> Optional[dict]:
     return select_one("organizations", {"id": organization_id})
 
 
+async def get_by_id_async(organization_id: int) -> Optional[dict]:
+    return await async_database.select_one("organizations", {"id": organization_id})
+
+
 def get_by_stripe_customer_id(stripe_customer_id: str) -> Optional[dict]:
     return select_one("organizations", {"stripe_customer_id": stripe_customer_id})
 
@@ -67,24 +83,32 @@ def update_settings(organization_id: int, settings_patch: dict) -> Optional[dict
         return None
 
     merged = {**(current.get("settings") or {}), **settings_patch}
-    return update_row("organizations", {"settings": merged}, {"id": organization_id})
+    row = update_row("organizations", {"settings": merged}, {"id": organization_id})
+    _invalidate_cached(organization_id)
+    return row
 
 
 def update_timezone(organization_id: int, org_timezone: str) -> Optional[dict]:
-    return update_row("organizations", {"timezone": org_timezone}, {"id": organization_id})
+    row = update_row("organizations", {"timezone": org_timezone}, {"id": organization_id})
+    _invalidate_cached(organization_id)
+    return row
 
 
 def update_billing(organization_id: int, patch: dict) -> Optional[dict]:
-    return update_row("organizations", patch, {"id": organization_id})
+    row = update_row("organizations", patch, {"id": organization_id})
+    _invalidate_cached(organization_id)
+    return row
 
 
 def soft_delete(organization_id: int) -> bool:
     """RNF-13: allow deletion of a tenant's data on request."""
     updated = update_row("organizations", {"deleted_at": datetime.now(timezone.utc)}, {"id": organization_id})
+    _invalidate_cached(organization_id)
     return bool(updated)
 
 
 def hard_delete(organization_id: int) -> bool:
     """Actually erase a tenant's rows (cascades via FK) -- used for POC test cleanup."""
     rows = delete_rows("organizations", {"id": organization_id})
+    _invalidate_cached(organization_id)
     return bool(rows)
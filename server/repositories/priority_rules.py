@@ -1,25 +1,11 @@
 """Data access for configurable per-org priority rules (RF-17)."""
 
-from typing import Optional
-
-from database import fetch_all, fetch_one, fetch_one_in_transaction
-
-
-def get_forced_priority(organization_id: int, service_type: str) -> Optional[str]:
-    row = fetch_one(
-        """
-        SELECT forced_priority
-        FROM org_priority_rules
-        WHERE organization_id = :organization_id AND service_type = :service_type
-        LIMIT 1
-        """,
-        {"organization_id": organization_id, "service_type": service_type},
-    )
-    return row["forced_priority"] if row else None
+from core.cache import publish_invalidation
+from database import after_commit, fetch_all, fetch_one_in_transaction
 
 
 def upsert_rule(organization_id: int, service_type: str, forced_priority: str) -> dict:
-    return fetch_one_in_transaction(
+    row = fetch_one_in_transaction(
         """
         INSERT INTO org_priority_rules (organization_id, service_type, forced_priority)
         VALUES (:organization_id, :service_type, :forced_priority)
@@ -33,6 +19,8 @@ def upsert_rule(organization_id: int, service_type: str, forced_priority: str) -
             "forced_priority": forced_priority,
         },
     )
+    after_commit(lambda: publish_invalidation("priority_rules", organization_id=organization_id))
+    return row
 
 
 def list_by_org(organization_id: int) -> list[dict]:
@@ -1,8 +1,8 @@
 """Data access for managed properties, always scoped by organization_id."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from database import fetch_all, fetch_one, insert_row, update_row
+from database import fetch_all, fetch_iter, fetch_one, insert_row, update_row
 
 
 def create(organization_id: int, patch: dict) -> dict:
@@ -16,11 +16,7 @@ def get_by_id_in_org(property_id: int, organization_id: int) -> Optional[dict]:
     )
 
 
-def list_by_org(
-    organization_id: int,
-    client_id: Optional[int] = None,
-    active_only: bool = False,
-) -> list[dict]:
+def _list_query(organization_id: int, client_id: Optional[int], active_only: bool) -> tuple[str, dict]:
     where = ["organization_id = :organization_id"]
     params = {"organization_id": organization_id}
     if client_id:
@@ -28,11 +24,24 @@ def list_by_org(
         params["client_id"] = client_id
     if active_only:
         where.append("is_active = true")
+    return f"SELECT * FROM properties WHERE {' AND '.join(where)} ORDER BY name ASC", params
 
-    return fetch_all(
-        f"SELECT * FROM properties WHERE {' AND '.join(where)} ORDER BY name ASC",
-        params,
-    )
+
+def list_by_org(
+    organization_id: int,
+    client_id: Optional[int] = None,
+    active_only: bool = False,
+) -> list[dict]:
+    return fetch_all(*_list_query(organization_id, client_id, active_only))
+
+
+def iter_by_org(
+    organization_id: int,
+    client_id: Optional[int] = None,
+    active_only: bool = False,
+) -> Iterator[dict]:
+    """Same rows as list_by_org, streamed for exports."""
+    return fetch_iter(*_list_query(organization_id, client_id, active_only))
 
 
 def update(property_id: int, organization_id: int, patch: dict) -> Optional[dict]:
@@ -1,8 +1,10 @@
 """Data access for technician profiles (RF-14, RF-26)."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from database import fetch_all, fetch_one, insert_row, update_row
+import async_database
+from core.cache import publish_invalidation
+from database import after_commit, fetch_all, fetch_iter, fetch_one, insert_row, update_row
 
 TECHNICIAN_SELECT = """
     SELECT
@@ -15,8 +17,18 @@ TECHNICIAN_SELECT = """
 """
 
 
+def _publish_changed(organization_id: int, technician_id: int | None, fields: tuple[str, ...]) -> None:
+    after_commit(
+        lambda: publish_invalidation(
+            "technician", organization_id=organization_id, technician_id=technician_id, fields=fields
+        )
+    )
+
+
 def create_technician(organization_id: int, user_id: int, patch: dict) -> dict:
-    return insert_row("technicians", {"organization_id": organization_id, "user_id": user_id, **patch})
+    row = insert_row("technicians", {"organization_id": organization_id, "user_id": user_id, **patch})
+    _publish_changed(organization_id, row["id"], ())
+    return row
 
 
 def get_by_id_in_org(technician_id: int, organization_id: int) -> Optional[dict]:
@@ -35,16 +47,33 @@ def get_by_user_id(user_id: int, organization_id: int) -> Optional[dict]:
     return _with_user(row) if row else None
 
 
-def list_by_org(organization_id: int) -> list[dict]:
-    rows = fetch_all(
-        TECHNICIAN_SELECT + " WHERE t.organization_id = :organization_id ORDER BY t.created_at DESC",
-        {"organization_id": organization_id},
+async def get_by_user_id_async(user_id: int, organization_id: int) -> Optional[dict]:
+    row = await async_database.fetch_one(
+        TECHNICIAN_SELECT + " WHERE t.user_id = :user_id AND t.organization_id = :organization_id",
+        {"user_id": user_id, "organization_id": organization_id},
     )
+    return _with_user(row) if row else None
+
+
+TECHNICIANS_BY_ORG_SQL = TECHNICIAN_SELECT + " WHERE t.organization_id = :organization_id ORDER BY t.created_at DESC"
+
+
+def list_by_org(organization_id: int) -> list[dict]:
+    rows = fetch_all(TECHNICIANS_BY_ORG_SQL, {"organization_id": organization_id})
     return [_with_user(row) for row in rows]
 
 
+def iter_by_org(organization_id: int) -> Iterator[dict]:
+    """Same rows as list_by_org, streamed for the tenant export."""
+    return map(_with_user, fetch_iter(TECHNICIANS_BY_ORG_SQL, {"organization_id": organization_id}))
+
+
 def update(technician_id: int, organization_id: int, patch: dict) -> Optional[dict]:
-    return update_row("technicians", patch, {"id": technician_id, "organization_id": organization_id})
+    """Subscribers to the "technician" invalidation topic receive the changed
+    column names as ``fields`` (empty for a new technician)."""
+    row = update_row("technicians", patch, {"id": technician_id, "organization_id": organization_id})
+    _publish_changed(organization_id, technician_id, tuple(patch))
+    return row
 
 
 def _with_user(row: dict) -> dict:
@@ -1,8 +1,10 @@
 """Data access for users, always scoped by organization_id where applicable (RF-05)."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from database import execute, fetch_all, fetch_scalar, insert_row, select_one, update_row
+import async_database
+from core.cache import publish_invalidation
+from database import after_commit, execute, fetch_all, fetch_iter, fetch_scalar, insert_row, select_one, update_row
 
 
 def create_user(organization_id: int, email: str, password_hash: str, full_name: str, role: str) -> dict:
@@ -27,11 +29,20 @@ def get_by_id_in_org(user_id: int, organization_id: int) -> Optional[dict]:
     return select_one("users", {"id": user_id, "organization_id": organization_id})
 
 
+async def get_by_id_in_org_async(user_id: int, organization_id: int) -> Optional[dict]:
+    return await async_database.select_one("users", {"id": user_id, "organization_id": organization_id})
+
+
+USERS_BY_ORG_SQL = "SELECT * FROM users WHERE organization_id = :organization_id ORDER BY created_at DESC"
+
+
 def list_by_org(organization_id: int) -> list[dict]:
-    return fetch_all(
-        "SELECT * FROM users WHERE organization_id = :organization_id ORDER BY created_at DESC",
-        {"organization_id": organization_id},
-    )
+    return fetch_all(USERS_BY_ORG_SQL, {"organization_id": organization_id})
+
+
+def iter_by_org(organization_id: int) -> Iterator[dict]:
+    """Same rows as list_by_org, streamed for the tenant export."""
+    return fetch_iter(USERS_BY_ORG_SQL, {"organization_id": organization_id})
 
 
 def count_by_org_and_role(organization_id: int, role: str) -> int:
@@ -47,4 +58,8 @@ def update_password(user_id: int, password_hash: str) -> None:
 
 
 def update_role_and_status(user_id: int, organization_id: int, patch: dict) -> Optional[dict]:
-    return update_row("users", patch, {"id": user_id, "organization_id": organization_id})
+    row = update_row("users", patch, {"id": user_id, "organization_id": organization_id})
+    after_commit(
+        lambda: publish_invalidation("user", user_id=user_id, organization_id=organization_id)
+    )
+    return row
@@ -1,9 +1,38 @@
-"""Data access for the work order audit log (RF-20)."""
+"""Data access for the work order audit log (RF-20).
 
-from database import fetch_all, insert_row
+Audit rows are write-behind: inside a unit of work they are buffered and
+written as one multi-row INSERT just before the transaction commits, so a
+request that logs several events pays for one statement. With
+AUDIT_WRITE_MODE=async they are instead queued after commit and written by a
+background drainer; the bounded queue pushes back on writers when it is full
+and falls back to a direct insert rather than dropping an event. Async mode
+trades durability for latency: events still queued when a process dies are
+lost, and so are events the database keeps rejecting (e.g. for a work order
+deleted in the meantime) -- the drainer logs and drops those rather than
+retrying them forever.
+"""
 
+import queue
+from typing import Iterator
 
-def create_event(
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+from core.config import settings
+from database import after_commit, current_unit_of_work, fetch_all, fetch_iter, insert_rows, outside_unit_of_work
+from logger import logger
+
+BUFFER_NAME = "work_order_events"
+_queue: "queue.Queue[dict]" = queue.Queue(maxsize=settings.AUDIT_QUEUE_MAX_EVENTS)
+# A drained batch whose insert failed; retried first on the next drain. Only
+# the drainer thread touches it.
+_unwritten: list[dict] = []
+_unwritten_attempts = 0
+# Failures that say nothing about the rows themselves (database unreachable);
+# they never get a row dropped.
+_CONNECTION_ERRORS = (OperationalError, InterfaceError)
+
+
+def event_row(
     organization_id: int,
     work_order_id: int,
     event_type: str,
@@ -12,21 +41,160 @@ def create_event(
     to_status: str | None = None,
     notes: str | None = None,
 ) -> dict:
-    return insert_row(
-        "work_order_events",
-        {
-            "organization_id": organization_id,
-            "work_order_id": work_order_id,
-            "event_type": event_type,
-            "actor_user_id": actor_user_id,
-            "from_status": from_status,
-            "to_status": to_status,
-            "notes": notes,
-        },
-    )
+    return {
+        "organization_id": organization_id,
+        "work_order_id": work_order_id,
+        "event_type": event_type,
+        "actor_user_id": actor_user_id,
+        "from_status": from_status,
+        "to_status": to_status,
+        "notes": notes,
+    }
+
+
+def create_event(
+    organization_id: int,
+    work_order_id: int,
+    event_type: str,
+    actor_user_id: int | None = None,
+    from_status: str | None = None,
+    to_status: str | None = None,
+    notes: str | None = None,
+) -> None:
+    create_events([event_row(organization_id, work_order_id, event_type, actor_user_id, from_status, to_status, notes)])
+
+
+def create_events(events: list[dict]) -> None:
+    """Record audit rows built with event_row(); buffered until the active
+    unit of work commits, written immediately outside one."""
+    if not events:
+        return
+    unit = current_unit_of_work()
+    if unit is None:
+        _write(events)
+    else:
+        unit.buffer(BUFFER_NAME, _flush).extend(events)
+
+
+def flush_pending() -> None:
+    """Write this unit's buffered rows now, so a read in the same request sees them."""
+    unit = current_unit_of_work()
+    if unit is None or settings.AUDIT_WRITE_MODE == "async":
+        return
+    pending = unit.buffer(BUFFER_NAME, _flush)
+    if pending:
+        rows = list(pending)
+        pending.clear()
+        _write(rows)
+
+
+def _write(events: list[dict]) -> None:
+    insert_rows("work_order_events", events, returning=False)
+
+
+def _flush(events: list[dict]) -> None:
+    if settings.AUDIT_WRITE_MODE == "async":
+        after_commit(lambda: enqueue(events))
+    else:
+        _write(events)
+
+
+def enqueue(events: list[dict]) -> None:
+    """Hand committed events to the background drainer. Blocks up to
+    AUDIT_QUEUE_PUT_TIMEOUT_SECONDS per event when the queue is full, then
+    writes the remainder directly."""
+    for index, event in enumerate(events):
+        try:
+            _queue.put(event, timeout=settings.AUDIT_QUEUE_PUT_TIMEOUT_SECONDS)
+        except queue.Full:
+            remainder = events[index:]
+            logger.warning(
+                "audit.queue_full",
+                extra={"event": "audit_queue_full", "direct_write_count": len(remainder)},
+            )
+            with outside_unit_of_work():
+                _write(remainder)
+            return
+
+
+def drain(max_events: int | None = None) -> bool:
+    """Write up to ``max_events`` queued events (AUDIT_DRAIN_BATCH_SIZE by
+    default) in one insert. Returns True when it wrote (or dropped) anything.
+
+    A failed batch is retried first on the next drain; once it has failed
+    AUDIT_DRAIN_MAX_ATTEMPTS times it is written in halves instead, down to
+    the single rows at fault, which are logged and dropped."""
+    global _unwritten_attempts
+    limit = max_events or settings.AUDIT_DRAIN_BATCH_SIZE
+    events: list[dict] = _unwritten[:]
+    _unwritten.clear()
+    while len(events) < limit:
+        try:
+            events.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    if not events:
+        return False
+    if _unwritten_attempts >= settings.AUDIT_DRAIN_MAX_ATTEMPTS:
+        _write_isolating_failures(events)
+        _unwritten_attempts = 0
+        return True
+    try:
+        with outside_unit_of_work():
+            _write(events)
+    except Exception:
+        _unwritten.extend(events)
+        _unwritten_attempts += 1
+        raise
+    _unwritten_attempts = 0
+    return True
+
+
+def _write_isolating_failures(events: list[dict]) -> None:
+    batches = [events]
+    while batches:
+        batch = batches.pop()
+        try:
+            with outside_unit_of_work():
+                _write(batch)
+        except _CONNECTION_ERRORS:
+            for unwritten in [batch, *reversed(batches)]:
+                _unwritten.extend(unwritten)
+            raise
+        except Exception:
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                batches.extend([batch[middle:], batch[:middle]])
+                continue
+            [event] = batch
+            logger.exception(
+                "audit.event_dropped",
+                extra={
+                    "event": "audit_event_dropped",
+                    "organization_id": event["organization_id"],
+                    "work_order_id": event["work_order_id"],
+                    "event_type": event["event_type"],
+                },
+            )
+
+
+def drain_all() -> None:
+    """Flush everything still queued; run on shutdown. A batch that fails is
+    retried until drain() isolates and drops its bad rows, so the events
+    queued behind it are still written. Gives up when the database itself
+    is unreachable."""
+    while True:
+        try:
+            if not drain():
+                return
+        except _CONNECTION_ERRORS:
+            raise
+        except Exception:
+            logger.exception("audit.drain_failed", extra={"event": "audit_drain_failed"})
 
 
 def list_for_work_order(organization_id: int, work_order_id: int) -> list[dict]:
+    flush_pending()
     return fetch_all(
         """
         SELECT *
@@ -38,8 +206,10 @@ def list_for_work_order(organization_id: int, work_order_id: int) -> list[dict]:
     )
 
 
-def list_by_org(organization_id: int) -> list[dict]:
-    return fetch_all(
+def iter_by_org(organization_id: int) -> Iterator[dict]:
+    """Every audit event in the org, streamed for the tenant export."""
+    flush_pending()
+    return fetch_iter(
         """
         SELECT *
         FROM work_order_events
@@ -1,8 +1,8 @@
 """Data access for work-order messages, always scoped by organization_id."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from database import fetch_all, insert_row
+from database import fetch_all, fetch_iter, insert_row
 
 
 def create(
@@ -45,8 +45,9 @@ def list_for_work_order(
     )
 
 
-def list_by_org(organization_id: int) -> list[dict]:
-    return fetch_all(
+def iter_by_org(organization_id: int) -> Iterator[dict]:
+    """Every message in the org, streamed for the tenant export."""
+    return fetch_iter(
         """
         SELECT *
         FROM work_order_messages
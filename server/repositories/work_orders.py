@@ -1,9 +1,22 @@
 """Data access for work orders, always scoped by organization_id (RF-05, RF-18, RF-21)."""
 
 from datetime import date, datetime, timedelta, timezone
-from typing import Optional
-
-from database import fetch_all, fetch_one, fetch_scalar, insert_row, update_row
+from typing import Iterator, Optional
+
+import async_database
+from core.change_bus import WorkOrdersChanged
+from core.change_bus import bus as change_bus
+from database import (
+    after_commit,
+    fetch_all,
+    fetch_iter,
+    fetch_all_in_transaction,
+    fetch_one,
+    fetch_one_in_transaction,
+    insert_row,
+    insert_rows,
+    update_row,
+)
 
 ALL_WORK_ORDER_STATUSES = (
     "open",
@@ -16,8 +29,49 @@ ALL_WORK_ORDER_STATUSES = (
 )
 
 
+def _publish_changed(organization_id: int, work_order_ids: list[int]) -> None:
+    """Tell live views (the dispatch board stream) which rows changed, once
+    the write commits."""
+    if work_order_ids:
+        change = WorkOrdersChanged(organization_id, tuple(work_order_ids))
+        after_commit(lambda: change_bus.publish(change))
+
+
 def create(organization_id: int, patch: dict) -> dict:
-    return insert_row("work_orders", {"organization_id": organization_id, **patch})
+    row = insert_row("work_orders", {"organization_id": organization_id, **patch})
+    _publish_changed(organization_id, [row["id"]])
+    return row
+
+
+# Matches the partial unique index uq_work_orders_org_external_ref.
+EXTERNAL_REF_CONFLICT = "ON CONFLICT (organization_id, external_ref) WHERE external_ref IS NOT NULL DO NOTHING"
+
+
+def create_many(organization_id: int, patches: list[dict]) -> list[dict]:
+    """Bulk create (CSV/webhook ingestion). A row whose external_ref already
+    exists in the org is skipped, so redelivered payloads never duplicate a
+    work order; the created rows come back in input order."""
+    rows = insert_rows(
+        "work_orders",
+        [{"organization_id": organization_id, **patch} for patch in patches],
+        on_conflict=EXTERNAL_REF_CONFLICT,
+    )
+    _publish_changed(organization_id, [row["id"] for row in rows])
+    return rows
+
+
+def ids_by_external_ref(organization_id: int, external_refs: list[str]) -> dict[str, int]:
+    if not external_refs:
+        return {}
+    rows = fetch_all(
+        """
+        SELECT id, external_ref
+        FROM work_orders
+        WHERE organization_id = :organization_id AND external_ref = ANY(CAST(:external_refs AS TEXT[]))
+        """,
+        {"organization_id": organization_id, "external_refs": list(external_refs)},
+    )
+    return {row["external_ref"]: row["id"] for row in rows}
 
 
 def get_by_id_in_org(work_order_id: int, organization_id: int) -> Optional[dict]:
@@ -28,10 +82,302 @@ def get_by_id_in_org(work_order_id: int, organization_id: int) -> Optional[dict]
 
 
 def update(work_order_id: int, organization_id: int, patch: dict) -> Optional[dict]:
-    return update_row("work_orders", patch, {"id": work_order_id, "organization_id": organization_id})
+    row = update_row("work_orders", patch, {"id": work_order_id, "organization_id": organization_id})
+    if row is not None:
+        _publish_changed(organization_id, [work_order_id])
+    return row
 
 
-def list_filtered(
+# Completion stamps proof when an attachment exists, otherwise records the
+# (manager-only) override reason; the gate refuses to close with neither.
+_COMPLETION_SET = """,
+        completed_at = now(),
+        completion_proof_verified_at = CASE WHEN checked.has_proof THEN now() END,
+        completion_override_reason = CASE WHEN checked.has_proof THEN NULL ELSE CAST(:override_reason AS TEXT) END,
+        completion_notes = COALESCE(CAST(:completion_notes AS TEXT), wo.completion_notes)"""
+_COMPLETION_GATE = "AND (checked.has_proof OR CAST(:override_reason AS TEXT) IS NOT NULL)"
+
+
+def transition_status(
+    organization_id: int,
+    work_order_id: int,
+    from_status: str,
+    to_status: str,
+    actor_user_id: int,
+    event_notes: Optional[str],
+    completion_notes: Optional[str] = None,
+    override_reason: Optional[str] = None,
+) -> Optional[dict]:
+    """Move a work order from ``from_status`` to ``to_status`` and write its
+    status_changed event in one statement. The UPDATE only matches while the
+    row is still in ``from_status``, so a concurrent transition makes it a
+    no-op instead of being overwritten.
+
+    Returns None when the work order does not exist, otherwise
+    ``{"current_status", "has_proof", "work_order"}`` where ``work_order`` is
+    the updated row, or None when nothing changed (status moved on, or a
+    completion had neither proof nor an override reason)."""
+    completing = to_status == "completed"
+    params = {
+        "organization_id": organization_id,
+        "work_order_id": work_order_id,
+        "from_status": from_status,
+        "to_status": to_status,
+        "actor_user_id": actor_user_id,
+        "event_notes": event_notes,
+    }
+    if completing:
+        params.update(completion_notes=completion_notes, override_reason=override_reason)
+    row = fetch_one_in_transaction(
+        f"""
+        WITH target AS (
+            SELECT status
+            FROM work_orders
+            WHERE id = :work_order_id AND organization_id = :organization_id
+        ),
+        proof AS (
+            SELECT EXISTS (
+                SELECT 1
+                FROM work_order_attachments
+                WHERE organization_id = :organization_id AND work_order_id = :work_order_id
+            ) AS has_proof
+        ),
+        updated AS (
+            UPDATE work_orders AS wo
+            SET status = :to_status{_COMPLETION_SET if completing else ""}
+            FROM proof AS checked
+            WHERE wo.id = :work_order_id
+              AND wo.organization_id = :organization_id
+              AND wo.status = :from_status
+              {_COMPLETION_GATE if completing else ""}
+            RETURNING wo.*
+        ),
+        event AS (
+            INSERT INTO work_order_events
+                (organization_id, work_order_id, event_type, actor_user_id, from_status, to_status, notes)
+            SELECT organization_id, id, 'status_changed', :actor_user_id, :from_status, :to_status, :event_notes
+            FROM updated
+        )
+        SELECT
+            (SELECT status FROM target) AS transition_current_status,
+            (SELECT has_proof FROM proof) AS transition_has_proof,
+            updated.*
+        FROM (SELECT 1) AS one
+        LEFT JOIN updated ON TRUE
+        """,
+        params,
+    )
+    current_status = row.pop("transition_current_status")
+    if current_status is None:
+        return None
+    has_proof = row.pop("transition_has_proof")
+    updated = row if row.get("id") is not None else None
+    if updated is not None:
+        _publish_changed(organization_id, [work_order_id])
+    return {
+        "current_status": current_status,
+        "has_proof": bool(has_proof),
+        "work_order": updated,
+    }
+
+
+def transition_status_many(
+    organization_id: int,
+    work_order_ids: list[int],
+    to_status: str,
+    from_statuses: list[str],
+    actor_user_id: int,
+    event_notes: Optional[str],
+    completion_notes: Optional[str] = None,
+    override_reason: Optional[str] = None,
+) -> list[dict]:
+    """Set-based transition_status: every requested work order of the org
+    that is in one of ``from_statuses`` (and passes the completion gate) moves
+    to ``to_status`` with its audit event, in one statement.
+
+    Returns one row per distinct requested id, in request order, with
+    ``previous_status`` (None when the id is not in the org), ``has_proof``
+    and ``updated`` (the new row, or None when it was left alone)."""
+    completing = to_status == "completed"
+    params = {
+        "organization_id": organization_id,
+        "work_order_ids": list(work_order_ids),
+        "to_status": to_status,
+        "from_statuses": list(from_statuses),
+        "actor_user_id": actor_user_id,
+        "event_notes": event_notes,
+    }
+    if completing:
+        params.update(completion_notes=completion_notes, override_reason=override_reason)
+    rows = fetch_all_in_transaction(
+        f"""
+        WITH requested AS (
+            SELECT id, MIN(position) AS position
+            FROM unnest(CAST(:work_order_ids AS BIGINT[])) WITH ORDINALITY AS r(id, position)
+            GROUP BY id
+        ),
+        target AS (
+            SELECT
+                wo.id,
+                wo.status,
+                EXISTS (
+                    SELECT 1
+                    FROM work_order_attachments a
+                    WHERE a.organization_id = wo.organization_id AND a.work_order_id = wo.id
+                ) AS has_proof
+            FROM work_orders wo
+            JOIN requested ON requested.id = wo.id
+            WHERE wo.organization_id = :organization_id
+        ),
+        updated AS (
+            UPDATE work_orders AS wo
+            SET status = :to_status{_COMPLETION_SET if completing else ""}
+            FROM target AS checked
+            WHERE wo.id = checked.id
+              AND wo.organization_id = :organization_id
+              AND wo.status = checked.status
+              AND checked.status = ANY(CAST(:from_statuses AS TEXT[]))
+              {_COMPLETION_GATE if completing else ""}
+            RETURNING wo.*, checked.status AS transition_previous_status
+        ),
+        events AS (
+            INSERT INTO work_order_events
+                (organization_id, work_order_id, event_type, actor_user_id, from_status, to_status, notes)
+            SELECT organization_id, id, 'status_changed', :actor_user_id, transition_previous_status, :to_status, :event_notes
+            FROM updated
+        )
+        SELECT
+            requested.id AS requested_id,
+            target.status AS requested_previous_status,
+            target.has_proof AS requested_has_proof,
+            updated.*
+        FROM requested
+        LEFT JOIN target ON target.id = requested.id
+        LEFT JOIN updated ON updated.id = requested.id
+        ORDER BY requested.position
+        """,
+        params,
+    )
+    return _publish_outcomes(organization_id, [_bulk_outcome(row) for row in rows])
+
+
+def reassign_many(
+    organization_id: int, work_order_ids: list[int], technician_id: int, actor_user_id: int, notes: Optional[str]
+) -> list[dict]:
+    """Set-based reassignment: every requested work order of the org not
+    already on ``technician_id`` moves to it with a 'reassigned' audit
+    event, in one statement. Same per-id result shape as
+    transition_status_many, plus ``previous_technician_id``."""
+    rows = fetch_all_in_transaction(
+        """
+        WITH requested AS (
+            SELECT id, MIN(position) AS position
+            FROM unnest(CAST(:work_order_ids AS BIGINT[])) WITH ORDINALITY AS r(id, position)
+            GROUP BY id
+        ),
+        target AS (
+            SELECT wo.id, wo.status, wo.assigned_technician_id
+            FROM work_orders wo
+            JOIN requested ON requested.id = wo.id
+            WHERE wo.organization_id = :organization_id
+        ),
+        updated AS (
+            UPDATE work_orders AS wo
+            SET assigned_technician_id = :technician_id
+            FROM target AS checked
+            WHERE wo.id = checked.id
+              AND wo.organization_id = :organization_id
+              AND wo.assigned_technician_id IS NOT DISTINCT FROM checked.assigned_technician_id
+              AND checked.assigned_technician_id IS DISTINCT FROM :technician_id
+            RETURNING wo.*
+        ),
+        events AS (
+            INSERT INTO work_order_events (organization_id, work_order_id, event_type, actor_user_id, notes)
+            SELECT organization_id, id, 'reassigned', :actor_user_id, :notes
+            FROM updated
+        )
+        SELECT
+            requested.id AS requested_id,
+            target.status AS requested_previous_status,
+            target.assigned_technician_id AS requested_previous_technician_id,
+            updated.*
+        FROM requested
+        LEFT JOIN target ON target.id = requested.id
+        LEFT JOIN updated ON updated.id = requested.id
+        ORDER BY requested.position
+        """,
+        {
+            "organization_id": organization_id,
+            "work_order_ids": list(work_order_ids),
+            "technician_id": technician_id,
+            "actor_user_id": actor_user_id,
+            "notes": notes,
+        },
+    )
+    return _publish_outcomes(organization_id, [_bulk_outcome(row) for row in rows])
+
+
+def _bulk_outcome(row: dict) -> dict:
+    """Split a bulk result row into the per-id facts and the updated row."""
+    outcome = {"work_order_id": row.pop("requested_id")}
+    for key in ("previous_status", "has_proof", "previous_technician_id"):
+        if f"requested_{key}" in row:
+            outcome[key] = row.pop(f"requested_{key}")
+    row.pop("transition_previous_status", None)
+    outcome["updated"] = row if row.get("id") is not None else None
+    return outcome
+
+
+def _publish_outcomes(organization_id: int, outcomes: list[dict]) -> list[dict]:
+    _publish_changed(organization_id, [outcome["work_order_id"] for outcome in outcomes if outcome["updated"]])
+    return outcomes
+
+
+def assign_many(organization_id: int, assignments: dict[int, int]) -> list[dict]:
+    """Set assigned_technician_id for many work orders in one statement.
+    ``assignments`` maps work_order_id -> technician_id."""
+    if not assignments:
+        return []
+    rows = fetch_all_in_transaction(
+        """
+        UPDATE work_orders AS wo
+        SET assigned_technician_id = v.technician_id
+        FROM unnest(CAST(:work_order_ids AS BIGINT[]), CAST(:technician_ids AS BIGINT[]))
+            AS v(work_order_id, technician_id)
+        WHERE wo.id = v.work_order_id
+          AND wo.organization_id = :organization_id
+        RETURNING wo.*
+        """,
+        {
+            "organization_id": organization_id,
+            "work_order_ids": list(assignments.keys()),
+            "technician_ids": list(assignments.values()),
+        },
+    )
+    _publish_changed(organization_id, [row["id"] for row in rows])
+    return rows
+
+
+def list_assignable(organization_id: int, work_order_ids: Optional[list[int]] = None, limit: int = 5000) -> list[dict]:
+    """Open, unassigned work orders (optionally only ``work_order_ids``),
+    oldest first -- the candidates for batch auto-assignment."""
+    id_filter = "AND id = ANY(CAST(:work_order_ids AS BIGINT[]))" if work_order_ids is not None else ""
+    return fetch_all(
+        f"""
+        SELECT *
+        FROM work_orders
+        WHERE organization_id = :organization_id
+          AND status = 'open'
+          AND assigned_technician_id IS NULL
+          {id_filter}
+        ORDER BY created_at, id
+        LIMIT :limit
+        """,
+        {"organization_id": organization_id, "work_order_ids": work_order_ids, "limit": limit},
+    )
+
+
+def _filter_clauses(
     organization_id: int,
     status: Optional[str] = None,
     technician_id: Optional[int] = None,
@@ -41,8 +387,7 @@ def list_filtered(
     customer_name: Optional[str] = None,
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
-) -> list[dict]:
-    """RF-21: combined filter by status, technician, customer, date range."""
+) -> tuple[list[str], dict]:
     where = ["organization_id = :organization_id"]
     params = {"organization_id": organization_id}
 
@@ -70,66 +415,146 @@ def list_filtered(
     if date_to:
         where.append("created_at <= :date_to")
         params["date_to"] = date_to
+    return where, params
+
 
+def list_filtered(
+    organization_id: int,
+    status: Optional[str] = None,
+    technician_id: Optional[int] = None,
+    property_id: Optional[int] = None,
+    client_id: Optional[int] = None,
+    vendor_id: Optional[int] = None,
+    customer_name: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> list[dict]:
+    """RF-21: combined filter by status, technician, customer, date range."""
+    where, params = _filter_clauses(
+        organization_id, status, technician_id, property_id, client_id, vendor_id, customer_name, date_from, date_to
+    )
     return fetch_all(
         f"SELECT * FROM work_orders WHERE {' AND '.join(where)} ORDER BY created_at DESC",
         params,
     )
 
 
-def list_for_technician(organization_id: int, technician_id: int) -> list[dict]:
-    """RF-22: technician's assigned work orders ordered by priority."""
+def iter_by_org(organization_id: int) -> Iterator[dict]:
+    """Every work order in the org, newest first, streamed for the tenant export."""
+    return fetch_iter(
+        "SELECT * FROM work_orders WHERE organization_id = :organization_id ORDER BY created_at DESC",
+        {"organization_id": organization_id},
+    )
+
+
+def list_filtered_page(
+    organization_id: int,
+    limit: int,
+    after: Optional[tuple[datetime, int]] = None,
+    columns: Optional[list[str]] = None,
+    status: Optional[str] = None,
+    technician_id: Optional[int] = None,
+    property_id: Optional[int] = None,
+    client_id: Optional[int] = None,
+    vendor_id: Optional[int] = None,
+    customer_name: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> list[dict]:
+    """RF-21 keyset page, newest first over (created_at, id). ``after`` is the
+    (created_at, id) of the last row of the previous page; ``columns`` limits
+    the SELECT list and must already be validated against the work-order
+    schema. Fetches one extra row so callers can tell whether a next page
+    exists."""
+    where, params = _filter_clauses(
+        organization_id, status, technician_id, property_id, client_id, vendor_id, customer_name, date_from, date_to
+    )
+    if after is not None:
+        where.append("(created_at, id) < (:after_created_at, :after_id)")
+        params["after_created_at"], params["after_id"] = after
+    params["limit"] = limit + 1
+
+    select_list = "*"
+    if columns:
+        if not all(column.isidentifier() for column in columns):
+            raise ValueError("Unsafe work-order column in projection")
+        select_list = ", ".join(dict.fromkeys(["id", "created_at", *columns]))
+
     return fetch_all(
-        """
-        SELECT *
+        f"""
+        SELECT {select_list}
         FROM work_orders
-        WHERE organization_id = :organization_id
-          AND assigned_technician_id = :technician_id
-          AND status IN ('open', 'in_progress', 'paused', 'escalated')
-        ORDER BY CASE priority
-            WHEN 'emergency' THEN 0
-            WHEN 'high' THEN 1
-            WHEN 'medium' THEN 2
-            WHEN 'low' THEN 3
-            ELSE 99
-        END, created_at DESC
+        WHERE {' AND '.join(where)}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
         """,
-        {"organization_id": organization_id, "technician_id": technician_id},
+        params,
     )
 
 
-def counts_by_status(organization_id: int) -> dict[str, int]:
-    rows = fetch_all(
-        """
-        SELECT status, COUNT(*) AS count
-        FROM work_orders
-        WHERE organization_id = :organization_id
-        GROUP BY status
-        """,
-        {"organization_id": organization_id},
+TECHNICIAN_QUEUE_SQL = """
+    SELECT *
+    FROM work_orders
+    WHERE organization_id = :organization_id
+      AND assigned_technician_id = :technician_id
+      AND status IN ('open', 'in_progress', 'paused', 'escalated')
+    ORDER BY CASE priority
+        WHEN 'emergency' THEN 0
+        WHEN 'high' THEN 1
+        WHEN 'medium' THEN 2
+        WHEN 'low' THEN 3
+        ELSE 99
+    END, created_at DESC
+"""
+
+
+def list_for_technician(organization_id: int, technician_id: int) -> list[dict]:
+    """RF-22: technician's assigned work orders ordered by priority."""
+    return fetch_all(TECHNICIAN_QUEUE_SQL, {"organization_id": organization_id, "technician_id": technician_id})
+
+
+async def list_for_technician_async(organization_id: int, technician_id: int) -> list[dict]:
+    """RF-22 on the asyncio engine -- the technician app polls this constantly."""
+    return await async_database.fetch_all(
+        TECHNICIAN_QUEUE_SQL, {"organization_id": organization_id, "technician_id": technician_id}
     )
-    counts = {status: 0 for status in ALL_WORK_ORDER_STATUSES}
-    for row in rows:
-        status_value = row.get("status")
-        if status_value in counts:
-            counts[status_value] = int(row.get("count") or 0)
-    return counts
 
 
-def count_sla_at_risk(organization_id: int) -> int:
+def dashboard_counts(organization_id: int) -> dict[str, int]:
+    """Status counts, the SLA-at-risk count and technician totals for the
+    dashboard in one round-trip. Technicians are counted over the same
+    technicians/users join as ``technicians_repo.list_by_org``."""
     soon = datetime.now(timezone.utc) + timedelta(hours=2)
-    count = fetch_scalar(
-        """
-        SELECT COUNT(*)
-        FROM work_orders
-        WHERE organization_id = :organization_id
-          AND status IN ('open', 'in_progress', 'escalated')
-          AND sla_due_at IS NOT NULL
-          AND sla_due_at <= :soon
+    status_columns = ",\n                ".join(
+        f"COUNT(*) FILTER (WHERE status = '{status}') AS {status}_count" for status in ALL_WORK_ORDER_STATUSES
+    )
+    row = fetch_one(
+        f"""
+        WITH work_order_counts AS (
+            SELECT
+                COUNT(*) AS total_work_orders,
+                {status_columns},
+                COUNT(*) FILTER (
+                    WHERE status IN ('open', 'in_progress', 'escalated')
+                      AND sla_due_at IS NOT NULL
+                      AND sla_due_at <= :soon
+                ) AS sla_at_risk_count
+            FROM work_orders
+            WHERE organization_id = :organization_id
+        ),
+        technician_counts AS (
+            SELECT
+                COUNT(*) AS total_technicians_count,
+                COUNT(*) FILTER (WHERE t.availability_status = 'available') AS active_technicians_count
+            FROM technicians t
+            JOIN users u ON u.id = t.user_id AND u.organization_id = t.organization_id
+            WHERE t.organization_id = :organization_id
+        )
+        SELECT * FROM work_order_counts CROSS JOIN technician_counts
         """,
         {"organization_id": organization_id, "soon": soon},
     )
-    return int(count or 0)
+    return {key: int(value or 0) for key, value in (row or {}).items()}
 
 
 def list_stale_work_orders(
@@ -167,134 +592,33 @@ def list_stale_work_orders(
     )
 
 
-def list_overloaded_technicians(organization_id: int, limit: int = 20) -> list[dict]:
+def active_counts_by_technician(organization_id: int) -> list[dict]:
+    """Per-technician, per-status counts of active work -- one grouped
+    index-only scan instead of loading the work orders themselves."""
     return fetch_all(
         """
-        SELECT
-            t.id AS technician_id,
-            t.user_id,
-            u.full_name,
-            u.email,
-            t.availability_status,
-            t.max_daily_jobs,
-            COUNT(wo.id) AS active_work_order_count
-        FROM technicians t
-        JOIN users u ON u.id = t.user_id AND u.organization_id = t.organization_id
-        LEFT JOIN work_orders wo
-            ON wo.assigned_technician_id = t.id
-           AND wo.organization_id = t.organization_id
-           AND wo.status IN ('open', 'in_progress', 'escalated')
-        WHERE t.organization_id = :organization_id
-        GROUP BY t.id, t.user_id, u.full_name, u.email, t.availability_status, t.max_daily_jobs
-        HAVING COUNT(wo.id) > t.max_daily_jobs
-        ORDER BY active_work_order_count DESC, t.max_daily_jobs ASC
-        LIMIT :limit
-        """,
-        {"organization_id": organization_id, "limit": limit},
-    )
-
-
-def list_property_hotspots(
-    organization_id: int,
-    since_days: int = 90,
-    limit: int = 10,
-) -> list[dict]:
-    cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
-    return fetch_all(
-        """
-        SELECT
-            p.id AS property_id,
-            p.name AS property_name,
-            p.address_line1,
-            COUNT(wo.id) AS total_work_orders,
-            SUM(CASE WHEN wo.status = 'open' THEN 1 ELSE 0 END) AS open_count,
-            SUM(CASE WHEN wo.status = 'in_progress' THEN 1 ELSE 0 END) AS in_progress_count,
-            SUM(CASE WHEN wo.status = 'completed' THEN 1 ELSE 0 END) AS completed_count,
-            MAX(wo.created_at) AS latest_work_order_at
-        FROM properties p
-        JOIN work_orders wo
-            ON wo.property_id = p.id
-           AND wo.organization_id = p.organization_id
-           AND wo.created_at >= :cutoff
-        WHERE p.organization_id = :organization_id
-        GROUP BY p.id, p.name, p.address_line1
-        HAVING COUNT(wo.id) > 0
-        ORDER BY total_work_orders DESC, latest_work_order_at DESC
-        LIMIT :limit
-        """,
-        {"organization_id": organization_id, "cutoff": cutoff, "limit": limit},
-    )
-
-
-def list_completion_cycles(
-    organization_id: int,
-    since_days: int = 90,
-    limit: int = 10,
-) -> list[dict]:
-    cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
-    return fetch_all(
-        """
-        SELECT
-            COALESCE(NULLIF(service_type, ''), 'general') AS service_type,
-            COUNT(id) AS completed_count,
-            ROUND(AVG(EXTRACT(EPOCH FROM (completed_at - created_at)) / 3600.0)::numeric, 1)
-                AS average_cycle_hours,
-            ROUND(MIN(EXTRACT(EPOCH FROM (completed_at - created_at)) / 3600.0)::numeric, 1)
-                AS fastest_cycle_hours,
-            ROUND(MAX(EXTRACT(EPOCH FROM (completed_at - created_at)) / 3600.0)::numeric, 1)
-                AS slowest_cycle_hours,
-            MAX(completed_at) AS latest_completed_at
-        FROM work_orders
-        WHERE organization_id = :organization_id
-          AND status = 'completed'
-          AND completed_at IS NOT NULL
-          AND completed_at >= :cutoff
-          AND completed_at >= created_at
-        GROUP BY COALESCE(NULLIF(service_type, ''), 'general')
-        HAVING COUNT(id) > 0
-        ORDER BY average_cycle_hours DESC, completed_count DESC
-        LIMIT :limit
-        """,
-        {"organization_id": organization_id, "cutoff": cutoff, "limit": limit},
-    )
-
-
-def list_cost_summary(
-    organization_id: int,
-    since_days: int = 90,
-    limit: int = 10,
-) -> list[dict]:
-    """v1.3 cost trend foundation grouped by service type."""
-    cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
-    return fetch_all(
-        """
-        SELECT
-            COALESCE(NULLIF(service_type, ''), 'general') AS service_type,
-            COUNT(id) AS work_order_count,
-            COALESCE(SUM(estimated_cost_cents), 0) AS estimated_cost_cents,
-            COALESCE(SUM(actual_cost_cents), 0) AS actual_cost_cents,
-            COALESCE(SUM(actual_cost_cents), 0) - COALESCE(SUM(estimated_cost_cents), 0)
-                AS variance_cents,
-            ROUND(AVG(actual_cost_cents)::numeric, 0) AS average_actual_cost_cents,
-            COUNT(invoice_reference) AS invoice_reference_count,
-            MAX(created_at) AS latest_work_order_at
+        SELECT assigned_technician_id AS technician_id, status, COUNT(*) AS count
         FROM work_orders
         WHERE organization_id = :organization_id
-          AND created_at >= :cutoff
-          AND (estimated_cost_cents IS NOT NULL OR actual_cost_cents IS NOT NULL)
-        GROUP BY COALESCE(NULLIF(service_type, ''), 'general')
-        HAVING COUNT(id) > 0
-        ORDER BY actual_cost_cents DESC, estimated_cost_cents DESC, work_order_count DESC
-        LIMIT :limit
+          AND assigned_technician_id IS NOT NULL
+          AND status IN ('open', 'in_progress', 'paused', 'escalated')
+        GROUP BY assigned_technician_id, status
         """,
-        {"organization_id": organization_id, "cutoff": cutoff, "limit": limit},
+        {"organization_id": organization_id},
     )
 
 
-def list_dispatch_board_work_orders(organization_id: int) -> list[dict]:
-    """v1.3 dispatch board: active work enriched with PMC context."""
+def list_dispatch_board_work_orders(organization_id: int, work_order_ids: Optional[list[int]] = None) -> list[dict]:
+    """v1.3 dispatch board: active work enriched with PMC context. With
+    ``work_order_ids``, only those rows (the ones no longer active are
+    simply absent)."""
+    params: dict = {"organization_id": organization_id}
+    id_filter = ""
+    if work_order_ids is not None:
+        id_filter = "AND wo.id = ANY(CAST(:work_order_ids AS BIGINT[]))"
+        params["work_order_ids"] = list(work_order_ids)
     return fetch_all(
-        """
+        f"""
         SELECT
             wo.id,
             wo.title,
@@ -321,6 +645,7 @@ def list_dispatch_board_work_orders(organization_id: int) -> list[dict]:
            AND v.organization_id = wo.organization_id
         WHERE wo.organization_id = :organization_id
           AND wo.status IN ('open', 'in_progress', 'paused', 'escalated')
+          {id_filter}
         ORDER BY
             CASE
                 WHEN wo.sla_due_at IS NOT NULL AND wo.sla_due_at <= NOW() THEN 0
@@ -336,7 +661,7 @@ def list_dispatch_board_work_orders(organization_id: int) -> list[dict]:
             END,
             wo.created_at ASC
         """,
-        {"organization_id": organization_id},
+        params,
     )
 
 
@@ -1,7 +1,7 @@
 """Client management for PMC operations."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
 
 from dependencies import get_current_organization, require_roles
 from models.client import Client, ClientCreate, ClientUpdate
@@ -38,9 +38,9 @@ def export_clients(
     current_user: User = Depends(require_roles("org_admin", "coordinator")),
     organization: dict = Depends(get_current_organization),
 ):
-    rows = clients_repo.list_by_org(organization["id"], active_only=active_only)
-    return PlainTextResponse(
-        entity_export_service.build_clients_csv(rows),
+    rows = clients_repo.iter_by_org(organization["id"], active_only=active_only)
+    return StreamingResponse(
+        entity_export_service.iter_clients_csv(rows),
         media_type="text/csv",
         headers={"Content-Disposition": 'attachment; filename="techsync-clients.csv"'},
     )
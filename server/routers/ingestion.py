@@ -1,63 +1,101 @@
 """Data ingestion endpoints: CSV upload and external webhook (RF-09, RF-11, RF-12)."""
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, status
+from typing import Annotated, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import ValidationError
 
+from core.config import settings
 from dependencies import get_current_organization, get_organization_from_api_key, require_roles
-from logger import logger
-from models.ingestion import IngestionResult, WebhookWorkOrderPayload
+from models.ingestion import (
+    IngestionJob,
+    IngestionJobAccepted,
+    IngestionResult,
+    WebhookBatchPayload,
+    WebhookBatchResult,
+    WebhookWorkOrderPayload,
+)
 from models.user import User
 from services import ingestion_service
 
 router = APIRouter(prefix="/ingestion", tags=["ingestion"])
 
 
-@router.post("/csv", response_model=IngestionResult)
+@router.post("/csv", response_model=Union[IngestionResult, IngestionJobAccepted])
 async def ingest_csv(
     file: UploadFile,
+    response: Response,
+    run_async: Annotated[bool, Query(alias="async")] = False,
     current_user: User = Depends(require_roles("org_admin", "coordinator")),
     organization: dict = Depends(get_current_organization),
 ):
     """RF-09: bulk-create work orders from an uploaded CSV file. Every row is
     validated independently (RF-12) -- a bad row is reported back, it does not
-    abort the rest of the batch."""
+    abort the rest of the batch. The upload is parsed and persisted in batches
+    straight from the spooled file, so it is never held in memory whole.
+
+    With ``?async=true`` the file is only validated here: the rows are queued
+    as an ingestion job and the response is 202 with the job id to poll at
+    GET /ingestion/jobs/{job_id}."""
     if not file.filename or not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File must be a .csv")
 
-    content = await file.read()
     try:
-        rows, row_errors = ingestion_service.parse_csv_rows(content)
+        if not run_async:
+            return await run_in_threadpool(ingestion_service.ingest_csv, organization["id"], current_user.id, file.file)
+        job = await run_in_threadpool(ingestion_service.enqueue_csv, organization["id"], current_user.id, file.file)
     except (ValueError, UnicodeDecodeError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
-    result = ingestion_service.ingest_rows(organization["id"], current_user.id, rows, source="csv")
-    result.failed_count = len(row_errors)
-    result.failed_rows = row_errors
-    return result
+    response.status_code = status.HTTP_202_ACCEPTED
+    return IngestionJobAccepted(detail="CSV accepted, work orders are being created", status=job.status, job_id=job.id)
+
 
+@router.get("/jobs/{job_id}", response_model=IngestionJob)
+def get_ingestion_job(
+    job_id: int,
+    current_user: User = Depends(require_roles("org_admin", "coordinator")),
+    organization: dict = Depends(get_current_organization),
+):
+    """Progress, created work order ids and row errors for a background
+    ingestion job (async CSV upload or webhook delivery)."""
+    job = ingestion_service.get_job(organization["id"], job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ingestion job not found")
+    return job
 
-@router.post("/webhook", status_code=status.HTTP_202_ACCEPTED)
-async def ingest_webhook(
+
+@router.post("/webhook", status_code=status.HTTP_202_ACCEPTED, response_model=IngestionJobAccepted)
+def ingest_webhook(
     payload: dict,
-    background_tasks: BackgroundTasks,
     organization: dict = Depends(get_organization_from_api_key),
 ):
     """RF-11: external systems create work orders via API webhook, authenticated
     with a per-organization API key (see POST /organizations/me/api-key/regenerate).
-    Responds 202 immediately and processes the payload in the background."""
+    Responds 202 once the payload is durably queued as an ingestion job; a
+    background worker creates the work order."""
     try:
         row = WebhookWorkOrderPayload(**payload)
     except ValidationError as exc:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=exc.errors())
 
-    def _process():
-        try:
-            ingestion_service.ingest_rows(organization["id"], None, [row], source="webhook")
-        except Exception:
-            logger.exception(
-                "ingestion.webhook_failed",
-                extra={"event": "webhook_ingestion_failed", "organization_id": organization["id"]},
-            )
-
-    background_tasks.add_task(_process)
-    return {"detail": "Webhook accepted, work order is being created", "status": "queued"}
+    job = ingestion_service.enqueue_rows(organization["id"], None, [row], source="webhook")
+    return IngestionJobAccepted(detail="Webhook accepted, work order is being created", status=job.status, job_id=job.id)
+
+
+@router.post("/webhook/batch", response_model=WebhookBatchResult)
+def ingest_webhook_batch(
+    payload: WebhookBatchPayload,
+    organization: dict = Depends(get_organization_from_api_key),
+):
+    """RF-11 (batch): create up to INGESTION_WEBHOOK_BATCH_MAX work orders in
+    one call. Items are idempotent on ``external_ref``: re-sending a batch
+    reports the already-created orders as duplicates instead of inserting
+    them again. Results are returned per item, in request order."""
+    if len(payload.items) > settings.INGESTION_WEBHOOK_BATCH_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Batch exceeds the maximum of {settings.INGESTION_WEBHOOK_BATCH_MAX} items",
+        )
+    return ingestion_service.ingest_webhook_batch(organization["id"], payload.items)
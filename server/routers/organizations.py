@@ -1,13 +1,14 @@
 """Organization onboarding, settings, and tenant lifecycle (RF-05, RF-06, RF-08, RNF-13)."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 
 from core.rate_limit import ONBOARD_RATE_LIMIT, rate_limit_dependency
 from core.security import get_password_hash
+from database import savepoint
 from dependencies import get_current_organization, require_roles
 from logger import logger
+from models.export_job import ExportJob, ExportJobCreate
 from models.organization import (
     Organization,
     OrganizationOnboard,
@@ -17,7 +18,7 @@ from models.organization import (
 from models.user import User
 from repositories import organizations as organizations_repo
 from repositories import users as users_repo
-from services import auth_service, tenant_export_service
+from services import auth_service, export_job_service, export_storage_service, tenant_export_service
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
 
@@ -38,13 +39,14 @@ def onboard(payload: OrganizationOnboard):
     )
 
     try:
-        user_row = users_repo.create_user(
-            organization_id=org_row["id"],
-            email=payload.admin_email,
-            password_hash=get_password_hash(payload.admin_password),
-            full_name=payload.admin_full_name,
-            role="org_admin",
-        )
+        with savepoint():
+            user_row = users_repo.create_user(
+                organization_id=org_row["id"],
+                email=payload.admin_email,
+                password_hash=get_password_hash(payload.admin_password),
+                full_name=payload.admin_full_name,
+                role="org_admin",
+            )
     except Exception:
         organizations_repo.hard_delete(org_row["id"])
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
@@ -111,13 +113,64 @@ def export_my_organization(
     current_user: User = Depends(require_roles("org_admin")),
     organization: dict = Depends(get_current_organization),
 ):
-    """RNF-13/RNF backup-export: tenant-owned JSON export without secrets."""
-    return JSONResponse(
-        jsonable_encoder(tenant_export_service.build_tenant_export(organization)),
+    """RNF-13/RNF backup-export: tenant-owned JSON export without secrets,
+    streamed as it is read so tenants of any size export in bounded memory."""
+    return StreamingResponse(
+        tenant_export_service.iter_tenant_export(organization),
+        media_type="application/json",
         headers={"Content-Disposition": 'attachment; filename="techsync-tenant-export.json"'},
     )
 
 
+@router.post("/me/exports", response_model=ExportJob, status_code=status.HTTP_202_ACCEPTED)
+def create_export(
+    payload: ExportJobCreate,
+    current_user: User = Depends(require_roles("org_admin")),
+    organization: dict = Depends(get_current_organization),
+):
+    """RNF-13: queue an export for the background worker instead of holding
+    the request open while it is written. Poll GET /me/exports/{export_id}."""
+    try:
+        return export_job_service.enqueue_export(organization["id"], current_user.id, payload.kind)
+    except export_job_service.TooManyExports as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc))
+
+
+@router.get("/me/exports/{export_id}", response_model=ExportJob)
+def get_export(
+    export_id: int,
+    current_user: User = Depends(require_roles("org_admin")),
+    organization: dict = Depends(get_current_organization),
+):
+    job = export_job_service.get_job(organization["id"], export_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not found")
+    return job
+
+
+@router.get("/me/exports/{export_id}/download")
+def download_export(
+    export_id: int,
+    current_user: User = Depends(require_roles("org_admin")),
+    organization: dict = Depends(get_current_organization),
+):
+    """The finished artifact, with HTTP Range support for resumed downloads.
+    Artifacts in object storage are served by a redirect to a presigned URL."""
+    job = export_job_service.get_artifact(organization["id"], export_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not ready")
+    if job["storage_backend"] == "s3":
+        return RedirectResponse(
+            export_storage_service.presigned_url(job["storage_key"], job["file_name"]),
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+        )
+    return FileResponse(
+        export_storage_service.local_path(job["storage_key"]),
+        media_type=job["content_type"],
+        filename=job["file_name"],
+    )
+
+
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 def delete_my_organization(
     current_user: User = Depends(require_roles("org_admin")),
@@ -3,7 +3,7 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
 
 from dependencies import get_current_organization, require_roles
 from models.property import Property, PropertyCreate, PropertyUpdate
@@ -53,11 +53,11 @@ def export_properties(
     current_user: User = Depends(require_roles("org_admin", "coordinator")),
     organization: dict = Depends(get_current_organization),
 ):
-    rows = properties_repo.list_by_org(
+    rows = properties_repo.iter_by_org(
         organization["id"], client_id=client_id, active_only=active_only
     )
-    return PlainTextResponse(
-        entity_export_service.build_properties_csv(rows),
+    return StreamingResponse(
+        entity_export_service.iter_properties_csv(rows),
         media_type="text/csv",
         headers={"Content-Disposition": 'attachment; filename="techsync-properties.csv"'},
     )
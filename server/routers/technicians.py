@@ -1,13 +1,15 @@
 """Technician management (RF-26, RF-29)."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from dependencies import get_current_organization, require_roles
-from models.technician import Technician, TechnicianCreate, TechnicianUpdate
+from models.technician import NearbyTechnician, Technician, TechnicianCreate, TechnicianUpdate
 from models.user import User
 from repositories import technicians as technicians_repo
 from repositories import users as users_repo
-from services import technician_service
+from services import roster_service, spatial_index_service, technician_service, workload_service
 from services.billing_service import PlanLimitExceeded
 
 router = APIRouter(prefix="/technicians", tags=["technicians"])
@@ -42,6 +44,41 @@ def list_technicians(
     return [Technician(**technician_service.to_technician_response_dict(row)) for row in rows]
 
 
+@router.get("/nearby", response_model=list[NearbyTechnician])
+def list_nearby_technicians(
+    latitude: Annotated[float, Query(ge=-90, le=90)],
+    longitude: Annotated[float, Query(ge=-180, le=180)],
+    k: Annotated[int, Query(ge=1, le=100)] = 10,
+    radius_km: Annotated[float, Query(gt=0, le=20000)] = 50,
+    service_type: Optional[str] = None,
+    current_user: User = Depends(require_roles("org_admin", "coordinator")),
+    organization: dict = Depends(get_current_organization),
+):
+    """RF-14 dispatch helper: the ``k`` nearest available technicians within
+    ``radius_km`` who still have capacity today (and, when ``service_type`` is
+    given, list it as a skill), nearest first."""
+    technicians = roster_service.get_snapshot(organization["id"]).by_id
+    active_counts = workload_service.get_snapshot(organization["id"]).active_counts()
+
+    def eligible(technician_id: int) -> bool:
+        technician = technicians.get(technician_id)
+        if technician is None or technician.get("availability_status") != "available":
+            return False
+        if service_type and service_type not in (technician.get("skills") or []):
+            return False
+        return active_counts.get(technician_id, 0) < (technician.get("max_daily_jobs") or 8)
+
+    index = spatial_index_service.get_index(organization["id"], technicians.values())
+    return [
+        NearbyTechnician(
+            **technician_service.to_technician_response_dict(technicians[technician_id]),
+            distance_km=round(distance_km, 3),
+            active_work_order_count=active_counts.get(technician_id, 0),
+        )
+        for technician_id, distance_km in index.nearest(latitude, longitude, k, radius_km, eligible=eligible)
+    ]
+
+
 @router.patch("/{technician_id}", response_model=Technician)
 def update_technician(
     technician_id: int,
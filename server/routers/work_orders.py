@@ -1,8 +1,11 @@
 """Work order CRUD, status transitions, assignment, audit log, attachments,
 and search/filter (RF-14, RF-15, RF-18, RF-19, RF-20, RF-21, RF-22, RF-24)."""
 
+import base64
+import binascii
+import json
 from datetime import date, datetime, timezone
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional, Union
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import HTMLResponse, PlainTextResponse, Response
@@ -17,9 +20,17 @@ from models.work_order import (
     WorkOrderApprovalRequest,
     WorkOrderAttachment,
     WorkOrderAttachmentCreate,
+    WorkOrderAutoAssignBatch,
+    WorkOrderAutoAssignBatchResult,
+    WorkOrderAssignment,
+    WorkOrderBulkAssign,
+    WorkOrderBulkItemResult,
+    WorkOrderBulkResult,
+    WorkOrderBulkStatusUpdate,
     WorkOrderCreate,
     WorkOrderDuplicateWarning,
     WorkOrderEvent,
+    WorkOrderPage,
     WorkOrderStatusUpdate,
     WorkOrderUpdate,
 )
@@ -36,6 +47,10 @@ from services import attachment_storage_service, closeout_export_service, work_o
 
 router = APIRouter(prefix="/work-orders", tags=["work-orders"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+PROJECTABLE_FIELDS = frozenset(WorkOrder.model_fields)
+
 
 def _load_caller_technician(current_user: User, organization_id: int) -> Optional[dict]:
     if current_user.role != "technician":
@@ -142,6 +157,34 @@ def _validate_entity_links(organization_id: int, patch: dict) -> None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Vendor not found")
 
 
+def _encode_cursor(row: dict) -> str:
+    created_at = row["created_at"]
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = json.dumps([created_at, row["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, work_order_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(work_order_id)
+    except (binascii.Error, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _parse_fields(fields: str) -> list[str]:
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - PROJECTABLE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown work order fields: {', '.join(unknown)}",
+        )
+    return requested
+
+
 def _get_accessible_work_order(work_order_id: int, current_user: User, organization: dict) -> dict:
     work_order = work_orders_repo.get_by_id_in_org(work_order_id, organization["id"])
     if not work_order:
@@ -221,7 +264,7 @@ def create_work_order(
     return WorkOrder(**work_order)
 
 
-@router.get("", response_model=list[WorkOrder])
+@router.get("", response_model=Union[list[WorkOrder], WorkOrderPage])
 def list_work_orders(
     status_filter: Optional[str] = Query(None, alias="status"),
     technician_id: Optional[int] = None,
@@ -231,17 +274,27 @@ def list_work_orders(
     customer_name: Optional[str] = None,
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE)] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     organization: dict = Depends(get_current_organization),
 ):
     """RF-21: combined filter by status, technician, customer, and date range.
     Technicians are always scoped to their own assignments regardless of the
-    technician_id filter passed in."""
+    technician_id filter passed in.
+
+    Passing ``limit``, ``cursor`` or ``fields`` switches to keyset pagination
+    (newest first) and returns a WorkOrderPage; ``fields`` is a comma-separated
+    column projection. Without them the full list is returned as before."""
+    paginated = limit is not None or cursor is not None or fields is not None
+
     if current_user.role == "technician":
         technician = _load_caller_technician(current_user, organization["id"])
         technician_id = technician["id"] if technician else -1
         if (
-            technician
+            not paginated
+            and technician
             and status_filter is None
             and property_id is None
             and client_id is None
@@ -259,30 +312,45 @@ def list_work_orders(
         vendor = _load_caller_vendor(current_user, organization["id"])
         vendor_id = vendor["id"] if vendor else -1
 
-    rows = work_orders_repo.list_filtered(
+    filters = {
+        "status": status_filter,
+        "technician_id": technician_id,
+        "property_id": property_id,
+        "client_id": client_id,
+        "vendor_id": vendor_id,
+        "customer_name": customer_name,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    if not paginated:
+        rows = work_orders_repo.list_filtered(organization["id"], **filters)
+        return [WorkOrder(**row) for row in rows]
+
+    page_size = limit or DEFAULT_PAGE_SIZE
+    columns = _parse_fields(fields) if fields else None
+    rows = work_orders_repo.list_filtered_page(
         organization["id"],
-        status=status_filter,
-        technician_id=technician_id,
-        property_id=property_id,
-        client_id=client_id,
-        vendor_id=vendor_id,
-        customer_name=customer_name,
-        date_from=date_from,
-        date_to=date_to,
+        limit=page_size,
+        after=_decode_cursor(cursor) if cursor else None,
+        columns=columns,
+        **filters,
     )
-    return [WorkOrder(**row) for row in rows]
+    next_cursor = _encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+    items = rows[:page_size] if columns else [WorkOrder(**row).model_dump() for row in rows[:page_size]]
+    return WorkOrderPage(items=items, next_cursor=next_cursor)
 
 
 @router.get("/mine", response_model=list[WorkOrder])
-def list_my_work_orders(
+async def list_my_work_orders(
     current_user: User = Depends(require_roles("technician")),
     organization: dict = Depends(get_current_organization),
 ):
-    """RF-22: technician's assigned work orders, ordered by priority."""
-    technician = _load_caller_technician(current_user, organization["id"])
+    """RF-22: technician's assigned work orders, ordered by priority. Served
+    from the asyncio engine because technician devices poll it."""
+    technician = await technicians_repo.get_by_user_id_async(current_user.id, organization["id"])
     if not technician:
         return []
-    rows = work_orders_repo.list_for_technician(organization["id"], technician["id"])
+    rows = await work_orders_repo.list_for_technician_async(organization["id"], technician["id"])
     return [WorkOrder(**row) for row in rows]
 
 
@@ -310,6 +378,76 @@ def check_duplicate_warnings(
     return [WorkOrderDuplicateWarning(**row) for row in rows]
 
 
+@router.post("/auto-assign-batch", response_model=WorkOrderAutoAssignBatchResult)
+def auto_assign_batch(
+    payload: WorkOrderAutoAssignBatch,
+    current_user: User = Depends(require_roles("org_admin", "coordinator")),
+    organization: dict = Depends(get_current_organization),
+):
+    """RF-14 (batch): assign many open, unassigned work orders at once with an
+    optimal matching that respects technician capacity and priority order,
+    instead of one greedy pick per order."""
+    candidates = work_orders_repo.list_assignable(organization["id"], payload.work_order_ids)
+    assigned = work_order_service.auto_assign_batch(organization["id"], candidates)
+
+    assigned_ids = {row["id"] for row in assigned}
+    candidate_ids = {row["id"] for row in candidates}
+    return WorkOrderAutoAssignBatchResult(
+        assigned_count=len(assigned),
+        assignments=[
+            WorkOrderAssignment(work_order_id=row["id"], technician_id=row["assigned_technician_id"]) for row in assigned
+        ],
+        unassigned_work_order_ids=[row["id"] for row in candidates if row["id"] not in assigned_ids],
+        skipped_work_order_ids=[
+            work_order_id for work_order_id in dict.fromkeys(payload.work_order_ids or []) if work_order_id not in candidate_ids
+        ],
+    )
+
+
+def _bulk_result(outcomes: list[dict]) -> WorkOrderBulkResult:
+    return WorkOrderBulkResult(
+        updated_count=sum(1 for outcome in outcomes if outcome["outcome"] == "updated"),
+        results=[WorkOrderBulkItemResult(**outcome) for outcome in outcomes],
+    )
+
+
+@router.post("/bulk/status", response_model=WorkOrderBulkResult)
+def bulk_update_status(
+    payload: WorkOrderBulkStatusUpdate,
+    current_user: User = Depends(require_roles("org_admin", "coordinator")),
+    organization: dict = Depends(get_current_organization),
+):
+    """RF-18 (bulk): transition many work orders in one call, e.g. the
+    month-end archive run. Orders that cannot move are reported per id
+    instead of failing the whole request."""
+    outcomes = work_order_service.bulk_transition_status(
+        organization["id"],
+        payload.work_order_ids,
+        payload.status,
+        current_user.id,
+        payload.notes,
+        completion_override_reason=payload.completion_override_reason,
+    )
+    return _bulk_result(outcomes)
+
+
+@router.post("/bulk/assign", response_model=WorkOrderBulkResult)
+def bulk_assign(
+    payload: WorkOrderBulkAssign,
+    current_user: User = Depends(require_roles("org_admin", "coordinator")),
+    organization: dict = Depends(get_current_organization),
+):
+    """RF-15 (bulk): reassign many work orders to one technician, e.g. to
+    rebalance an absent technician's queue."""
+    try:
+        outcomes = work_order_service.bulk_reassign(
+            organization["id"], payload.work_order_ids, payload.technician_id, current_user.id, payload.notes
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return _bulk_result(outcomes)
+
+
 @router.get("/{work_order_id}", response_model=WorkOrder)
 def get_work_order(
     work_order_id: int,
@@ -348,7 +486,7 @@ def update_status(
 ):
     """RF-18/RF-24: transition status. Technicians may only update their own
     assigned work orders; coordinators/admins may update any."""
-    _get_accessible_work_order(work_order_id, current_user, organization)
+    work_order = _get_accessible_work_order(work_order_id, current_user, organization)
 
     try:
         updated = work_order_service.transition_status(
@@ -359,6 +497,7 @@ def update_status(
             current_user.role,
             payload.notes,
             completion_override_reason=payload.completion_override_reason,
+            work_order=work_order,
         )
     except LookupError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Work order not found")
@@ -382,6 +521,11 @@ def update_status(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only org admins and coordinators can archive work orders",
         )
+    except work_order_service.ConcurrentStatusChange:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Work order status changed concurrently; reload and retry",
+        )
 
     return WorkOrder(**updated)
 
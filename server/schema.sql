@@ -324,6 +324,15 @@ CREATE INDEX IF NOT EXISTS idx_work_orders_org_client ON work_orders(organizatio
 CREATE INDEX IF NOT EXISTS idx_work_orders_org_vendor ON work_orders(organization_id, vendor_id);
 CREATE INDEX IF NOT EXISTS idx_work_orders_org_client_approval ON work_orders(organization_id, client_approval_status);
 CREATE INDEX IF NOT EXISTS idx_work_orders_created_at ON work_orders(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_work_orders_org_created_id ON work_orders(organization_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_work_orders_org_tech_active ON work_orders(organization_id, assigned_technician_id, status)
+    WHERE assigned_technician_id IS NOT NULL AND status IN ('open', 'in_progress', 'paused', 'escalated');
+-- Idempotency key for CSV/webhook ingestion: one work order per upstream reference.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_work_orders_org_external_ref ON work_orders(organization_id, external_ref)
+    WHERE external_ref IS NOT NULL;
+-- Completion-day range scans when rebuilding dashboard rollups.
+CREATE INDEX IF NOT EXISTS idx_work_orders_org_completed_at ON work_orders(organization_id, completed_at)
+    WHERE completed_at IS NOT NULL;
 
 CREATE TRIGGER update_work_orders_updated_at
     BEFORE UPDATE ON work_orders
@@ -418,3 +427,338 @@ ALTER TABLE org_priority_rules ENABLE ROW LEVEL SECURITY;
 
 CREATE POLICY org_priority_rules_isolation ON org_priority_rules
     USING (organization_id = techsync_current_org_id());
+
+-- =====================================================================
+-- ingestion_jobs: durable queue for background CSV/webhook ingestion (RF-09, RF-11)
+-- =====================================================================
+CREATE TABLE IF NOT EXISTS ingestion_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    created_by BIGINT REFERENCES users(id) ON DELETE SET NULL,
+    source TEXT NOT NULL CHECK (source IN ('csv', 'webhook')),
+    status TEXT NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    payload JSONB NOT NULL,  -- {"rows": [...validated WorkOrderIngestRow dicts]}
+    total_rows INTEGER NOT NULL DEFAULT 0,
+    processed_rows INTEGER NOT NULL DEFAULT 0,
+    created_count INTEGER NOT NULL DEFAULT 0,
+    created_work_order_ids JSONB NOT NULL DEFAULT '[]'::jsonb,
+    row_errors JSONB NOT NULL DEFAULT '[]'::jsonb,
+    duplicate_rows JSONB NOT NULL DEFAULT '[]'::jsonb,  -- rows whose external_ref already existed
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    locked_by TEXT,
+    locked_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()) NOT NULL,
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_org ON ingestion_jobs(organization_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_pending
+    ON ingestion_jobs(created_at, id)
+    WHERE status IN ('queued', 'running');
+
+ALTER TABLE ingestion_jobs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY ingestion_jobs_isolation ON ingestion_jobs
+    USING (organization_id = techsync_current_org_id());
+
+-- =====================================================================
+-- dashboard rollups: per-day aggregates behind the operations report (RF-25)
+-- =====================================================================
+-- Costs are bucketed by created day, completion cycles by completed day.
+CREATE TABLE IF NOT EXISTS work_order_service_daily_rollups (
+    organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    service_type TEXT NOT NULL,
+    cost_work_order_count INTEGER NOT NULL DEFAULT 0,
+    estimated_cost_cents BIGINT NOT NULL DEFAULT 0,
+    actual_cost_cents BIGINT NOT NULL DEFAULT 0,
+    actual_cost_count INTEGER NOT NULL DEFAULT 0,
+    invoice_reference_count INTEGER NOT NULL DEFAULT 0,
+    latest_cost_work_order_at TIMESTAMP WITH TIME ZONE,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    cycle_seconds_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    cycle_seconds_min DOUBLE PRECISION,
+    cycle_seconds_max DOUBLE PRECISION,
+    latest_completed_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (organization_id, day, service_type)
+);
+
+-- Bucketed by created day; status counts reflect each order's current status.
+CREATE TABLE IF NOT EXISTS work_order_property_daily_rollups (
+    organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    property_id BIGINT NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
+    total_work_orders INTEGER NOT NULL DEFAULT 0,
+    open_count INTEGER NOT NULL DEFAULT 0,
+    in_progress_count INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    latest_work_order_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (organization_id, day, property_id)
+);
+
+-- Days whose rollups must be rebuilt, marked by the work_orders trigger and
+-- drained by the rollup refresher. No foreign key: the trigger also fires
+-- while an organization is being cascade-deleted.
+CREATE TABLE IF NOT EXISTS dashboard_rollup_dirty_days (
+    organization_id BIGINT NOT NULL,
+    day DATE NOT NULL,
+    marked_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()) NOT NULL,
+    PRIMARY KEY (organization_id, day)
+);
+
+CREATE OR REPLACE FUNCTION techsync_mark_rollup_days()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO dashboard_rollup_dirty_days (organization_id, day)
+        SELECT OLD.organization_id, changed.day
+        FROM unnest(ARRAY[
+            (OLD.created_at AT TIME ZONE 'UTC')::date,
+            (OLD.completed_at AT TIME ZONE 'UTC')::date
+        ]) AS changed(day)
+        WHERE changed.day IS NOT NULL
+        ON CONFLICT DO NOTHING;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO dashboard_rollup_dirty_days (organization_id, day)
+        SELECT NEW.organization_id, changed.day
+        FROM unnest(ARRAY[
+            (NEW.created_at AT TIME ZONE 'UTC')::date,
+            (NEW.completed_at AT TIME ZONE 'UTC')::date
+        ]) AS changed(day)
+        WHERE changed.day IS NOT NULL
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER work_orders_mark_rollup_days
+    AFTER INSERT OR DELETE OR UPDATE OF
+        status, service_type, property_id, estimated_cost_cents, actual_cost_cents,
+        invoice_reference, created_at, completed_at
+    ON work_orders
+    FOR EACH ROW
+    EXECUTE FUNCTION techsync_mark_rollup_days();
+
+ALTER TABLE work_order_service_daily_rollups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE work_order_property_daily_rollups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE dashboard_rollup_dirty_days ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY work_order_service_daily_rollups_isolation ON work_order_service_daily_rollups
+    USING (organization_id = techsync_current_org_id());
+CREATE POLICY work_order_property_daily_rollups_isolation ON work_order_property_daily_rollups
+    USING (organization_id = techsync_current_org_id());
+CREATE POLICY dashboard_rollup_dirty_days_isolation ON dashboard_rollup_dirty_days
+    USING (organization_id = techsync_current_org_id());
+
+-- =====================================================================
+-- change feed: NOTIFY techsync_changes for cross-worker cache invalidation
+-- =====================================================================
+-- Statement-level triggers; the API tags each session with techsync.origin
+-- so a worker can skip notifications for its own writes (core.change_feed).
+CREATE OR REPLACE FUNCTION techsync_notify_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    org_column TEXT := TG_ARGV[0];
+    message TEXT;
+BEGIN
+    -- One notification per statement, organization and 500 ids (NOTIFY
+    -- payloads are capped at 8000 bytes). Updates report the union of the
+    -- columns that actually changed and skip rows where nothing did.
+    IF TG_OP = 'UPDATE' THEN
+        FOR message IN
+            WITH changed AS (
+                SELECT
+                    (to_jsonb(n) ->> org_column)::BIGINT AS organization_id,
+                    n.id,
+                    ARRAY(
+                        SELECT f.key
+                        FROM jsonb_each(to_jsonb(n)) AS f
+                        WHERE f.value IS DISTINCT FROM to_jsonb(o) -> f.key
+                    ) AS fields
+                FROM changed_rows AS n
+                JOIN previous_rows AS o ON o.id = n.id
+            ),
+            numbered AS (
+                SELECT
+                    organization_id,
+                    id,
+                    fields,
+                    (ROW_NUMBER() OVER (PARTITION BY organization_id ORDER BY id) - 1) / 500 AS chunk
+                FROM changed
+                WHERE cardinality(fields) > 0
+            ),
+            chunk_fields AS (
+                SELECT organization_id, chunk, json_agg(DISTINCT field) AS fields
+                FROM numbered, unnest(numbered.fields) AS field
+                GROUP BY organization_id, chunk
+            )
+            SELECT json_build_object(
+                'table', TG_TABLE_NAME,
+                'op', TG_OP,
+                'organization_id', numbered.organization_id,
+                'ids', json_agg(numbered.id ORDER BY numbered.id),
+                'fields', MIN(chunk_fields.fields::text)::json,
+                'origin', current_setting('techsync.origin', true)
+            )::text
+            FROM numbered
+            JOIN chunk_fields USING (organization_id, chunk)
+            GROUP BY numbered.organization_id, numbered.chunk
+        LOOP
+            PERFORM pg_notify('techsync_changes', message);
+        END LOOP;
+    ELSE
+        FOR message IN
+            WITH numbered AS (
+                SELECT
+                    (to_jsonb(r) ->> org_column)::BIGINT AS organization_id,
+                    r.id,
+                    (ROW_NUMBER() OVER (PARTITION BY to_jsonb(r) ->> org_column ORDER BY r.id) - 1) / 500 AS chunk
+                FROM changed_rows AS r
+            )
+            SELECT json_build_object(
+                'table', TG_TABLE_NAME,
+                'op', TG_OP,
+                'organization_id', organization_id,
+                'ids', json_agg(id ORDER BY id),
+                'fields', '[]'::json,
+                'origin', current_setting('techsync.origin', true)
+            )::text
+            FROM numbered
+            GROUP BY organization_id, chunk
+        LOOP
+            PERFORM pg_notify('techsync_changes', message);
+        END LOOP;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER organizations_notify_insert
+    AFTER INSERT ON organizations
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('id');
+
+CREATE TRIGGER organizations_notify_update
+    AFTER UPDATE ON organizations
+    REFERENCING OLD TABLE AS previous_rows NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('id');
+
+CREATE TRIGGER organizations_notify_delete
+    AFTER DELETE ON organizations
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('id');
+
+CREATE TRIGGER users_notify_insert
+    AFTER INSERT ON users
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER users_notify_update
+    AFTER UPDATE ON users
+    REFERENCING OLD TABLE AS previous_rows NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER users_notify_delete
+    AFTER DELETE ON users
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER technicians_notify_insert
+    AFTER INSERT ON technicians
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER technicians_notify_update
+    AFTER UPDATE ON technicians
+    REFERENCING OLD TABLE AS previous_rows NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER technicians_notify_delete
+    AFTER DELETE ON technicians
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER work_orders_notify_insert
+    AFTER INSERT ON work_orders
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER work_orders_notify_update
+    AFTER UPDATE ON work_orders
+    REFERENCING OLD TABLE AS previous_rows NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER work_orders_notify_delete
+    AFTER DELETE ON work_orders
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER org_priority_rules_notify_insert
+    AFTER INSERT ON org_priority_rules
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER org_priority_rules_notify_update
+    AFTER UPDATE ON org_priority_rules
+    REFERENCING OLD TABLE AS previous_rows NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+CREATE TRIGGER org_priority_rules_notify_delete
+    AFTER DELETE ON org_priority_rules
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION techsync_notify_changes('organization_id');
+
+-- =====================================================================
+-- export_jobs: durable queue for background tenant/entity exports (RNF-13)
+-- =====================================================================
+CREATE TABLE IF NOT EXISTS export_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    organization_id BIGINT NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    created_by BIGINT REFERENCES users(id) ON DELETE SET NULL,
+    kind TEXT NOT NULL CHECK (kind IN ('tenant', 'clients', 'properties', 'vendors')),
+    status TEXT NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    file_name TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    storage_backend TEXT CHECK (storage_backend IN ('local', 's3')),
+    storage_key TEXT,  -- set once the artifact is complete
+    bytes_written BIGINT NOT NULL DEFAULT 0,
+    size_bytes BIGINT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    locked_by TEXT,
+    locked_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()) NOT NULL,
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_export_jobs_org ON export_jobs(organization_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_export_jobs_pending
+    ON export_jobs(created_at, id)
+    WHERE status IN ('queued', 'running');
+
+ALTER TABLE export_jobs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY export_jobs_isolation ON export_jobs
+    USING (organization_id = techsync_current_org_id());
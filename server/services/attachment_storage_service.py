@@ -34,7 +34,7 @@ async def upload_work_order_attachment_file(
     storage_path = _build_storage_path(organization_id, work_order_id, file_name, content_type)
     bucket_name = _required_setting(settings.STORAGE_BUCKET, "STORAGE_BUCKET")
     public_base_url = _required_setting(settings.STORAGE_PUBLIC_BASE_URL, "STORAGE_PUBLIC_BASE_URL")
-    client = _get_storage_client()
+    client = get_storage_client()
 
     try:
         client.put_object(
@@ -56,7 +56,7 @@ async def upload_work_order_attachment_file(
     }
 
 
-def _get_storage_client():
+def get_storage_client():
     access_key = _required_setting(settings.STORAGE_ACCESS_KEY_ID, "STORAGE_ACCESS_KEY_ID")
     secret_key = _required_setting(settings.STORAGE_SECRET_ACCESS_KEY, "STORAGE_SECRET_ACCESS_KEY")
 
@@ -5,10 +5,13 @@ from __future__ import annotations
 import csv
 from datetime import datetime
 from io import StringIO
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from models.dashboard import DispatchBoard, DispatchBoardWorkOrder, OperationsReport
 
+# Rows are buffered until the pending CSV text reaches this size.
+CSV_CHUNK_CHARS = 64 * 1024
+
 
 def _format_value(value: Any) -> str:
     if value is None:
@@ -18,16 +21,25 @@ def _format_value(value: Any) -> str:
     return str(value)
 
 
-def _write_csv(headers: list[str], rows: list[dict[str, Any]]) -> str:
+def _iter_csv(headers: list[str], rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Yield the CSV in chunks of about CSV_CHUNK_CHARS, header line first."""
     output = StringIO()
     writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
     writer.writeheader()
+    yield output.getvalue()
+    output.seek(0)
+    output.truncate()
     for row in rows:
         writer.writerow({header: _format_value(row.get(header)) for header in headers})
-    return output.getvalue()
+        if output.tell() >= CSV_CHUNK_CHARS:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+    if output.tell():
+        yield output.getvalue()
 
 
-def build_operations_report_csv(report: OperationsReport) -> str:
+def iter_operations_report_csv(report: OperationsReport) -> Iterator[str]:
     headers = [
         "section",
         "id",
@@ -135,10 +147,13 @@ def build_operations_report_csv(report: OperationsReport) -> str:
             }
         )
 
-    return _write_csv(headers, rows)
+    for item in report.unavailable_sections:
+        rows.append({"section": "unavailable_section", "title": item.section, "status": item.reason})
+
+    return _iter_csv(headers, rows)
 
 
-def build_dispatch_board_csv(board: DispatchBoard) -> str:
+def iter_dispatch_board_csv(board: DispatchBoard) -> Iterator[str]:
     headers = [
         "section",
         "metric",
@@ -229,7 +244,7 @@ def build_dispatch_board_csv(board: DispatchBoard) -> str:
                 }
             )
 
-    return _write_csv(headers, rows)
+    return _iter_csv(headers, rows)
 
 
 def _dispatch_work_order_row(section: str, item: DispatchBoardWorkOrder) -> dict[str, Any]:
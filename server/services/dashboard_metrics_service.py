@@ -0,0 +1,34 @@
+"""
+Headline counts for the admin dashboard (RF-25).
+
+The mobile dashboard refetches these on every focus, so they come from one
+aggregate query per org, cached for a few seconds. Concurrent misses for the
+same org share a single query instead of each running their own.
+"""
+
+from core.cache import MISSING, SingleFlight, TTLCache, register_cache
+from core.config import settings
+from models.dashboard import DashboardMetrics
+from repositories import work_orders as work_orders_repo
+
+_metrics = register_cache(
+    TTLCache(
+        "dashboard_metrics",
+        max_entries=settings.DASHBOARD_METRICS_CACHE_MAX_ORGS,
+        ttl_seconds=settings.DASHBOARD_METRICS_CACHE_TTL_SECONDS,
+    )
+)
+_loads = SingleFlight()
+
+
+def get_metrics(organization_id: int) -> DashboardMetrics:
+    cached = _metrics.get(organization_id)
+    if cached is not MISSING:
+        return cached
+    return _loads.do(organization_id, lambda: _load(organization_id))
+
+
+def _load(organization_id: int) -> DashboardMetrics:
+    metrics = DashboardMetrics(**work_orders_repo.dashboard_counts(organization_id))
+    _metrics.set(organization_id, metrics)
+    return metrics
@@ -0,0 +1,31 @@
+"""Keeps the operations-report rollups in step with work_orders (RF-25)."""
+
+from typing import Optional
+
+from core.config import settings
+from database import unit_of_work
+from logger import logger
+from repositories import dashboard_rollups as rollups_repo
+
+
+def refresh_dirty_days(organization_id: Optional[int] = None, limit: Optional[int] = None) -> bool:
+    """Rebuild one batch of dirty rollup days, optionally for a single org.
+    Returns False when nothing was pending (the polling worker then sleeps)."""
+    limit = limit or settings.DASHBOARD_ROLLUP_BATCH_DAYS
+    with unit_of_work():
+        days = rollups_repo.claim_dirty_days(limit, organization_id=organization_id)
+        rollups_repo.rebuild_days(days)
+    if days:
+        logger.info(
+            "dashboard.rollups_refreshed",
+            extra={"event": "dashboard_rollups_refreshed", "organization_id": organization_id, "days": len(days)},
+        )
+    return bool(days)
+
+
+def refresh_for_report(organization_id: int) -> None:
+    """Bring an org's most recent dirty days up to date before a report read,
+    so a report usually reflects the caller's own writes without waiting for
+    the background refresher."""
+    if settings.DASHBOARD_ROLLUP_INLINE_REFRESH_DAYS > 0:
+        refresh_dirty_days(organization_id, limit=settings.DASHBOARD_ROLLUP_INLINE_REFRESH_DAYS)
@@ -0,0 +1,256 @@
+"""
+Dispatch board (RF-25): the full board behind GET /dashboard/dispatch-board
+and the snapshot-then-deltas feed behind its SSE stream.
+
+A stream loads the board once, then follows ``core.change_bus``: each batch
+of changed work orders is re-read by id (not the whole board), merged into
+the stream's own copy of the rows, and sent as card, lane and summary
+deltas. Changes made by other API processes reach the bus through
+``core.change_feed``. The stream sends a fresh snapshot when the roster
+changes, when it falls behind the bus, and every
+DISPATCH_BOARD_STREAM_RESYNC_SECONDS as a backstop for a missed notification.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from core.change_bus import bus as change_bus
+from core.config import settings
+from database import outside_unit_of_work
+from models.dashboard import (
+    DispatchBoard,
+    DispatchBoardCardDelta,
+    DispatchBoardLaneDelta,
+    DispatchBoardSummary,
+    DispatchBoardTechnicianLane,
+    DispatchBoardWorkOrder,
+)
+from repositories import work_orders as work_orders_repo
+from services import roster_service, workload_service
+from services.workload_service import WorkloadSnapshot
+
+
+def _as_aware_utc(value: datetime | str | None) -> datetime | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _sla_risk_level(sla_due_at: datetime | None, now: datetime) -> str:
+    due_at = _as_aware_utc(sla_due_at)
+    if due_at is None:
+        return "none"
+    seconds_until_due = (due_at - now).total_seconds()
+    if seconds_until_due <= 0:
+        return "breached"
+    if seconds_until_due <= 2 * 60 * 60:
+        return "due_soon"
+    return "on_track"
+
+
+def _format_work_order(row: Mapping[str, Any], now: datetime) -> DispatchBoardWorkOrder:
+    created_at = _as_aware_utc(row.get("created_at")) or now
+    age_hours = max((now - created_at).total_seconds() / 3600, 0)
+    return DispatchBoardWorkOrder(
+        id=row["id"],
+        title=row["title"],
+        status=row["status"],
+        priority=row["priority"],
+        assigned_technician_id=row.get("assigned_technician_id"),
+        property_id=row.get("property_id"),
+        property_name=row.get("property_name"),
+        client_id=row.get("client_id"),
+        client_display_name=row.get("client_display_name"),
+        vendor_id=row.get("vendor_id"),
+        vendor_name=row.get("vendor_name"),
+        created_at=created_at,
+        sla_due_at=_as_aware_utc(row.get("sla_due_at")),
+        age_hours=round(age_hours, 1),
+        sla_risk_level=_sla_risk_level(row.get("sla_due_at"), now),
+    )
+
+
+def assemble_board(
+    rows: Iterable[Mapping[str, Any]],
+    technicians: Iterable[Mapping[str, Any]],
+    workload: WorkloadSnapshot,
+    now: datetime,
+) -> DispatchBoard:
+    work_orders = [_format_work_order(row, now) for row in rows]
+    unassigned = [item for item in work_orders if item.assigned_technician_id is None]
+    assigned_by_technician: dict[int, list[DispatchBoardWorkOrder]] = {}
+    for item in work_orders:
+        if item.assigned_technician_id is None:
+            continue
+        assigned_by_technician.setdefault(item.assigned_technician_id, []).append(item)
+
+    lanes = []
+    for technician in technicians:
+        assigned = assigned_by_technician.get(technician["id"], [])
+        max_daily_jobs = int(technician.get("max_daily_jobs") or 1)
+        active_count = workload.active_count(technician["id"], workload_service.WORKLOAD_STATUSES)
+        lanes.append(
+            DispatchBoardTechnicianLane(
+                technician_id=technician["id"],
+                full_name=technician["users"]["full_name"],
+                email=technician["users"]["email"],
+                availability_status=technician["availability_status"],
+                max_daily_jobs=max_daily_jobs,
+                active_work_order_count=active_count,
+                utilization_percent=round((active_count / max_daily_jobs) * 100, 1),
+                work_orders=assigned,
+            )
+        )
+
+    lanes.sort(
+        key=lambda lane: (
+            -lane.active_work_order_count,
+            lane.availability_status != "available",
+            lane.full_name.lower(),
+        )
+    )
+
+    summary = DispatchBoardSummary(
+        open_count=sum(1 for item in work_orders if item.status == "open"),
+        in_progress_count=sum(1 for item in work_orders if item.status == "in_progress"),
+        paused_count=sum(1 for item in work_orders if item.status == "paused"),
+        escalated_count=sum(1 for item in work_orders if item.status == "escalated"),
+        unassigned_count=len(unassigned),
+        sla_at_risk_count=sum(
+            1 for item in work_orders if item.sla_risk_level in {"breached", "due_soon"}
+        ),
+        emergency_count=sum(1 for item in work_orders if item.priority == "emergency"),
+    )
+
+    return DispatchBoard(
+        summary=summary,
+        unassigned_work_orders=unassigned,
+        technician_lanes=lanes,
+    )
+
+
+def get_board(organization_id: int) -> DispatchBoard:
+    rows = work_orders_repo.list_dispatch_board_work_orders(organization_id)
+    technicians = roster_service.get_snapshot(organization_id).technicians
+    workload = workload_service.count_work_orders(organization_id, rows)
+    return assemble_board(rows, technicians, workload, datetime.now(timezone.utc))
+
+
+def _card_lanes(board: DispatchBoard) -> dict[int, tuple[Optional[int], DispatchBoardWorkOrder]]:
+    """work_order_id -> (lane technician_id, None when unassigned; card)."""
+    cards = {card.id: (None, card) for card in board.unassigned_work_orders}
+    for lane in board.technician_lanes:
+        for card in lane.work_orders:
+            cards[card.id] = (lane.technician_id, card)
+    return cards
+
+
+def _lane_header(lane: DispatchBoardTechnicianLane) -> DispatchBoardLaneDelta:
+    return DispatchBoardLaneDelta(**lane.model_dump(exclude={"work_orders"}))
+
+
+class DispatchBoardState:
+    """The board one stream has sent, kept as rows so a change only re-reads
+    the work orders it names. Its workload counts come from those rows and
+    never replace the shared workload cache."""
+
+    def __init__(
+        self,
+        organization_id: int,
+        rows: list[dict],
+        roster: roster_service.RosterSnapshot,
+        board: DispatchBoard,
+    ):
+        self.organization_id = organization_id
+        self.rows = {row["id"]: row for row in rows}
+        self.roster = roster
+        self.board = board
+
+    @classmethod
+    def load(cls, organization_id: int) -> "DispatchBoardState":
+        # Streams outlive their request's unit of work; every read here
+        # borrows a pooled connection just for itself.
+        with outside_unit_of_work():
+            rows = work_orders_repo.list_dispatch_board_work_orders(organization_id)
+            roster = roster_service.get_snapshot(organization_id)
+        workload = workload_service.count_work_orders(organization_id, rows)
+        board = assemble_board(rows, roster.technicians, workload, datetime.now(timezone.utc))
+        return cls(organization_id, rows, roster, board)
+
+    def apply(self, work_order_ids: Iterable[int]) -> Optional[list[tuple[str, Any]]]:
+        """Merge the current state of ``work_order_ids`` and return the
+        resulting deltas, or None when the roster changed and only a new
+        snapshot can describe the lanes."""
+        work_order_ids = sorted(set(work_order_ids))
+        with outside_unit_of_work():
+            if roster_service.get_snapshot(self.organization_id).version != self.roster.version:
+                return None
+            fresh = {
+                row["id"]: row
+                for row in work_orders_repo.list_dispatch_board_work_orders(
+                    self.organization_id, work_order_ids=work_order_ids
+                )
+            }
+        for work_order_id in work_order_ids:
+            if work_order_id in fresh:
+                self.rows[work_order_id] = fresh[work_order_id]
+            else:
+                self.rows.pop(work_order_id, None)
+
+        previous = self.board
+        rows = list(self.rows.values())
+        workload = workload_service.count_work_orders(self.organization_id, rows)
+        self.board = assemble_board(rows, self.roster.technicians, workload, datetime.now(timezone.utc))
+        return self._deltas(previous, work_order_ids)
+
+    def _deltas(self, previous: DispatchBoard, work_order_ids: list[int]) -> list[tuple[str, Any]]:
+        deltas: list[tuple[str, Any]] = []
+        before, after = _card_lanes(previous), _card_lanes(self.board)
+        for work_order_id in work_order_ids:
+            if before.get(work_order_id) == after.get(work_order_id):
+                continue
+            technician_id, card = after.get(work_order_id, (None, None))
+            delta = DispatchBoardCardDelta(work_order_id=work_order_id, technician_id=technician_id, work_order=card)
+            deltas.append(("card", delta))
+
+        previous_lanes = {lane.technician_id: _lane_header(lane) for lane in previous.technician_lanes}
+        for lane in self.board.technician_lanes:
+            header = _lane_header(lane)
+            if previous_lanes.get(lane.technician_id) != header:
+                deltas.append(("lane", header))
+
+        if self.board.summary != previous.summary:
+            deltas.append(("summary", self.board.summary))
+        return deltas
+
+
+async def stream_board(organization_id: int) -> AsyncIterator[tuple[str, Any]]:
+    """Yield ("snapshot", DispatchBoard) and then ("card" | "lane" |
+    "summary", delta) pairs until the consumer stops iterating."""
+    # Subscribe before loading so no change can fall between the two.
+    subscription = change_bus.subscribe(organization_id, max_pending=settings.DISPATCH_BOARD_STREAM_MAX_PENDING)
+    try:
+        while True:
+            subscription.reset()
+            state = await run_in_threadpool(DispatchBoardState.load, organization_id)
+            yield "snapshot", state.board
+            resync_at = time.monotonic() + settings.DISPATCH_BOARD_STREAM_RESYNC_SECONDS
+            while not subscription.overflowed:
+                changes = await subscription.next(timeout=resync_at - time.monotonic())
+                if not changes:
+                    break
+                work_order_ids = {work_order_id for change in changes for work_order_id in change.work_order_ids}
+                deltas = await run_in_threadpool(state.apply, work_order_ids)
+                if deltas is None:
+                    break
+                for delta in deltas:
+                    yield delta
+    finally:
+        change_bus.unsubscribe(subscription)
@@ -1,11 +1,18 @@
-"""CSV exports for PMC directory entities."""
+"""CSV exports for PMC directory entities.
+
+Exports are generated row by row from a repository iterator and handed out
+in chunks, so a large tenant's export never sits in memory as a whole.
+"""
 
 from __future__ import annotations
 
 import csv
 from datetime import datetime
 from io import StringIO
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+# Rows are buffered until the pending CSV text reaches this size.
+CSV_CHUNK_CHARS = 64 * 1024
 
 
 def _format_value(value: Any) -> str:
@@ -20,17 +27,27 @@ def _format_value(value: Any) -> str:
     return str(value)
 
 
-def _write_csv(headers: list[str], rows: list[dict[str, Any]]) -> str:
+def _iter_csv(headers: list[str], rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Yield the CSV in chunks of about CSV_CHUNK_CHARS; the header line goes
+    out on its own first, before ``rows`` is touched."""
     output = StringIO()
     writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
     writer.writeheader()
+    yield output.getvalue()
+    output.seek(0)
+    output.truncate()
     for row in rows:
         writer.writerow({header: _format_value(row.get(header)) for header in headers})
-    return output.getvalue()
+        if output.tell() >= CSV_CHUNK_CHARS:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+    if output.tell():
+        yield output.getvalue()
 
 
-def build_clients_csv(rows: list[dict[str, Any]]) -> str:
-    return _write_csv(
+def iter_clients_csv(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    return _iter_csv(
         [
             "id",
             "display_name",
@@ -47,8 +64,8 @@ def build_clients_csv(rows: list[dict[str, Any]]) -> str:
     )
 
 
-def build_properties_csv(rows: list[dict[str, Any]]) -> str:
-    return _write_csv(
+def iter_properties_csv(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    return _iter_csv(
         [
             "id",
             "client_id",
@@ -71,8 +88,8 @@ def build_properties_csv(rows: list[dict[str, Any]]) -> str:
     )
 
 
-def build_vendors_csv(rows: list[dict[str, Any]]) -> str:
-    return _write_csv(
+def iter_vendors_csv(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    return _iter_csv(
         [
             "id",
             "name",
@@ -0,0 +1,196 @@
+"""
+Background export jobs (RNF-13): the tenant bundle and entity CSVs written to
+export storage by a polling worker instead of on the request path.
+
+A job streams the same generators as the synchronous /export endpoints and
+stores them EXPORT_PART_BYTES at a time, reporting progress (and renewing its
+lease) after every part. A job reclaimed after a crash starts its artifact
+over. Each tenant runs at most EXPORT_JOB_MAX_RUNNING_PER_ORG exports at
+once and may queue at most EXPORT_JOB_MAX_PENDING_PER_ORG.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+from core.config import settings
+from core.worker import worker_identity
+from database import unit_of_work
+from logger import logger
+from models.export_job import ExportJob
+from repositories import clients as clients_repo
+from repositories import export_jobs as export_jobs_repo
+from repositories import organizations as organizations_repo
+from repositories import properties as properties_repo
+from repositories import vendors as vendors_repo
+from services import entity_export_service, export_storage_service, tenant_export_service
+
+
+@dataclass(frozen=True)
+class ExportKind:
+    file_name: str
+    content_type: str
+    chunks: Callable[[dict[str, Any]], Iterator[str]]
+
+
+EXPORT_KINDS = {
+    "tenant": ExportKind(
+        "techsync-tenant-export.json", "application/json", tenant_export_service.iter_tenant_export
+    ),
+    "clients": ExportKind(
+        "techsync-clients.csv",
+        "text/csv",
+        lambda organization: entity_export_service.iter_clients_csv(clients_repo.iter_by_org(organization["id"])),
+    ),
+    "properties": ExportKind(
+        "techsync-properties.csv",
+        "text/csv",
+        lambda organization: entity_export_service.iter_properties_csv(
+            properties_repo.iter_by_org(organization["id"])
+        ),
+    ),
+    "vendors": ExportKind(
+        "techsync-vendors.csv",
+        "text/csv",
+        lambda organization: entity_export_service.iter_vendors_csv(vendors_repo.iter_by_org(organization["id"])),
+    ),
+}
+
+
+class TooManyExports(Exception):
+    """The tenant already has EXPORT_JOB_MAX_PENDING_PER_ORG exports queued or running."""
+
+
+class LostJobLease(Exception):
+    """Another worker reclaimed the job while this one was writing it."""
+
+
+def enqueue_export(organization_id: int, created_by: int | None, kind: str) -> ExportJob:
+    export_storage_service.ensure_configured()
+    spec = EXPORT_KINDS[kind]
+    with unit_of_work():
+        export_jobs_repo.lock_org_queue(organization_id)
+        if export_jobs_repo.count_pending(organization_id) >= settings.EXPORT_JOB_MAX_PENDING_PER_ORG:
+            raise TooManyExports(f"At most {settings.EXPORT_JOB_MAX_PENDING_PER_ORG} exports can be pending")
+        job = export_jobs_repo.create(organization_id, created_by, kind, spec.file_name, spec.content_type)
+    logger.info(
+        "exports.job_queued",
+        extra={"event": "export_job_queued", "organization_id": organization_id, "job_id": job["id"], "kind": kind},
+    )
+    return _job_from_row(job)
+
+
+def get_job(organization_id: int, job_id: int) -> ExportJob | None:
+    job = export_jobs_repo.get_by_id_in_org(job_id, organization_id)
+    return _job_from_row(job) if job else None
+
+
+def get_artifact(organization_id: int, job_id: int) -> dict | None:
+    """The finished job row (with storage_backend/storage_key), or None while
+    the job is missing, pending or failed."""
+    job = export_jobs_repo.get_by_id_in_org(job_id, organization_id)
+    if job is None or job["status"] != "succeeded":
+        return None
+    return job
+
+
+def _download_url(job: dict) -> str | None:
+    if job["status"] != "succeeded":
+        return None
+    if job["storage_backend"] == "s3":
+        return export_storage_service.presigned_url(job["storage_key"], job["file_name"])
+    return f"/organizations/me/exports/{job['id']}/download"
+
+
+def _job_from_row(job: dict) -> ExportJob:
+    return ExportJob(
+        id=job["id"],
+        kind=job["kind"],
+        status=job["status"],
+        file_name=job["file_name"],
+        content_type=job["content_type"],
+        bytes_written=job["bytes_written"],
+        size_bytes=job["size_bytes"],
+        download_url=_download_url(job),
+        error=job["error"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        started_at=job["started_at"],
+        finished_at=job["finished_at"],
+    )
+
+
+def run_next_job(worker_id: str | None = None) -> bool:
+    """Claim and write one queued export. Returns False when nothing is
+    claimable (the polling worker then sleeps)."""
+    worker_id = worker_id or worker_identity("exports")
+    lease_seconds = settings.EXPORT_JOB_LEASE_SECONDS
+    max_attempts = settings.EXPORT_JOB_MAX_ATTEMPTS
+    abandoned = export_jobs_repo.fail_abandoned(lease_seconds, max_attempts)
+    if abandoned:
+        logger.warning("exports.job_abandoned", extra={"event": "export_job_abandoned", "job_id": abandoned["id"]})
+    with unit_of_work():
+        export_jobs_repo.lock_claims()
+        job = export_jobs_repo.claim_next(
+            worker_id, lease_seconds, max_attempts, settings.EXPORT_JOB_MAX_RUNNING_PER_ORG
+        )
+    if job is None:
+        return abandoned is not None
+    process_job(job, worker_id)
+    return True
+
+
+def process_job(job: dict, worker_id: str) -> None:
+    organization_id = job["organization_id"]
+    spec = EXPORT_KINDS[job["kind"]]
+    key = export_storage_service.storage_key(organization_id, job["id"], job["file_name"])
+    writer = None
+    written = 0
+    try:
+        organization = organizations_repo.get_by_id(organization_id)
+        if organization is None:
+            raise LookupError(f"Organization {organization_id} no longer exists")
+        writer = export_storage_service.open_writer(key, job["content_type"])
+        buffer = bytearray()
+        for chunk in spec.chunks(organization):
+            buffer += chunk.encode("utf-8")
+            if len(buffer) >= settings.EXPORT_PART_BYTES:
+                writer.write_part(bytes(buffer))
+                written += len(buffer)
+                buffer.clear()
+                if export_jobs_repo.record_progress(job["id"], worker_id, written) is None:
+                    raise LostJobLease(f"Export job {job['id']} is no longer leased to {worker_id}")
+        if buffer or not written:
+            writer.write_part(bytes(buffer))
+            written += len(buffer)
+        writer.complete()
+    except LostJobLease:
+        writer.abort()
+        logger.warning(
+            "exports.job_lease_lost",
+            extra={"event": "export_job_lease_lost", "organization_id": organization_id, "job_id": job["id"]},
+        )
+        return
+    except Exception as exc:
+        if writer is not None:
+            writer.abort()
+        logger.exception(
+            "exports.job_failed",
+            extra={"event": "export_job_failed", "organization_id": organization_id, "job_id": job["id"]},
+        )
+        export_jobs_repo.finish(job["id"], worker_id, "failed", error=str(exc))
+        return
+
+    if export_jobs_repo.finish(job["id"], worker_id, "succeeded", writer.backend, key, written) is None:
+        # Reclaimed while the last part was stored; the new owner writes its own artifact.
+        export_storage_service.delete(writer.backend, key)
+        return
+    logger.info(
+        "exports.job_completed",
+        extra={
+            "event": "export_job_completed",
+            "organization_id": organization_id,
+            "job_id": job["id"],
+            "kind": job["kind"],
+            "size_bytes": written,
+        },
+    )
@@ -0,0 +1,116 @@
+"""Where export job artifacts are written and served from (RNF-13).
+
+EXPORT_STORAGE_BACKEND=local keeps artifacts under EXPORT_LOCAL_DIR, which
+every API instance must share, and the API serves them with Range support.
+EXPORT_STORAGE_BACKEND=s3 streams them into the attachment bucket as a
+multipart upload and hands out presigned URLs; S3 answers Range requests
+itself. Either way an artifact only appears under its key once it is
+complete.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from uuid import uuid4
+
+from core.config import settings
+from services.attachment_storage_service import StorageNotConfigured, get_storage_client
+
+
+def storage_key(organization_id: int, job_id: int, file_name: str) -> str:
+    return f"exports/org-{organization_id}/export-{job_id}-{uuid4().hex}-{file_name}"
+
+
+def ensure_configured() -> None:
+    """Fail an enqueue up front instead of a job later."""
+    if settings.EXPORT_STORAGE_BACKEND == "s3" and not settings.STORAGE_BUCKET:
+        raise StorageNotConfigured("STORAGE_BUCKET is not configured")
+
+
+def local_path(key: str) -> Path:
+    root = Path(settings.EXPORT_LOCAL_DIR).resolve()
+    path = (root / key).resolve()
+    if root not in path.parents:
+        raise ValueError("Export storage key escapes EXPORT_LOCAL_DIR")
+    return path
+
+
+class LocalExportWriter:
+    backend = "local"
+
+    def __init__(self, key: str):
+        self.key = key
+        self.path = local_path(key)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._partial = self.path.with_name(self.path.name + ".part")
+        self._file = open(self._partial, "wb")
+
+    def write_part(self, data: bytes) -> None:
+        self._file.write(data)
+
+    def complete(self) -> None:
+        self._file.close()
+        os.replace(self._partial, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._partial.unlink(missing_ok=True)
+
+
+class S3ExportWriter:
+    """Multipart upload: every part but the last must be at least 5 MiB,
+    which EXPORT_PART_BYTES guarantees."""
+
+    backend = "s3"
+
+    def __init__(self, key: str, content_type: str):
+        self.key = key
+        self._client = get_storage_client()
+        self._bucket = settings.STORAGE_BUCKET
+        upload = self._client.create_multipart_upload(Bucket=self._bucket, Key=key, ContentType=content_type)
+        self._upload_id = upload["UploadId"]
+        self._parts: list[dict] = []
+
+    def write_part(self, data: bytes) -> None:
+        part_number = len(self._parts) + 1
+        part = self._client.upload_part(
+            Bucket=self._bucket, Key=self.key, UploadId=self._upload_id, PartNumber=part_number, Body=data
+        )
+        self._parts.append({"ETag": part["ETag"], "PartNumber": part_number})
+
+    def complete(self) -> None:
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket, Key=self.key, UploadId=self._upload_id, MultipartUpload={"Parts": self._parts}
+        )
+
+    def abort(self) -> None:
+        try:
+            self._client.abort_multipart_upload(Bucket=self._bucket, Key=self.key, UploadId=self._upload_id)
+        except Exception:  # pragma: no cover - best effort; bucket lifecycle rules clean up the rest.
+            pass
+
+
+def open_writer(key: str, content_type: str) -> LocalExportWriter | S3ExportWriter:
+    if settings.EXPORT_STORAGE_BACKEND == "s3":
+        return S3ExportWriter(key, content_type)
+    return LocalExportWriter(key)
+
+
+def presigned_url(key: str, file_name: str) -> str:
+    return get_storage_client().generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": settings.STORAGE_BUCKET,
+            "Key": key,
+            "ResponseContentDisposition": f'attachment; filename="{file_name}"',
+        },
+        ExpiresIn=settings.EXPORT_DOWNLOAD_URL_SECONDS,
+    )
+
+
+def delete(backend: str, key: str) -> None:
+    if backend == "s3":
+        get_storage_client().delete_object(Bucket=settings.STORAGE_BUCKET, Key=key)
+    else:
+        local_path(key).unlink(missing_ok=True)
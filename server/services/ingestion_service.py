@@ -4,77 +4,421 @@ Data ingestion layer (RF-09 CSV, RF-11 webhook, RF-12 validation/normalization).
 
 import csv
 import io
+from typing import BinaryIO, Iterator, Mapping
 
 from pydantic import ValidationError
 
+from core.config import settings
+from core.worker import worker_identity
+from database import unit_of_work
 from logger import logger
-from models.ingestion import IngestionResult, RowError, WorkOrderIngestRow
+from models.ingestion import (
+    DuplicateRow,
+    IngestionJob,
+    IngestionResult,
+    RowError,
+    WebhookBatchItemResult,
+    WebhookBatchResult,
+    WebhookWorkOrderPayload,
+    WorkOrderIngestRow,
+)
+from repositories import ingestion_jobs as ingestion_jobs_repo
 from repositories import work_orders as work_orders_repo
-from services.work_order_service import apply_priority_rule, auto_assign
+from services import priority_rule_service
+from services.work_order_service import auto_assign_batch
 
 REQUIRED_CSV_COLUMNS = {"title"}
 
+CsvBatch = tuple[list[WorkOrderIngestRow], list[RowError]]
 
-def parse_csv_rows(content: bytes) -> tuple[list[WorkOrderIngestRow], list[RowError]]:
-    """RF-09/RF-12: parse + validate a CSV file. Returns (valid_rows, row_errors).
-    Row numbers are 1-indexed and account for the header row (row 1 = first data row)."""
-    text = content.decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(text))
 
-    if reader.fieldnames is None or not REQUIRED_CSV_COLUMNS.issubset(
-        {f.strip().lower() for f in reader.fieldnames}
-    ):
-        raise ValueError(f"CSV must include columns: {', '.join(sorted(REQUIRED_CSV_COLUMNS))}")
+def _field_errors(exc: ValidationError) -> list[str]:
+    return [f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in exc.errors()]
 
-    valid_rows: list[WorkOrderIngestRow] = []
-    errors: list[RowError] = []
 
-    for row_number, raw_row in enumerate(reader, start=1):
-        normalized = {(k or "").strip().lower(): (v.strip() if isinstance(v, str) else v) for k, v in raw_row.items()}
-        normalized = {k: (v if v != "" else None) for k, v in normalized.items()}
-        try:
-            valid_rows.append(WorkOrderIngestRow(**normalized))
-        except ValidationError as exc:
-            field_errors = [f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in exc.errors()]
-            errors.append(RowError(row_number=row_number, errors=field_errors))
+def _validate_row(row_number: int, raw_row: dict) -> WorkOrderIngestRow | RowError:
+    normalized = {(k or "").strip().lower(): (v.strip() if isinstance(v, str) else v) for k, v in raw_row.items()}
+    normalized = {k: (v if v != "" else None) for k, v in normalized.items()}
+    try:
+        return WorkOrderIngestRow(**normalized)
+    except ValidationError as exc:
+        return RowError(row_number=row_number, errors=_field_errors(exc))
+
+
+def iter_csv_batches(
+    stream: BinaryIO, batch_size: int | None = None, max_rows: int | None = None
+) -> Iterator[CsvBatch]:
+    """RF-09/RF-12: incrementally parse + validate a CSV byte stream, yielding
+    (valid_rows, row_errors) every ``batch_size`` data rows (one batch when None).
+
+    The stream is decoded as UTF-8 (BOM tolerated) a buffer at a time, so
+    memory stays bounded by the batch size rather than the file size. Raises
+    ValueError for a missing required column or once ``max_rows`` is exceeded;
+    UnicodeDecodeError surfaces from whichever buffer is malformed."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        if reader.fieldnames is None or not REQUIRED_CSV_COLUMNS.issubset(
+            {f.strip().lower() for f in reader.fieldnames}
+        ):
+            raise ValueError(f"CSV must include columns: {', '.join(sorted(REQUIRED_CSV_COLUMNS))}")
+
+        valid_rows: list[WorkOrderIngestRow] = []
+        errors: list[RowError] = []
+        for row_number, raw_row in enumerate(reader, start=1):
+            if max_rows is not None and row_number > max_rows:
+                raise ValueError(f"CSV exceeds the maximum of {max_rows} rows")
+            result = _validate_row(row_number, raw_row)
+            if isinstance(result, RowError):
+                errors.append(result)
+            else:
+                valid_rows.append(result)
+            if batch_size is not None and len(valid_rows) + len(errors) >= batch_size:
+                yield valid_rows, errors
+                valid_rows, errors = [], []
+        if valid_rows or errors:
+            yield valid_rows, errors
+    finally:
+        # Hand the underlying file back untouched; closing it is the caller's job.
+        text.detach()
+
 
+def parse_csv_rows(content: bytes) -> CsvBatch:
+    """RF-09/RF-12: parse + validate a CSV file. Returns (valid_rows, row_errors).
+    Row numbers are 1-indexed and account for the header row (row 1 = first data row)."""
+    valid_rows: list[WorkOrderIngestRow] = []
+    errors: list[RowError] = []
+    for batch_rows, batch_errors in iter_csv_batches(io.BytesIO(content)):
+        valid_rows.extend(batch_rows)
+        errors.extend(batch_errors)
     return valid_rows, errors
 
 
-def ingest_rows(
-    organization_id: int, created_by: int, rows: list[WorkOrderIngestRow], source: str
-) -> IngestionResult:
-    """Persist validated rows as work orders and run auto-assignment on each."""
-    created_ids: list[int] = []
+def _forced_priorities(organization_id: int) -> Mapping[str, str]:
+    return priority_rule_service.rules_for_org(organization_id)
 
-    for row in rows:
-        priority = apply_priority_rule(organization_id, row.service_type, row.priority)
-        work_order = work_orders_repo.create(
-            organization_id,
+
+def _create_rows(
+    organization_id: int,
+    created_by: int | None,
+    rows: list[WorkOrderIngestRow],
+    source: str,
+    forced_priorities: Mapping[str, str],
+) -> list[dict]:
+    """Insert and auto-assign; rows whose external_ref already exists are
+    skipped and do not appear in the result."""
+    created = work_orders_repo.create_many(
+        organization_id,
+        [
             {
                 "title": row.title,
                 "description": row.description,
                 "customer_name": row.customer_name,
                 "address": row.address,
                 "service_type": row.service_type,
-                "priority": priority,
+                "priority": forced_priorities.get(row.service_type) or row.priority,
                 "status": "open",
                 "created_by": created_by,
                 "source": source,
                 "external_ref": row.external_ref,
-            },
-        )
-        auto_assign(organization_id, work_order)
-        created_ids.append(work_order["id"])
+            }
+            for row in rows
+        ],
+    )
+    auto_assign_batch(organization_id, created)
+    return created
+
+
+def _persist_rows(
+    organization_id: int,
+    created_by: int | None,
+    rows: list[WorkOrderIngestRow],
+    source: str,
+    forced_priorities: Mapping[str, str],
+) -> tuple[list[int], list[DuplicateRow]]:
+    """Create the rows; returns the new work order ids and a DuplicateRow for
+    every row skipped because its external_ref was already taken -- by an
+    existing order or by an earlier row of the same batch."""
+    created = _create_rows(organization_id, created_by, rows, source, forced_priorities)
+    created_by_ref = {
+        work_order["external_ref"]: work_order["id"] for work_order in created if work_order["external_ref"]
+    }
+    skipped: list[str] = []
+    claimed_refs: set[str] = set()
+    for row in rows:
+        if not row.external_ref:
+            continue
+        if row.external_ref in claimed_refs or row.external_ref not in created_by_ref:
+            skipped.append(row.external_ref)
+        claimed_refs.add(row.external_ref)
 
+    existing = dict(created_by_ref)
+    existing.update(
+        work_orders_repo.ids_by_external_ref(organization_id, sorted(set(skipped) - created_by_ref.keys()))
+    )
+    duplicates = [DuplicateRow(external_ref=ref, work_order_id=existing.get(ref)) for ref in skipped]
+    return [work_order["id"] for work_order in created], duplicates
+
+
+def _log_completed(organization_id: int, source: str, created_count: int) -> None:
     logger.info(
         "ingestion.completed",
-        extra={"event": "ingestion_completed", "organization_id": organization_id, "source": source, "created_count": len(created_ids)},
+        extra={"event": "ingestion_completed", "organization_id": organization_id, "source": source, "created_count": created_count},
     )
 
+
+def ingest_rows(
+    organization_id: int, created_by: int, rows: list[WorkOrderIngestRow], source: str
+) -> IngestionResult:
+    """Persist validated rows as work orders and auto-assign them as one batch.
+
+    Priority rules (RF-17) are read once, rows are written with multi-row
+    INSERTs, and assignment runs over the whole batch against a single
+    technician/workload snapshot with bulk audit events -- all in one
+    transaction (joined with the request's unit of work when there is one)."""
+    if not rows:
+        return IngestionResult(
+            created_count=0,
+            duplicate_count=0,
+            failed_count=0,
+            created_work_order_ids=[],
+            duplicate_rows=[],
+            failed_rows=[],
+        )
+
+    with unit_of_work():
+        created_ids, duplicates = _persist_rows(
+            organization_id, created_by, rows, source, _forced_priorities(organization_id)
+        )
+    _log_completed(organization_id, source, len(created_ids))
+
     return IngestionResult(
         created_count=len(created_ids),
+        duplicate_count=len(duplicates),
         failed_count=0,
         created_work_order_ids=created_ids,
+        duplicate_rows=duplicates,
         failed_rows=[],
     )
+
+
+def ingest_csv(organization_id: int, created_by: int, stream: BinaryIO) -> IngestionResult:
+    """RF-09: stream an uploaded CSV into work orders batch by batch.
+
+    Each batch of ``INGESTION_BATCH_SIZE`` rows is persisted as soon as it is
+    parsed, all inside one transaction, so an oversized or undecodable file
+    (ValueError / UnicodeDecodeError) leaves nothing behind."""
+    created_ids: list[int] = []
+    duplicates: list[DuplicateRow] = []
+    failed_rows: list[RowError] = []
+    with unit_of_work():
+        forced_priorities = _forced_priorities(organization_id)
+        for rows, errors in iter_csv_batches(stream, settings.INGESTION_BATCH_SIZE, settings.INGESTION_CSV_MAX_ROWS):
+            if rows:
+                batch_ids, batch_duplicates = _persist_rows(organization_id, created_by, rows, "csv", forced_priorities)
+                created_ids.extend(batch_ids)
+                duplicates.extend(batch_duplicates)
+            failed_rows.extend(errors)
+    _log_completed(organization_id, "csv", len(created_ids))
+
+    return IngestionResult(
+        created_count=len(created_ids),
+        duplicate_count=len(duplicates),
+        failed_count=len(failed_rows),
+        created_work_order_ids=created_ids,
+        duplicate_rows=duplicates,
+        failed_rows=failed_rows,
+    )
+
+
+def ingest_webhook_batch(organization_id: int, items: list[dict]) -> WebhookBatchResult:
+    """RF-11 (batch): create many webhook work orders in one call, idempotently.
+
+    Items are deduplicated on external_ref -- against existing orders and
+    within the batch -- so a retried batch only costs one lookup. Each item
+    gets a result: created, duplicate (with the existing work order id) or
+    invalid (with its validation errors)."""
+    results: list[WebhookBatchItemResult | None] = [None] * len(items)
+    pending: list[tuple[int, WebhookWorkOrderPayload]] = []
+    for index, item in enumerate(items):
+        try:
+            pending.append((index, WebhookWorkOrderPayload(**item)))
+        except ValidationError as exc:
+            results[index] = WebhookBatchItemResult(index=index, status="invalid", errors=_field_errors(exc))
+
+    refs = {row.external_ref for _index, row in pending if row.external_ref}
+    with unit_of_work():
+        existing = work_orders_repo.ids_by_external_ref(organization_id, sorted(refs))
+        to_create: list[tuple[int, WebhookWorkOrderPayload]] = []
+        claimed_refs: set[str] = set()
+        for index, row in pending:
+            if row.external_ref and (row.external_ref in existing or row.external_ref in claimed_refs):
+                continue
+            if row.external_ref:
+                claimed_refs.add(row.external_ref)
+            to_create.append((index, row))
+
+        created: list[dict] = []
+        if to_create:
+            created = _create_rows(
+                organization_id, None, [row for _index, row in to_create], "webhook", _forced_priorities(organization_id)
+            )
+        created_by_ref = {work_order["external_ref"]: work_order for work_order in created if work_order["external_ref"]}
+        existing.update({ref: work_order["id"] for ref, work_order in created_by_ref.items()})
+        created_without_ref = iter(work_order for work_order in created if not work_order["external_ref"])
+
+        for index, row in to_create:
+            work_order = created_by_ref.get(row.external_ref) if row.external_ref else next(created_without_ref)
+            if work_order is not None:
+                results[index] = WebhookBatchItemResult(
+                    index=index, status="created", external_ref=row.external_ref, work_order_id=work_order["id"]
+                )
+
+        # Refs another request inserted between our lookup and our INSERT.
+        raced = sorted(row.external_ref for index, row in to_create if results[index] is None)
+        existing.update(work_orders_repo.ids_by_external_ref(organization_id, raced))
+
+    for index, row in pending:
+        if results[index] is None:
+            results[index] = WebhookBatchItemResult(
+                index=index, status="duplicate", external_ref=row.external_ref, work_order_id=existing.get(row.external_ref)
+            )
+
+    created_count = sum(1 for result in results if result.status == "created")
+    duplicate_count = sum(1 for result in results if result.status == "duplicate")
+    _log_completed(organization_id, "webhook", created_count)
+    return WebhookBatchResult(
+        created_count=created_count,
+        duplicate_count=duplicate_count,
+        failed_count=len(items) - created_count - duplicate_count,
+        results=results,
+    )
+
+
+class LostJobLease(Exception):
+    """Another worker reclaimed the job while this one was processing it."""
+
+
+def enqueue_rows(
+    organization_id: int,
+    created_by: int | None,
+    rows: list[WorkOrderIngestRow],
+    source: str,
+    row_errors: list[RowError] | None = None,
+) -> IngestionJob:
+    """Queue validated rows for a background worker instead of persisting them
+    on the request path. Parse errors are stored with the job for polling."""
+    job = ingestion_jobs_repo.create(
+        organization_id,
+        created_by,
+        source,
+        [row.model_dump() for row in rows],
+        [error.model_dump() for error in row_errors or []],
+    )
+    logger.info(
+        "ingestion.job_queued",
+        extra={"event": "ingestion_job_queued", "organization_id": organization_id, "job_id": job["id"], "source": source, "total_rows": len(rows)},
+    )
+    return _job_from_row(job)
+
+
+def enqueue_csv(organization_id: int, created_by: int, stream: BinaryIO) -> IngestionJob:
+    """RF-09 (async): validate the upload now, so a malformed file is still a
+    400, and leave persistence and assignment to the job worker."""
+    rows: list[WorkOrderIngestRow] = []
+    row_errors: list[RowError] = []
+    for batch_rows, batch_errors in iter_csv_batches(stream, settings.INGESTION_BATCH_SIZE, settings.INGESTION_CSV_MAX_ROWS):
+        rows.extend(batch_rows)
+        row_errors.extend(batch_errors)
+    return enqueue_rows(organization_id, created_by, rows, "csv", row_errors)
+
+
+def get_job(organization_id: int, job_id: int) -> IngestionJob | None:
+    job = ingestion_jobs_repo.get_by_id_in_org(job_id, organization_id)
+    return _job_from_row(job) if job else None
+
+
+def _job_from_row(job: dict) -> IngestionJob:
+    row_errors = [RowError(**error) for error in job["row_errors"] or []]
+    duplicates = [DuplicateRow(**duplicate) for duplicate in job["duplicate_rows"] or []]
+    return IngestionJob(
+        id=job["id"],
+        source=job["source"],
+        status=job["status"],
+        total_rows=job["total_rows"],
+        processed_rows=job["processed_rows"],
+        created_count=job["created_count"],
+        duplicate_count=len(duplicates),
+        failed_count=len(row_errors),
+        created_work_order_ids=job["created_work_order_ids"] or [],
+        duplicate_rows=duplicates,
+        failed_rows=row_errors,
+        error=job["error"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        started_at=job["started_at"],
+        finished_at=job["finished_at"],
+    )
+
+
+def run_next_job(worker_id: str | None = None) -> bool:
+    """Claim and process one queued job. Returns False when the queue is empty
+    (the polling worker then sleeps)."""
+    worker_id = worker_id or worker_identity("ingestion")
+    lease_seconds = settings.INGESTION_JOB_LEASE_SECONDS
+    max_attempts = settings.INGESTION_JOB_MAX_ATTEMPTS
+    abandoned = ingestion_jobs_repo.fail_abandoned(lease_seconds, max_attempts)
+    if abandoned:
+        logger.warning(
+            "ingestion.job_abandoned",
+            extra={"event": "ingestion_job_abandoned", "job_id": abandoned["id"]},
+        )
+    job = ingestion_jobs_repo.claim_next(worker_id, lease_seconds, max_attempts)
+    if job is None:
+        return abandoned is not None
+    process_job(job, worker_id)
+    return True
+
+
+def process_job(job: dict, worker_id: str) -> None:
+    """Persist a claimed job batch by batch. Each batch commits together with
+    its progress update, so a job reclaimed after a crash resumes at
+    ``processed_rows`` without duplicating work orders."""
+    organization_id = job["organization_id"]
+    rows = [WorkOrderIngestRow(**row) for row in job["payload"]["rows"]]
+    batch_size = settings.INGESTION_BATCH_SIZE
+    created_count = 0
+    try:
+        forced_priorities = _forced_priorities(organization_id)
+        for start in range(job["processed_rows"], len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            with unit_of_work():
+                created_ids, duplicates = _persist_rows(
+                    organization_id, job["created_by"], batch, job["source"], forced_priorities
+                )
+                progress = ingestion_jobs_repo.record_progress(
+                    job["id"],
+                    worker_id,
+                    start + len(batch),
+                    created_ids,
+                    [duplicate.model_dump() for duplicate in duplicates],
+                )
+                if progress is None:
+                    raise LostJobLease(f"Ingestion job {job['id']} is no longer leased to {worker_id}")
+            created_count += len(created_ids)
+    except LostJobLease:
+        logger.warning(
+            "ingestion.job_lease_lost",
+            extra={"event": "ingestion_job_lease_lost", "organization_id": organization_id, "job_id": job["id"]},
+        )
+        return
+    except Exception as exc:
+        logger.exception(
+            "ingestion.job_failed",
+            extra={"event": "ingestion_job_failed", "organization_id": organization_id, "job_id": job["id"]},
+        )
+        ingestion_jobs_repo.finish(job["id"], worker_id, "failed", error=str(exc))
+        return
+
+    ingestion_jobs_repo.finish(job["id"], worker_id, "succeeded")
+    _log_completed(organization_id, job["source"], created_count)
@@ -13,11 +13,16 @@ the highest scorer:
 Priority order is applied by the router/service that decides which
 open work orders to process first (RF-17 configurable rules can force a
 work order's priority before it ever reaches the matcher); the matcher
-itself just answers "who is the best fit for this one work order".
+itself just answers "who is the best fit for this one work order" -- or, for
+bulk paths, "which assignment of this batch scores best overall".
 """
 
 import math
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import Optional, Sequence
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
 
 # Weights are intentionally simple/tunable constants for a POC-grade heuristic.
 SKILL_MATCH_WEIGHT = 100.0
@@ -68,20 +73,202 @@ def score_technician(technician: dict, work_order: dict, active_count: int) -> O
     return score
 
 
+@dataclass(frozen=True)
+class RosterMatrix:
+    """Columnar view of a technician roster for vectorized scoring: one array
+    per signal, indexed by the technician's position in ``technicians``.
+    Skills are a boolean (technician x skill) matrix -- one bit per distinct
+    skill in the roster -- so a skill match is a column lookup. Coordinates
+    are kept in radians, the only form the distance formula uses."""
+
+    technicians: list[dict]
+    ids: np.ndarray
+    latitude: np.ndarray  # radians, NaN when unknown
+    longitude: np.ndarray
+    has_coordinates: np.ndarray
+    capacity: np.ndarray
+    available: np.ndarray
+    skill_index: dict[str, int]
+    skills: np.ndarray
+    zone_positions: dict[str, np.ndarray]  # lowercased zone -> technician positions
+
+    @classmethod
+    def from_technicians(cls, technicians: list[dict]) -> "RosterMatrix":
+        count = len(technicians)
+        skill_index: dict[str, int] = {}
+        for technician in technicians:
+            for skill in technician.get("skills") or []:
+                skill_index.setdefault(skill, len(skill_index))
+        skills = np.zeros((count, len(skill_index)), dtype=bool)
+        zones: dict[str, list[int]] = {}
+        for position, technician in enumerate(technicians):
+            for skill in technician.get("skills") or []:
+                skills[position, skill_index[skill]] = True
+            if technician.get("zone"):
+                zones.setdefault(technician["zone"].lower(), []).append(position)
+
+        latitude = np.radians(
+            np.array([_coordinate(technician.get("latitude")) for technician in technicians], dtype=float)
+        )
+        longitude = np.radians(
+            np.array([_coordinate(technician.get("longitude")) for technician in technicians], dtype=float)
+        )
+        return cls(
+            technicians=technicians,
+            ids=np.array([technician["id"] for technician in technicians], dtype=np.int64),
+            latitude=latitude,
+            longitude=longitude,
+            has_coordinates=~(np.isnan(latitude) | np.isnan(longitude)),
+            capacity=np.array([_capacity(technician) for technician in technicians], dtype=float),
+            available=np.array(
+                [technician.get("availability_status") == "available" for technician in technicians], dtype=bool
+            ),
+            skill_index=skill_index,
+            skills=skills,
+            zone_positions={zone: np.array(positions) for zone, positions in zones.items()},
+        )
+
+    def active_array(self, active_counts: dict[int, int]) -> np.ndarray:
+        return np.array([active_counts.get(int(technician_id), 0) for technician_id in self.ids], dtype=float)
+
+    def take(self, positions: Sequence[int]) -> "RosterMatrix":
+        """The rows at ``positions``, in that order, without rebuilding the
+        columns from the technician dicts."""
+        positions = np.asarray(positions, dtype=np.int64)
+        renumbered = np.full(len(self.technicians), -1, dtype=np.int64)
+        renumbered[positions] = np.arange(positions.size)
+        zone_positions = {}
+        for zone, members in self.zone_positions.items():
+            members = renumbered[members]
+            if (members >= 0).any():
+                zone_positions[zone] = np.sort(members[members >= 0])
+        return replace(
+            self,
+            technicians=[self.technicians[position] for position in positions],
+            ids=self.ids[positions],
+            latitude=self.latitude[positions],
+            longitude=self.longitude[positions],
+            has_coordinates=self.has_coordinates[positions],
+            capacity=self.capacity[positions],
+            available=self.available[positions],
+            skills=self.skills[positions],
+            zone_positions=zone_positions,
+        )
+
+
+def _coordinate(value) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _capacity(technician: dict) -> int:
+    return technician.get("max_daily_jobs") or 8
+
+
+def base_scores(roster: RosterMatrix, work_orders: list[dict]) -> np.ndarray:
+    """(work order x technician) skill + proximity/zone scores, i.e.
+    score_technician without the workload term or eligibility checks."""
+    scores = np.zeros((len(work_orders), len(roster.technicians)), dtype=float)
+    if scores.size == 0:
+        return scores
+
+    for row, work_order in enumerate(work_orders):
+        column = roster.skill_index.get(work_order.get("service_type"))
+        if column is not None:
+            scores[row] += roster.skills[:, column] * SKILL_MATCH_WEIGHT
+
+    order_latitude = np.radians(
+        np.array([_coordinate(work_order.get("latitude")) for work_order in work_orders], dtype=float)
+    )
+    order_longitude = np.radians(
+        np.array([_coordinate(work_order.get("longitude")) for work_order in work_orders], dtype=float)
+    )
+    both_known = roster.has_coordinates[None, :] & ~(np.isnan(order_latitude) | np.isnan(order_longitude))[:, None]
+    if both_known.any():
+        # Same formula and argument order as _haversine_km(tech, work order).
+        phi1 = roster.latitude[None, :]
+        phi2 = order_latitude[:, None]
+        dphi = phi2 - phi1
+        dlambda = order_longitude[:, None] - roster.longitude[None, :]
+        a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+        with np.errstate(invalid="ignore"):
+            distance_km = 2 * 6371.0 * np.arcsin(np.sqrt(a))
+        penalty = np.minimum(distance_km * PROXIMITY_WEIGHT, MAX_PROXIMITY_PENALTY)
+        scores -= np.where(both_known, penalty, 0.0)
+
+    if roster.zone_positions:
+        for row, work_order in enumerate(work_orders):
+            address = work_order.get("address")
+            if not address:
+                continue
+            address = address.lower()
+            for zone, positions in roster.zone_positions.items():
+                if zone in address:
+                    fallback = positions[~both_known[row, positions]]
+                    scores[row, fallback] += SKILL_MATCH_WEIGHT / 4
+    return scores
+
+
+def score_matrix(roster: RosterMatrix, work_orders: list[dict], active_counts: dict[int, int]) -> np.ndarray:
+    """Vectorized score_technician for many work orders at once. Ineligible
+    (technician, work order) pairs are -inf where the scalar returns None."""
+    active = roster.active_array(active_counts)
+    scores = base_scores(roster, work_orders) - (active / roster.capacity * WORKLOAD_WEIGHT)[None, :]
+    eligible = roster.available & (active < roster.capacity)
+    scores[:, ~eligible] = -np.inf
+    return scores
+
+
 def find_best_technician(
-    technicians: list[dict], work_order: dict, active_counts: dict[int, int]
+    technicians: list[dict] | RosterMatrix, work_order: dict, active_counts: dict[int, int]
 ) -> Optional[dict]:
-    """Returns the best-fit technician dict, or None if nobody is eligible."""
-    best_technician = None
-    best_score = float("-inf")
-
-    for technician in technicians:
-        active_count = active_counts.get(technician["id"], 0)
-        score = score_technician(technician, work_order, active_count)
-        if score is None:
+    """Returns the best-fit technician dict, or None if nobody is eligible.
+    Ties go to the technician listed first. Pass a prebuilt RosterMatrix
+    (or RosterMatrix.take of its candidate rows) to skip rebuilding the
+    columns."""
+    roster = technicians if isinstance(technicians, RosterMatrix) else RosterMatrix.from_technicians(technicians)
+    if not roster.technicians:
+        return None
+    scores = score_matrix(roster, [work_order], active_counts)[0]
+    best = int(np.argmax(scores))
+    if np.isneginf(scores[best]):
+        return None
+    return roster.technicians[best]
+
+
+def assign_batch(
+    technicians: list[dict] | RosterMatrix, tiers: list[list[dict]], active_counts: dict[int, int]
+) -> dict[int, dict]:
+    """Optimal batch assignment: returns {work_order_id: technician} for as
+    many work orders as there is capacity for.
+
+    ``tiers`` are groups of work orders in priority order; each tier is solved
+    completely before the next one sees the remaining capacity, so a lower
+    tier can never take a slot a higher one wanted. Within a tier every
+    technician is expanded into one column per free slot (the n-th slot
+    scored as if n-1 more jobs were already active, exactly as
+    score_technician would), and the total score is maximized with a
+    rectangular min-cost assignment instead of first-come greedy picks.
+    Pass a prebuilt RosterMatrix to skip rebuilding the columns."""
+    roster = technicians if isinstance(technicians, RosterMatrix) else RosterMatrix.from_technicians(technicians)
+    active = roster.active_array(active_counts)
+    assignments: dict[int, dict] = {}
+    for work_orders in tiers:
+        if not work_orders:
             continue
-        if score > best_score:
-            best_score = score
-            best_technician = technician
+        eligible = np.flatnonzero(roster.available & (active < roster.capacity))
+        if eligible.size == 0:
+            break
+
+        free_slots = np.minimum(roster.capacity[eligible] - active[eligible], len(work_orders)).astype(int)
+        slot_columns = np.repeat(eligible, free_slots)
+        # 0, 1, ... free_slots-1 within each technician's run of slots.
+        slot_offsets = np.arange(slot_columns.size) - np.repeat(np.cumsum(free_slots) - free_slots, free_slots)
+        slot_loads = (active[slot_columns] + slot_offsets) / roster.capacity[slot_columns]
 
-    return best_technician
+        scores = base_scores(roster, work_orders)[:, slot_columns] - slot_loads * WORKLOAD_WEIGHT
+        rows, columns = linear_sum_assignment(scores, maximize=True)
+        for row, column in zip(rows, columns):
+            position = slot_columns[column]
+            assignments[work_orders[row]["id"]] = roster.technicians[position]
+            active[position] += 1
+    return assignments
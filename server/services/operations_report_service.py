@@ -0,0 +1,103 @@
+"""Builds the operations report (RF-25) with its sections running concurrently.
+
+Each section runs on a shared, bounded thread pool in its own unit of work,
+so sections use separate pooled connections and the report takes about as
+long as its slowest section instead of the sum of all five. A section that
+fails or outlives its budget is reported as unavailable rather than failing
+the whole report.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as SectionTimeout
+from functools import partial
+from typing import Callable, Optional
+
+from core.config import settings
+from database import outside_unit_of_work, set_statement_timeout, unit_of_work
+from logger import logger
+from models.dashboard import OperationsReport, UnavailableReportSection
+from repositories import dashboard_rollups as rollups_repo
+from repositories import work_orders as work_orders_repo
+from services import dashboard_rollup_service, workload_service
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.OPERATIONS_REPORT_MAX_WORKERS, thread_name_prefix="techsync-report"
+            )
+        return _executor
+
+
+def _run_section(load: Callable[[], list[dict]], timeout_seconds: float) -> list[dict]:
+    # The database also gives up at the budget, so an abandoned section hands
+    # its connection and thread back instead of running to completion.
+    with outside_unit_of_work(), unit_of_work():
+        set_statement_timeout(timeout_seconds)
+        return load()
+
+
+def build_operations_report(
+    organization_id: int,
+    stale_days: int = 7,
+    hotspot_days: int = 90,
+    completion_days: int = 90,
+    cost_days: int = 90,
+    limit: int = 10,
+) -> OperationsReport:
+    # Rollups refreshed for this report must be committed before the section
+    # threads read them on their own connections.
+    with outside_unit_of_work():
+        dashboard_rollup_service.refresh_for_report(organization_id)
+        freshness = rollups_repo.freshness(organization_id)
+
+    # Hotspots, cycle times and costs come from daily rollups, so their
+    # windows cover whole UTC days; stale and overloaded work stays live.
+    sections = {
+        "stale_work_orders": partial(
+            work_orders_repo.list_stale_work_orders, organization_id, older_than_days=stale_days, limit=limit
+        ),
+        "overloaded_technicians": partial(workload_service.list_overloaded_technicians, organization_id, limit=limit),
+        "property_hotspots": partial(
+            rollups_repo.list_property_hotspots, organization_id, since_days=hotspot_days, limit=limit
+        ),
+        "completion_cycles": partial(
+            rollups_repo.list_completion_cycles, organization_id, since_days=completion_days, limit=limit
+        ),
+        "cost_summary": partial(rollups_repo.list_cost_summary, organization_id, since_days=cost_days, limit=limit),
+    }
+    timeout_seconds = settings.OPERATIONS_REPORT_SECTION_TIMEOUT_SECONDS
+    deadline = time.monotonic() + timeout_seconds
+    executor = _get_executor()
+    futures = {name: executor.submit(_run_section, load, timeout_seconds) for name, load in sections.items()}
+
+    results: dict[str, list[dict]] = {}
+    unavailable: list[UnavailableReportSection] = []
+    for name, future in futures.items():
+        try:
+            results[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            continue
+        except SectionTimeout:
+            future.cancel()
+            reason = "timeout"
+            logger.warning(
+                "dashboard.report_section_timeout",
+                extra={"event": "dashboard_report_section_timeout", "organization_id": organization_id, "section": name},
+            )
+        except Exception:
+            reason = "error"
+            logger.exception(
+                "dashboard.report_section_failed",
+                extra={"event": "dashboard_report_section_failed", "organization_id": organization_id, "section": name},
+            )
+        results[name] = []
+        unavailable.append(UnavailableReportSection(section=name, reason=reason))
+
+    return OperationsReport(freshness=freshness, unavailable_sections=unavailable, **results)
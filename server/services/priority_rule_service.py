@@ -0,0 +1,60 @@
+"""
+Per-org priority rule map read on every work-order create (RF-17).
+
+``org_priority_rules`` is tiny and rarely edited, so each org's rules are
+loaded once into a read-only ``service_type -> forced_priority`` map and
+served from memory. ``priority_rules_repo.upsert_rule`` publishes the
+"priority_rules" topic on this worker after commit and over the change feed
+to every other worker; the TTL is the backstop if a notification is missed.
+"""
+
+from threading import Lock
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from core.cache import MISSING, TTLCache, on_invalidate, register_cache
+from core.config import settings
+from repositories import priority_rules as priority_rules_repo
+
+_rules = register_cache(
+    TTLCache(
+        "priority_rules",
+        max_entries=settings.PRIORITY_RULE_CACHE_MAX_ORGS,
+        ttl_seconds=settings.PRIORITY_RULE_CACHE_TTL_SECONDS,
+    )
+)
+_generations: dict[int, int] = {}
+_generations_lock = Lock()
+
+
+def _generation(organization_id: int) -> int:
+    with _generations_lock:
+        return _generations.get(organization_id, 0)
+
+
+def rules_for_org(organization_id: int) -> Mapping[str, str]:
+    cached = _rules.get(organization_id)
+    if cached is not MISSING:
+        return cached
+
+    generation = _generation(organization_id)
+    rules = MappingProxyType(
+        {rule["service_type"]: rule["forced_priority"] for rule in priority_rules_repo.list_by_org(organization_id)}
+    )
+    # A rule saved while the map was loading must not be hidden behind it.
+    if _generation(organization_id) == generation:
+        _rules.set(organization_id, rules)
+    return rules
+
+
+def forced_priority(organization_id: int, service_type: str) -> Optional[str]:
+    return rules_for_org(organization_id).get(service_type)
+
+
+def _on_rules_changed(organization_id: int, **_keys) -> None:
+    with _generations_lock:
+        _generations[organization_id] = _generations.get(organization_id, 0) + 1
+    _rules.invalidate(organization_id)
+
+
+on_invalidate("priority_rules", _on_rules_changed)
@@ -0,0 +1,107 @@
+"""
+Per-org technician roster snapshot shared by matching and the dashboards
+(RF-14, RF-25).
+
+``technicians_repo.list_by_org`` joins users and reshapes every row; the
+snapshot runs it once per org and version. Technician create/update and user
+role/status changes bump the org's version (via the "technician", "user" and
+"organization" invalidation topics), which retires the cached snapshot; the
+TTL bounds how long a change made by another worker can go unseen.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from core.cache import MISSING, TTLCache, on_invalidate, register_cache
+from core.config import settings
+from repositories import technicians as technicians_repo
+from services.matching_service import RosterMatrix
+
+
+@dataclass(frozen=True)
+class RosterSnapshot:
+    """Immutable roster: rows are read-only mappings (``users`` included) in
+    ``list_by_org`` order. Copy a row with ``dict(row)`` before changing it."""
+
+    organization_id: int
+    version: int
+    technicians: tuple[Mapping[str, Any], ...]
+    by_id: Mapping[int, Mapping[str, Any]] = field(repr=False)
+
+    @classmethod
+    def from_rows(cls, organization_id: int, version: int, rows: list[dict]) -> "RosterSnapshot":
+        technicians = tuple(_freeze(row) for row in rows)
+        return cls(
+            organization_id,
+            version,
+            technicians,
+            MappingProxyType({technician["id"]: technician for technician in technicians}),
+        )
+
+    @cached_property
+    def matrix(self) -> RosterMatrix:
+        """Columnar form for vectorized scoring, built on first use."""
+        return RosterMatrix.from_technicians(list(self.technicians))
+
+    @property
+    def available(self) -> list[Mapping[str, Any]]:
+        return [technician for technician in self.technicians if technician.get("availability_status") == "available"]
+
+
+def _freeze(row: dict) -> Mapping[str, Any]:
+    row = dict(row)
+    if isinstance(row.get("users"), dict):
+        row["users"] = MappingProxyType(dict(row["users"]))
+    for key in ("skills", "certifications"):
+        if isinstance(row.get(key), list):
+            row[key] = tuple(row[key])
+    return MappingProxyType(row)
+
+
+_snapshots = register_cache(
+    TTLCache(
+        "technician_roster",
+        max_entries=settings.ROSTER_CACHE_MAX_ORGS,
+        ttl_seconds=settings.ROSTER_CACHE_TTL_SECONDS,
+    )
+)
+_versions: dict[int, int] = {}
+_versions_lock = Lock()
+
+
+def current_version(organization_id: int) -> int:
+    with _versions_lock:
+        return _versions.get(organization_id, 0)
+
+
+def bump_version(organization_id: int) -> int:
+    with _versions_lock:
+        version = _versions.get(organization_id, 0) + 1
+        _versions[organization_id] = version
+    _snapshots.invalidate(organization_id)
+    return version
+
+
+def get_snapshot(organization_id: int) -> RosterSnapshot:
+    version = current_version(organization_id)
+    cached = _snapshots.get(organization_id)
+    if cached is not MISSING and cached.version == version:
+        return cached
+
+    # The version is read before the query: a bump that lands while the
+    # roster is loading leaves this snapshot stale-on-arrival, not cached as current.
+    snapshot = RosterSnapshot.from_rows(organization_id, version, technicians_repo.list_by_org(organization_id))
+    _snapshots.set(organization_id, snapshot)
+    return snapshot
+
+
+def _on_roster_changed(organization_id: int, **_keys) -> None:
+    bump_version(organization_id)
+
+
+on_invalidate("technician", _on_roster_changed)
+on_invalidate("user", _on_roster_changed)
+on_invalidate("organization", _on_roster_changed)
@@ -0,0 +1,143 @@
+"""
+Per-org spatial index over technician coordinates (RF-14).
+
+Answers "the k nearest eligible technicians within R km" for matching and
+dispatch without scanning the whole roster. Technicians are stored as unit
+vectors on the sphere in a KD-tree, so straight-line (chord) distance orders
+them exactly like great-circle distance. Only available technicians with
+coordinates are indexed; the index is dropped whenever a technician's
+location or availability changes and rebuilt on the next lookup.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from core.cache import MISSING, TTLCache, on_invalidate, register_cache
+from core.config import settings
+from repositories import technicians as technicians_repo
+
+EARTH_RADIUS_KM = 6371.0
+# Technician columns that change what the index contains.
+INDEXED_FIELDS = frozenset({"latitude", "longitude", "availability_status"})
+
+
+def _unit_vectors(latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    phi, lam = np.radians(latitude), np.radians(longitude)
+    return np.column_stack((np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)))
+
+
+def _chord_for_km(distance_km: float) -> float:
+    angle = min(distance_km / EARTH_RADIUS_KM, math.pi)
+    return 2 * math.sin(angle / 2)
+
+
+def _km_for_chord(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+@dataclass(frozen=True)
+class TechnicianSpatialIndex:
+    organization_id: int
+    technician_ids: tuple[int, ...]
+    tree: Optional[cKDTree]
+
+    @classmethod
+    def build(cls, organization_id: int, technicians: list[dict]) -> "TechnicianSpatialIndex":
+        located = [
+            technician
+            for technician in technicians
+            if technician.get("availability_status") == "available"
+            and technician.get("latitude") is not None
+            and technician.get("longitude") is not None
+        ]
+        if not located:
+            return cls(organization_id, (), None)
+        points = _unit_vectors(
+            np.array([technician["latitude"] for technician in located], dtype=float),
+            np.array([technician["longitude"] for technician in located], dtype=float),
+        )
+        return cls(organization_id, tuple(technician["id"] for technician in located), cKDTree(points))
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        radius_km: float,
+        eligible: Optional[Callable[[int], bool]] = None,
+    ) -> list[tuple[int, float]]:
+        """Up to ``k`` (technician_id, distance_km) pairs within ``radius_km``,
+        nearest first, skipping ids ``eligible`` rejects. Widens the tree
+        query until k eligible technicians are found or the radius runs out."""
+        if self.tree is None or k <= 0:
+            return []
+        size = len(self.technician_ids)
+        point = _unit_vectors(np.array([latitude], dtype=float), np.array([longitude], dtype=float))[0]
+        max_chord = _chord_for_km(radius_km)
+        query_k = min(size, k)
+        while True:
+            distances, positions = self.tree.query(point, k=query_k, distance_upper_bound=max_chord * (1 + 1e-12))
+            distances, positions = np.atleast_1d(distances), np.atleast_1d(positions)
+            # Missing neighbours come back as position == size, distance == inf.
+            found = [(int(position), float(chord)) for position, chord in zip(positions, distances) if position < size]
+            matches = [
+                (self.technician_ids[position], _km_for_chord(chord))
+                for position, chord in found
+                if eligible is None or eligible(self.technician_ids[position])
+            ]
+            if len(matches) >= k or len(found) < query_k or query_k == size:
+                return matches[:k]
+            query_k = min(size, query_k * 2)
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        eligible: Optional[Callable[[int], bool]] = None,
+    ) -> list[int]:
+        """Ids of every technician within ``radius_km``, in no particular
+        order, skipping ids ``eligible`` rejects."""
+        if self.tree is None:
+            return []
+        point = _unit_vectors(np.array([latitude], dtype=float), np.array([longitude], dtype=float))[0]
+        positions = self.tree.query_ball_point(point, _chord_for_km(radius_km) * (1 + 1e-12))
+        return [
+            self.technician_ids[position]
+            for position in positions
+            if eligible is None or eligible(self.technician_ids[position])
+        ]
+
+
+_indexes = register_cache(
+    TTLCache(
+        "technician_spatial_index",
+        max_entries=settings.TECHNICIAN_INDEX_CACHE_MAX_ORGS,
+        ttl_seconds=settings.TECHNICIAN_INDEX_CACHE_TTL_SECONDS,
+    )
+)
+
+
+def get_index(organization_id: int, technicians: Optional[list[dict]] = None) -> TechnicianSpatialIndex:
+    """Cached index for the org; built from ``technicians`` when the caller
+    already loaded the roster, otherwise from a fresh roster query."""
+    cached = _indexes.get(organization_id)
+    if cached is not MISSING:
+        return cached
+    if technicians is None:
+        technicians = technicians_repo.list_by_org(organization_id)
+    index = TechnicianSpatialIndex.build(organization_id, technicians)
+    _indexes.set(organization_id, index)
+    return index
+
+
+def _on_technician_changed(organization_id: int, fields: tuple[str, ...] = (), **_keys) -> None:
+    if not fields or INDEXED_FIELDS.intersection(fields):
+        _indexes.invalidate(organization_id)
+
+
+on_invalidate("technician", _on_technician_changed)
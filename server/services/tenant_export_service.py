@@ -1,9 +1,20 @@
-"""Tenant-owned JSON export bundle without auth/provider secrets."""
+"""Tenant-owned JSON export bundle without auth/provider secrets.
+
+The bundle is encoded incrementally: each entity is read through a
+server-side cursor and written one row at a time, so memory stays flat for
+tenants of any size and the download starts before the last query runs.
+``record_counts`` is tallied while rows go out and therefore follows
+``data`` in the document.
+"""
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
-from typing import Any
+from io import StringIO
+from typing import Any, Callable, Iterable, Iterator
+
+from fastapi.encoders import jsonable_encoder
 
 from repositories import (
     attachments as attachments_repo,
@@ -65,6 +76,14 @@ TECHNICIAN_FIELDS = [
     "users",
 ]
 
+EXPORT_NOTES = [
+    "Attachment binary files are not embedded in this JSON bundle.",
+    "Attachment storage paths, API keys, password hashes, provider IDs, and token hashes are omitted.",
+]
+
+# Encoded JSON is buffered until it reaches this size.
+EXPORT_CHUNK_CHARS = 64 * 1024
+
 ATTACHMENT_METADATA_FIELDS = [
     "id",
     "work_order_id",
@@ -89,48 +108,77 @@ def _sanitize(row: dict[str, Any]) -> dict[str, Any]:
     return clean
 
 
-def build_tenant_export(organization: dict[str, Any]) -> dict[str, Any]:
-    """Build an org-scoped export bundle for admin-controlled data portability.
+def _sections(organization_id: int) -> list[tuple[str, Callable[[], Iterable[dict]], Callable[[dict], dict]]]:
+    """(key under ``data``, row source, row shaping). Sources are called only
+    when their section is reached, so at most one cursor is open at a time."""
+    return [
+        ("users", lambda: users_repo.iter_by_org(organization_id), lambda row: _pick(row, USER_FIELDS)),
+        (
+            "technicians",
+            lambda: technicians_repo.iter_by_org(organization_id),
+            lambda row: _pick(row, TECHNICIAN_FIELDS),
+        ),
+        ("clients", lambda: clients_repo.iter_by_org(organization_id), _sanitize),
+        ("properties", lambda: properties_repo.iter_by_org(organization_id), _sanitize),
+        ("vendors", lambda: vendors_repo.iter_by_org(organization_id), _sanitize),
+        ("work_orders", lambda: work_orders_repo.iter_by_org(organization_id), _sanitize),
+        ("work_order_messages", lambda: messages_repo.iter_by_org(organization_id), _sanitize),
+        ("work_order_events", lambda: events_repo.iter_by_org(organization_id), _sanitize),
+        (
+            "attachment_metadata",
+            lambda: attachments_repo.iter_metadata_by_org(organization_id),
+            lambda row: _pick(row, ATTACHMENT_METADATA_FIELDS),
+        ),
+    ]
+
+
+def _encode(value: Any) -> str:
+    # Same output as JSONResponse(jsonable_encoder(...)), one value at a time.
+    return json.dumps(value, default=jsonable_encoder, ensure_ascii=False, separators=(",", ":"))
+
+
+def iter_tenant_export(organization: dict[str, Any]) -> Iterator[str]:
+    """Yield an org-scoped export bundle, as JSON text in chunks, for
+    admin-controlled data portability.
 
     The bundle intentionally excludes credential-bearing fields and attachment
     storage paths. It is suitable for demo evidence and customer data export
     workflows, but binary files still need a provider-specific storage export.
     """
 
-    organization_id = organization["id"]
-    users = [_pick(row, USER_FIELDS) for row in users_repo.list_by_org(organization_id)]
-    technicians = [_pick(row, TECHNICIAN_FIELDS) for row in technicians_repo.list_by_org(organization_id)]
-    clients = [_sanitize(row) for row in clients_repo.list_by_org(organization_id)]
-    properties = [_sanitize(row) for row in properties_repo.list_by_org(organization_id)]
-    vendors = [_sanitize(row) for row in vendors_repo.list_by_org(organization_id)]
-    work_orders = [_sanitize(row) for row in work_orders_repo.list_filtered(organization_id)]
-    messages = [_sanitize(row) for row in messages_repo.list_by_org(organization_id)]
-    audit_events = [_sanitize(row) for row in events_repo.list_by_org(organization_id)]
-    attachment_metadata = [
-        _pick(row, ATTACHMENT_METADATA_FIELDS) for row in attachments_repo.list_metadata_by_org(organization_id)
-    ]
-
-    data = {
-        "users": users,
-        "technicians": technicians,
-        "clients": clients,
-        "properties": properties,
-        "vendors": vendors,
-        "work_orders": work_orders,
-        "work_order_messages": messages,
-        "work_order_events": audit_events,
-        "attachment_metadata": attachment_metadata,
-    }
-
-    return {
-        "schema_version": "techsync_ops_tenant_export.v1",
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "organization": _pick(organization, ORGANIZATION_FIELDS),
-        "record_counts": {key: len(rows) for key, rows in data.items()},
-        "data": data,
-        "omitted_sensitive_fields": sorted(OMITTED_SENSITIVE_FIELDS),
-        "notes": [
-            "Attachment binary files are not embedded in this JSON bundle.",
-            "Attachment storage paths, API keys, password hashes, provider IDs, and token hashes are omitted.",
-        ],
-    }
+    output = StringIO()
+    output.write(
+        "{"
+        f'"schema_version":{_encode("techsync_ops_tenant_export.v1")},'
+        f'"generated_at":{_encode(datetime.now(timezone.utc).isoformat())},'
+        f'"organization":{_encode(_pick(organization, ORGANIZATION_FIELDS))},'
+        '"data":{'
+    )
+    yield output.getvalue()
+    output.seek(0)
+    output.truncate()
+
+    record_counts: dict[str, int] = {}
+    for index, (key, rows, shape) in enumerate(_sections(organization["id"])):
+        output.write(f'{"," if index else ""}{_encode(key)}:[')
+        count = 0
+        for row in rows():
+            if count:
+                output.write(",")
+            output.write(_encode(shape(row)))
+            count += 1
+            if output.tell() >= EXPORT_CHUNK_CHARS:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        output.write("]")
+        record_counts[key] = count
+
+    output.write(
+        "},"
+        f'"record_counts":{_encode(record_counts)},'
+        f'"omitted_sensitive_fields":{_encode(sorted(OMITTED_SENSITIVE_FIELDS))},'
+        f'"notes":{_encode(EXPORT_NOTES)}'
+        "}"
+    )
+    yield output.getvalue()
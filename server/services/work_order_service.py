@@ -4,15 +4,26 @@ and keep the audit log (work_order_events) consistent (RF-14, RF-15, RF-18,
 RF-20).
 """
 
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
+from core.config import settings
 from models.work_order import ALLOWED_STATUS_TRANSITIONS
-from repositories import attachments as attachments_repo
-from repositories import priority_rules as priority_rules_repo
 from repositories import technicians as technicians_repo
 from repositories import work_order_events as events_repo
 from repositories import work_orders as work_orders_repo
-from services import matching_service, notification_service
+from services import (
+    matching_service,
+    notification_service,
+    priority_rule_service,
+    roster_service,
+    spatial_index_service,
+    workload_service,
+)
+
+
+PRIORITY_RANK = {"emergency": 0, "high": 1, "medium": 2, "low": 3}
+# Conditional updates a status transition tries before giving up on a hot row.
+TRANSITION_ATTEMPTS = 3
 
 
 class InvalidStatusTransition(Exception):
@@ -34,36 +45,91 @@ class ArchiveNotAllowed(Exception):
     """Raised when a non-manager attempts to archive a work order."""
 
 
-def _active_counts(organization_id: int) -> dict[int, int]:
-    open_orders = work_orders_repo.list_filtered(organization_id, status="open")
-    in_progress_orders = work_orders_repo.list_filtered(organization_id, status="in_progress")
-    counts: dict[int, int] = {}
-    for row in open_orders + in_progress_orders:
-        technician_id = row.get("assigned_technician_id")
-        if technician_id:
-            counts[technician_id] = counts.get(technician_id, 0) + 1
-    return counts
+class ConcurrentStatusChange(Exception):
+    """Raised when a work order keeps changing status underneath a transition."""
 
 
 def apply_priority_rule(organization_id: int, service_type: str, requested_priority: str) -> str:
     """RF-17: an org-configured rule can force a priority for a given service_type."""
-    forced = priority_rules_repo.get_forced_priority(organization_id, service_type)
+    forced = priority_rule_service.forced_priority(organization_id, service_type)
     return forced or requested_priority
 
 
+def matching_candidates(
+    organization_id: int, technicians: Sequence[Mapping], work_order: dict, active_counts: dict[int, int]
+) -> Optional[list[int]]:
+    """Roster positions of the technicians who can still win a located work
+    order, so find_best_technician picks exactly who a full scan would.
+
+    The k nearest technicians with spare capacity come from the spatial
+    index. The k-th of them loses less than WORKLOAD_WEIGHT to workload, so
+    a technician without the skill who is more than WORKLOAD_WEIGHT /
+    PROXIMITY_WEIGHT km farther away cannot outscore it; everyone closer is
+    kept, as are technicians with the work order's skill and everyone
+    without coordinates (zone match), who can win from any distance.
+    Positions are ascending so ties break as in a full scan. None means
+    score the whole roster: the work order has no coordinates, nobody is in
+    range, or that reach gets to where the proximity penalty stops growing
+    (everyone past it scores the same)."""
+    latitude, longitude = work_order.get("latitude"), work_order.get("longitude")
+    if latitude is None or longitude is None:
+        return None
+
+    by_id = {technician["id"]: technician for technician in technicians}
+
+    def has_capacity(technician_id: int) -> bool:
+        technician = by_id.get(technician_id)
+        return technician is not None and active_counts.get(technician_id, 0) < (technician.get("max_daily_jobs") or 8)
+
+    index = spatial_index_service.get_index(organization_id, technicians)
+    nearby = index.nearest(
+        latitude,
+        longitude,
+        k=settings.MATCHING_CANDIDATE_COUNT,
+        radius_km=settings.MATCHING_CANDIDATE_RADIUS_KM,
+        eligible=has_capacity,
+    )
+    if not nearby:
+        return None
+    reach_km = nearby[-1][1] + matching_service.WORKLOAD_WEIGHT / matching_service.PROXIMITY_WEIGHT
+    if reach_km >= matching_service.MAX_PROXIMITY_PENALTY / matching_service.PROXIMITY_WEIGHT:
+        return None
+
+    candidate_ids = {technician_id for technician_id, _distance in nearby}
+    candidate_ids.update(index.within(latitude, longitude, reach_km, eligible=has_capacity))
+    service_type = work_order.get("service_type")
+    return [
+        position
+        for position, technician in enumerate(technicians)
+        if technician["id"] in candidate_ids
+        or technician.get("latitude") is None
+        or technician.get("longitude") is None
+        or (service_type and service_type in (technician.get("skills") or []))
+    ]
+
+
 def auto_assign(organization_id: int, work_order: dict) -> Optional[dict]:
     """RF-14: pick the best technician and persist the assignment. Returns the
     updated work order row, or the original row unchanged if nobody is eligible."""
-    technicians = technicians_repo.list_by_org(organization_id)
-    active_counts = _active_counts(organization_id)
+    roster = roster_service.get_snapshot(organization_id)
+    active_counts = workload_service.get_snapshot(organization_id).active_counts()
 
-    best = matching_service.find_best_technician(technicians, work_order, active_counts)
+    positions = matching_candidates(organization_id, roster.technicians, work_order, active_counts)
+    candidates = roster.matrix if positions is None else roster.matrix.take(positions)
+    best = matching_service.find_best_technician(candidates, work_order, active_counts)
     if not best:
         return work_order
 
     updated = work_orders_repo.update(
         work_order["id"], organization_id, {"assigned_technician_id": best["id"]}
     )
+    workload_service.record_change(
+        organization_id,
+        from_technician_id=work_order.get("assigned_technician_id"),
+        from_status=work_order.get("status"),
+        to_technician_id=best["id"],
+        to_status=work_order.get("status"),
+    )
     events_repo.create_event(
         organization_id,
         work_order["id"],
@@ -74,6 +140,57 @@ def auto_assign(organization_id: int, work_order: dict) -> Optional[dict]:
     return updated
 
 
+def auto_assign_batch(organization_id: int, work_orders: list[dict]) -> list[dict]:
+    """RF-14 for bulk paths: solve the whole batch against one technician
+    roster and workload snapshot with matching_service.assign_batch (priority
+    tiers first, so emergencies get first pick of capacity), then persist the
+    assignments and their audit events in bulk. Returns the updated rows of
+    the assigned work orders."""
+    if not work_orders:
+        return []
+
+    roster = roster_service.get_snapshot(organization_id)
+    active_counts = workload_service.get_snapshot(organization_id).active_counts()
+
+    tiers: dict[int, list[dict]] = {}
+    for work_order in work_orders:
+        tiers.setdefault(PRIORITY_RANK.get(work_order.get("priority"), len(PRIORITY_RANK)), []).append(work_order)
+    chosen = matching_service.assign_batch(roster.matrix, [tiers[rank] for rank in sorted(tiers)], active_counts)
+    if not chosen:
+        return []
+
+    updated_rows = work_orders_repo.assign_many(
+        organization_id, {work_order_id: technician["id"] for work_order_id, technician in chosen.items()}
+    )
+    events_repo.create_events(
+        [
+            events_repo.event_row(
+                organization_id,
+                work_order_id,
+                event_type="assigned",
+                notes=f"Auto-assigned to technician {technician['id']}",
+            )
+            for work_order_id, technician in chosen.items()
+        ]
+    )
+    originals = {work_order["id"]: work_order for work_order in work_orders}
+    workload_service.record_changes(
+        organization_id,
+        [
+            (
+                originals[row["id"]].get("assigned_technician_id"),
+                originals[row["id"]].get("status"),
+                row["assigned_technician_id"],
+                row.get("status"),
+            )
+            for row in updated_rows
+        ],
+    )
+    for row in updated_rows:
+        notification_service.notify_technician_assigned(chosen[row["id"]], row)
+    return updated_rows
+
+
 def reassign(organization_id: int, work_order_id: int, technician_id: int, actor_user_id: int, notes: Optional[str]) -> Optional[dict]:
     """RF-15: manual reassignment by a coordinator/admin."""
     work_order = work_orders_repo.get_by_id_in_org(work_order_id, organization_id)
@@ -87,6 +204,13 @@ def reassign(organization_id: int, work_order_id: int, technician_id: int, actor
     updated = work_orders_repo.update(
         work_order_id, organization_id, {"assigned_technician_id": technician_id}
     )
+    workload_service.record_change(
+        organization_id,
+        from_technician_id=work_order.get("assigned_technician_id"),
+        from_status=work_order.get("status"),
+        to_technician_id=technician_id,
+        to_status=work_order.get("status"),
+    )
     events_repo.create_event(
         organization_id,
         work_order_id,
@@ -98,6 +222,41 @@ def reassign(organization_id: int, work_order_id: int, technician_id: int, actor
     return updated
 
 
+def bulk_reassign(
+    organization_id: int, work_order_ids: list[int], technician_id: int, actor_user_id: int, notes: Optional[str]
+) -> list[dict]:
+    """RF-15 (bulk): move many work orders to one technician in a single
+    statement. Returns {"work_order_id", "outcome", "status"} per distinct id."""
+    technician = technicians_repo.get_by_id_in_org(technician_id, organization_id)
+    if not technician:
+        raise ValueError("Technician not found in this organization")
+
+    results = work_orders_repo.reassign_many(organization_id, work_order_ids, technician_id, actor_user_id, notes)
+    outcomes, changes = [], []
+    for result in results:
+        updated, previous_status = result["updated"], result["previous_status"]
+        if updated is not None:
+            outcome = "updated"
+            changes.append((result["previous_technician_id"], previous_status, technician_id, updated["status"]))
+        elif previous_status is None:
+            outcome = "not_found"
+        elif result["previous_technician_id"] == technician_id:
+            outcome = "unchanged"
+        else:
+            outcome = "conflict"
+        outcomes.append(
+            {
+                "work_order_id": result["work_order_id"],
+                "outcome": outcome,
+                "status": updated["status"] if updated is not None else previous_status,
+            }
+        )
+        if updated is not None:
+            notification_service.notify_technician_assigned(technician, updated)
+    workload_service.record_changes(organization_id, changes)
+    return outcomes
+
+
 def transition_status(
     organization_id: int,
     work_order_id: int,
@@ -106,50 +265,116 @@ def transition_status(
     actor_role: str,
     notes: Optional[str],
     completion_override_reason: Optional[str] = None,
+    work_order: Optional[dict] = None,
 ) -> dict:
-    work_order = work_orders_repo.get_by_id_in_org(work_order_id, organization_id)
-    if not work_order:
-        raise LookupError("Work order not found")
-
-    current_status = work_order["status"]
-    if new_status != current_status and new_status not in ALLOWED_STATUS_TRANSITIONS.get(current_status, set()):
-        raise InvalidStatusTransition(current_status, new_status)
-    if new_status == "archived" and actor_role not in ("org_admin", "coordinator"):
-        raise ArchiveNotAllowed()
-
-    patch = {"status": new_status}
-    if new_status == "completed":
-        from datetime import datetime, timezone
-
-        now = datetime.now(timezone.utc).isoformat()
-        has_completion_proof = attachments_repo.has_for_work_order(organization_id, work_order_id)
-
-        if has_completion_proof:
-            patch["completion_proof_verified_at"] = now
-            patch["completion_override_reason"] = None
-        elif completion_override_reason:
-            if actor_role not in ("org_admin", "coordinator"):
+    """Validate and apply a status change. The update, proof check and audit
+    event run as one conditional statement; if another request moved the
+    order first, the change is re-validated against the fresh status.
+    Pass ``work_order`` when the caller already loaded it."""
+    if work_order is None:
+        work_order = work_orders_repo.get_by_id_in_org(work_order_id, organization_id)
+    is_manager = actor_role in ("org_admin", "coordinator")
+
+    for _attempt in range(TRANSITION_ATTEMPTS):
+        if not work_order:
+            raise LookupError("Work order not found")
+
+        current_status = work_order["status"]
+        if new_status != current_status and new_status not in ALLOWED_STATUS_TRANSITIONS.get(current_status, set()):
+            raise InvalidStatusTransition(current_status, new_status)
+        if new_status == "archived" and not is_manager:
+            raise ArchiveNotAllowed()
+
+        completing = new_status == "completed"
+        event_notes = notes
+        if completing and completion_override_reason:
+            event_notes = f"Completion override: {completion_override_reason}"
+
+        result = work_orders_repo.transition_status(
+            organization_id,
+            work_order_id,
+            from_status=current_status,
+            to_status=new_status,
+            actor_user_id=actor_user_id,
+            event_notes=event_notes,
+            completion_notes=notes or None,
+            override_reason=completion_override_reason if is_manager else None,
+        )
+        if result is None:
+            raise LookupError("Work order not found")
+
+        updated = result["work_order"]
+        if updated is not None:
+            workload_service.record_change(
+                organization_id,
+                from_technician_id=work_order.get("assigned_technician_id"),
+                from_status=current_status,
+                to_technician_id=updated.get("assigned_technician_id"),
+                to_status=new_status,
+            )
+            return updated
+
+        if completing and not result["has_proof"] and result["current_status"] == current_status:
+            if completion_override_reason:
                 raise CompletionOverrideNotAllowed()
-            patch["completion_override_reason"] = completion_override_reason
-            patch["completion_proof_verified_at"] = None
-        else:
             raise CompletionProofRequired()
+        # Lost the race: re-check the transition against the committed status.
+        work_order = work_orders_repo.get_by_id_in_org(work_order_id, organization_id)
 
-        patch["completed_at"] = now
-        if notes:
-            patch["completion_notes"] = notes
+    raise ConcurrentStatusChange()
 
-    updated = work_orders_repo.update(work_order_id, organization_id, patch)
+
+def bulk_transition_status(
+    organization_id: int,
+    work_order_ids: list[int],
+    new_status: str,
+    actor_user_id: int,
+    notes: Optional[str],
+    completion_override_reason: Optional[str] = None,
+) -> list[dict]:
+    """Manager-only bulk form of transition_status. ALLOWED_STATUS_TRANSITIONS
+    and the completion-proof gate are applied in SQL to every order at once;
+    orders already in ``new_status`` are reported as unchanged rather than
+    re-logged. Returns {"work_order_id", "outcome", "status"} per distinct id."""
+    from_statuses = [status for status, targets in ALLOWED_STATUS_TRANSITIONS.items() if new_status in targets]
+    completing = new_status == "completed"
     event_notes = notes
-    if new_status == "completed" and completion_override_reason:
+    if completing and completion_override_reason:
         event_notes = f"Completion override: {completion_override_reason}"
-    events_repo.create_event(
+
+    results = work_orders_repo.transition_status_many(
         organization_id,
-        work_order_id,
-        event_type="status_changed",
-        actor_user_id=actor_user_id,
-        from_status=current_status,
+        work_order_ids,
         to_status=new_status,
-        notes=event_notes,
+        from_statuses=from_statuses,
+        actor_user_id=actor_user_id,
+        event_notes=event_notes,
+        completion_notes=notes or None,
+        override_reason=completion_override_reason,
     )
-    return updated
+    outcomes, changes = [], []
+    for result in results:
+        updated, previous_status = result["updated"], result["previous_status"]
+        if updated is not None:
+            outcome = "updated"
+            technician_id = updated.get("assigned_technician_id")
+            changes.append((technician_id, previous_status, technician_id, new_status))
+        elif previous_status is None:
+            outcome = "not_found"
+        elif previous_status == new_status:
+            outcome = "unchanged"
+        elif previous_status not in from_statuses:
+            outcome = "invalid_transition"
+        elif completing and not result["has_proof"] and not completion_override_reason:
+            outcome = "proof_required"
+        else:
+            outcome = "conflict"
+        outcomes.append(
+            {
+                "work_order_id": result["work_order_id"],
+                "outcome": outcome,
+                "status": updated["status"] if updated is not None else previous_status,
+            }
+        )
+    workload_service.record_changes(organization_id, changes)
+    return outcomes
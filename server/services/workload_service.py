@@ -0,0 +1,195 @@
+"""
+Per-technician active work-order counts shared by auto-assignment, the
+overloaded-technician report, and the dispatch board (RF-14, RF-25).
+
+One grouped query fills a per-org snapshot from committed rows. Within a
+request, assignment and status changes are overlaid on the snapshot instead
+of re-counting the tenant, so a CSV import pays for one count; once the
+transaction commits the org's snapshot is dropped and the next request
+re-counts. Other processes' changes drop it through the change feed. A count
+that overlapped a committed change is not cached, since it may or may not
+include that change. Counts are kept per status because each consumer has
+always had its own notion of "active".
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from core.cache import MISSING, TTLCache, on_invalidate, register_cache
+from core.config import settings
+from database import after_commit, current_unit_of_work, outside_unit_of_work
+from repositories import work_orders as work_orders_repo
+from services import roster_service
+
+WORKLOAD_STATUSES = ("open", "in_progress", "paused", "escalated")
+ASSIGNMENT_STATUSES = ("open", "in_progress")
+OVERLOAD_STATUSES = ("open", "in_progress", "escalated")
+
+
+@dataclass(frozen=True)
+class WorkloadSnapshot:
+    organization_id: int
+    counts: dict[int, dict[str, int]] = field(default_factory=dict)
+
+    def active_count(self, technician_id: int, statuses: Iterable[str] = ASSIGNMENT_STATUSES) -> int:
+        by_status = self.counts.get(technician_id, {})
+        return sum(by_status.get(status, 0) for status in statuses)
+
+    def active_counts(self, statuses: Iterable[str] = ASSIGNMENT_STATUSES) -> dict[int, int]:
+        statuses = tuple(statuses)
+        return {technician_id: self.active_count(technician_id, statuses) for technician_id in self.counts}
+
+
+_snapshots = register_cache(
+    TTLCache(
+        "technician_workload",
+        max_entries=settings.WORKLOAD_CACHE_MAX_ORGS,
+        ttl_seconds=settings.WORKLOAD_CACHE_TTL_SECONDS,
+    )
+)
+
+
+# organization_id -> number of committed changes seen by this process; a
+# count is only cached if no change committed while it ran.
+_generations: dict[int, int] = {}
+_generations_lock = threading.Lock()
+
+
+def _changes_committed(organization_id: int) -> None:
+    with _generations_lock:
+        _generations[organization_id] = _generations.get(organization_id, 0) + 1
+        _snapshots.invalidate(organization_id)
+
+
+def get_snapshot(organization_id: int) -> WorkloadSnapshot:
+    """The shared snapshot, plus any changes the active unit of work has
+    recorded but not yet committed."""
+    snapshot = _snapshots.get(organization_id)
+    if snapshot is MISSING:
+        generation = _generations.get(organization_id, 0)
+        counts: dict[int, dict[str, int]] = {}
+        # Count committed rows only: the shared cache must not pick up this
+        # transaction's writes, which are overlaid below until they commit.
+        with outside_unit_of_work():
+            rows = work_orders_repo.active_counts_by_technician(organization_id)
+        for row in rows:
+            counts.setdefault(row["technician_id"], {})[row["status"]] = int(row["count"] or 0)
+        snapshot = WorkloadSnapshot(organization_id, counts)
+        with _generations_lock:
+            if _generations.get(organization_id, 0) == generation:
+                _snapshots.set(organization_id, snapshot)
+
+    unit = current_unit_of_work()
+    pending = unit.state.get(PENDING_STATE_KEY, {}).get(organization_id) if unit is not None else None
+    return _apply_deltas(snapshot, pending) if pending else snapshot
+
+
+def count_work_orders(organization_id: int, work_orders: Iterable[dict]) -> WorkloadSnapshot:
+    """Snapshot of the given active rows, without touching the cache."""
+    counts: dict[int, dict[str, int]] = {}
+    for row in work_orders:
+        technician_id = row.get("assigned_technician_id")
+        if technician_id is None or row.get("status") not in WORKLOAD_STATUSES:
+            continue
+        by_status = counts.setdefault(technician_id, {})
+        by_status[row["status"]] = by_status.get(row["status"], 0) + 1
+    return WorkloadSnapshot(organization_id, counts)
+
+
+WorkloadChange = tuple[Optional[int], Optional[str], Optional[int], Optional[str]]
+WorkloadDeltas = dict[tuple[int, str], int]
+
+# UnitOfWork.state key: organization_id -> deltas recorded but not yet committed.
+PENDING_STATE_KEY = "workload_deltas"
+
+
+def _apply_deltas(snapshot: WorkloadSnapshot, deltas: WorkloadDeltas) -> WorkloadSnapshot:
+    counts = {key: dict(value) for key, value in snapshot.counts.items()}
+    for (technician_id, status), delta in deltas.items():
+        by_status = counts.setdefault(technician_id, {})
+        by_status[status] = max(0, by_status.get(status, 0) + delta)
+    return WorkloadSnapshot(snapshot.organization_id, counts)
+
+
+def _publish_all(pending_by_org: dict[int, WorkloadDeltas]) -> None:
+    for organization_id in pending_by_org:
+        _changes_committed(organization_id)
+
+
+def record_change(
+    organization_id: int,
+    from_technician_id: Optional[int],
+    from_status: Optional[str],
+    to_technician_id: Optional[int],
+    to_status: Optional[str],
+) -> None:
+    """Account for one assignment or status change.
+
+    Inside a unit of work the adjustment is held on the unit: later
+    assignments in the same request (e.g. a CSV import) see it through
+    get_snapshot, a rollback simply discards it, and a commit drops the
+    shared snapshot so other requests re-count. Outside one the write has
+    already committed, so the snapshot is dropped at once."""
+    record_changes(organization_id, [(from_technician_id, from_status, to_technician_id, to_status)])
+
+
+def record_changes(organization_id: int, changes: list[WorkloadChange]) -> None:
+    """Batch form of record_change: (from_technician_id, from_status,
+    to_technician_id, to_status) tuples."""
+    deltas: WorkloadDeltas = {}
+    for from_technician_id, from_status, to_technician_id, to_status in changes:
+        if (from_technician_id, from_status) == (to_technician_id, to_status):
+            continue
+        if from_technician_id is not None and from_status in WORKLOAD_STATUSES:
+            deltas[(from_technician_id, from_status)] = deltas.get((from_technician_id, from_status), 0) - 1
+        if to_technician_id is not None and to_status in WORKLOAD_STATUSES:
+            deltas[(to_technician_id, to_status)] = deltas.get((to_technician_id, to_status), 0) + 1
+    if not any(deltas.values()):
+        return
+
+    unit = current_unit_of_work()
+    if unit is None:
+        _changes_committed(organization_id)
+        return
+    if PENDING_STATE_KEY not in unit.state:
+        pending_by_org: dict[int, WorkloadDeltas] = {}
+        unit.state[PENDING_STATE_KEY] = pending_by_org
+        after_commit(lambda: _publish_all(pending_by_org))
+    pending = unit.state[PENDING_STATE_KEY].setdefault(organization_id, {})
+    for key, delta in deltas.items():
+        pending[key] = pending.get(key, 0) + delta
+
+
+def list_overloaded_technicians(organization_id: int, limit: int = 20) -> list[dict]:
+    """Technicians carrying more open/in-progress/escalated work than their
+    max_daily_jobs, busiest first."""
+    snapshot = get_snapshot(organization_id)
+    overloaded = []
+    for technician in roster_service.get_snapshot(organization_id).technicians:
+        max_daily_jobs = technician.get("max_daily_jobs")
+        active_count = snapshot.active_count(technician["id"], OVERLOAD_STATUSES)
+        if max_daily_jobs is None or active_count <= max_daily_jobs:
+            continue
+        overloaded.append(
+            {
+                "technician_id": technician["id"],
+                "user_id": technician.get("user_id"),
+                "full_name": technician["users"]["full_name"],
+                "email": technician["users"]["email"],
+                "availability_status": technician.get("availability_status"),
+                "max_daily_jobs": max_daily_jobs,
+                "active_work_order_count": active_count,
+            }
+        )
+    overloaded.sort(key=lambda row: (-row["active_work_order_count"], row["max_daily_jobs"]))
+    return overloaded[:limit]
+
+
+def _on_work_orders_changed(organization_id: int, **_keys) -> None:
+    # Only changes made by other processes arrive here (via core.change_feed);
+    # this process's own changes are handled by record_changes.
+    _changes_committed(organization_id)
+
+
+on_invalidate("work_order", _on_work_orders_changed)
@@ -2,6 +2,17 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-for-pytest-only")
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture(autouse=True)
+def _reset_in_process_caches():
+    from core.cache import registered_caches
+
+    yield
+    for cache in registered_caches():
+        cache.reset()
@@ -30,7 +30,7 @@ class FakeStorageClient:
 def test_upload_work_order_attachment_file_stores_file_and_returns_metadata(monkeypatch):
     fake_client = FakeStorageClient()
 
-    monkeypatch.setattr(attachment_storage_service, "_get_storage_client", lambda: fake_client)
+    monkeypatch.setattr(attachment_storage_service, "get_storage_client", lambda: fake_client)
     monkeypatch.setattr(attachment_storage_service.settings, "STORAGE_BUCKET", "wo-files")
     monkeypatch.setattr(attachment_storage_service.settings, "STORAGE_PUBLIC_BASE_URL", "https://files.example.com")
     monkeypatch.setattr(attachment_storage_service.settings, "ATTACHMENT_MAX_BYTES", 1024)
@@ -0,0 +1,167 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+import dependencies
+from core.cache import MISSING, TTLCache
+from core.security import create_access_token
+from repositories import organizations as organizations_repo
+from repositories import users as users_repo
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+def test_ttl_cache_expires_entries_and_counts_hits_and_misses():
+    clock = FakeClock()
+    cache = TTLCache("test", max_entries=10, ttl_seconds=5, clock=clock)
+
+    assert cache.get("a") is MISSING
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    clock.advance(5)
+    assert cache.get("a") is MISSING
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 0)
+
+
+def test_ttl_cache_is_bounded_and_evicts_least_recently_used():
+    cache = TTLCache("test", max_entries=2, ttl_seconds=60, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_ttl_cache_invalidate_where_drops_matching_keys():
+    cache = TTLCache("test", max_entries=10, ttl_seconds=60, clock=FakeClock())
+    cache.set((1, 10), "a")
+    cache.set((2, 10), "b")
+    cache.set((3, 11), "c")
+
+    cache.invalidate_where(lambda key: key[1] == 10)
+
+    assert cache.get((1, 10)) is MISSING
+    assert cache.get((2, 10)) is MISSING
+    assert cache.get((3, 11)) == "c"
+    assert cache.stats().invalidations == 2
+
+
+def test_zero_ttl_disables_the_cache():
+    cache = TTLCache("test", max_entries=10, ttl_seconds=0, clock=FakeClock())
+    cache.set("a", 1)
+
+    assert cache.get("a") is MISSING
+
+
+USER_ROW = {
+    "id": 7,
+    "organization_id": 3,
+    "email": "coord@example.com",
+    "full_name": "Coordinator",
+    "role": "coordinator",
+    "is_active": True,
+}
+
+
+def _credentials():
+    token = create_access_token(7, "coord@example.com", 3, "coordinator")
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _authenticate():
+    async def run():
+        user = await dependencies.get_current_user(_credentials())
+        organization = await dependencies.get_current_organization(current_user=user)
+        return user, organization
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def principal_lookups():
+    with patch(
+        "dependencies.users_repo.get_by_id_in_org_async", new=AsyncMock(return_value=dict(USER_ROW))
+    ) as user_lookup, patch(
+        "dependencies.organizations_repo.get_by_id_async", new=AsyncMock(return_value={"id": 3, "deleted_at": None})
+    ) as organization_lookup:
+        yield user_lookup, organization_lookup
+
+
+def test_principal_cache_serves_repeat_requests_without_lookups(principal_lookups):
+    user_lookup, organization_lookup = principal_lookups
+
+    _authenticate()
+    user, organization = _authenticate()
+
+    assert user.id == 7
+    assert organization == {"id": 3, "deleted_at": None}
+    assert user_lookup.await_count == 1
+    assert organization_lookup.await_count == 1
+    assert dependencies.principal_cache.stats().hits >= 2
+
+
+def test_role_or_status_change_invalidates_the_cached_principal(principal_lookups):
+    user_lookup, _organization_lookup = principal_lookups
+    _authenticate()
+
+    with patch("repositories.users.update_row", return_value={**USER_ROW, "is_active": False}):
+        users_repo.update_role_and_status(7, 3, {"is_active": False})
+    user_lookup.return_value = {**USER_ROW, "is_active": False}
+
+    with pytest.raises(HTTPException) as exc:
+        _authenticate()
+
+    assert exc.value.status_code == 403
+    assert user_lookup.await_count == 2
+
+
+def test_tenant_soft_delete_invalidates_every_principal_in_the_org(principal_lookups):
+    _user_lookup, organization_lookup = principal_lookups
+    _authenticate()
+
+    with patch("repositories.organizations.update_row", return_value={"id": 3}):
+        organizations_repo.soft_delete(3)
+    organization_lookup.return_value = {"id": 3, "deleted_at": "2026-01-01T00:00:00Z"}
+
+    with pytest.raises(HTTPException) as exc:
+        _authenticate()
+
+    assert exc.value.status_code == 404
+
+
+def test_invalidation_is_published_after_the_write_not_before():
+    calls = []
+
+    def write(*_args):
+        calls.append("write")
+        return {"id": 3}
+
+    with patch("repositories.users.update_row", side_effect=write), patch(
+        "repositories.users.publish_invalidation", side_effect=lambda *args, **kwargs: calls.append("invalidate")
+    ):
+        users_repo.update_role_and_status(7, 3, {"is_active": False})
+    with patch("repositories.organizations.update_row", side_effect=write), patch(
+        "repositories.organizations.publish_invalidation",
+        side_effect=lambda *args, **kwargs: calls.append("invalidate"),
+    ):
+        organizations_repo.update_timezone(3, "America/New_York")
+
+    assert calls == ["write", "invalidate", "write", "invalidate"]
@@ -0,0 +1,66 @@
+import json
+from unittest.mock import patch
+
+from core import change_feed
+from core.change_bus import bus as change_bus
+from core.worker import process_identity
+from services import workload_service
+
+
+def payload(table, op="UPDATE", organization_id=6, ids=(1,), fields=(), origin="other-host:1"):
+    return json.dumps(
+        {
+            "table": table,
+            "op": op,
+            "organization_id": organization_id,
+            "ids": list(ids),
+            "fields": list(fields),
+            "origin": origin,
+        }
+    )
+
+
+def test_work_order_changes_from_other_workers_reach_streams_and_workload():
+    published = []
+    with patch(
+        "services.workload_service.work_orders_repo.active_counts_by_technician", return_value=[]
+    ) as counts, patch.object(change_bus, "publish", side_effect=published.append):
+        workload_service.get_snapshot(6)
+        change_feed.dispatch(payload("work_orders", ids=(3, 4), fields=("status",)))
+        workload_service.get_snapshot(6)
+
+    assert [(change.organization_id, change.work_order_ids) for change in published] == [(6, (3, 4))]
+    assert counts.call_count == 2
+
+
+def test_events_for_this_process_own_writes_are_skipped():
+    with patch("core.change_feed.publish_invalidation") as publish:
+        change_feed.dispatch(payload("organizations", origin=process_identity()))
+        change_feed.dispatch(payload("organizations", origin=None))
+
+    publish.assert_called_once_with("organization", organization_id=6)
+
+
+def test_technician_updates_carry_the_changed_columns_per_technician():
+    with patch("core.change_feed.publish_invalidation") as publish:
+        change_feed.dispatch(payload("technicians", ids=(8, 9), fields=("latitude", "updated_at")))
+        change_feed.dispatch(payload("technicians", op="INSERT", ids=(10,)))
+
+    assert [call.kwargs for call in publish.call_args_list] == [
+        {"organization_id": 6, "technician_id": 8, "fields": ("latitude", "updated_at")},
+        {"organization_id": 6, "technician_id": 9, "fields": ("latitude", "updated_at")},
+        {"organization_id": 6, "technician_id": 10, "fields": ()},
+    ]
+
+
+def test_a_failing_handler_does_not_stop_the_others():
+    seen = []
+
+    def broken(event):
+        raise RuntimeError("boom")
+
+    with patch.dict(change_feed._handlers, {"clients": [broken, seen.append]}):
+        change_feed.dispatch(payload("clients", ids=(2,)))
+        change_feed.dispatch("not json")
+
+    assert [(event.table, event.ids) for event in seen] == [("clients", (2,))]
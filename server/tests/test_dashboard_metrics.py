@@ -0,0 +1,92 @@
+import threading
+from unittest.mock import patch
+
+from core.cache import SingleFlight
+from repositories import work_orders as work_orders_repo
+from services import dashboard_metrics_service
+
+STATUSES = ("open", "in_progress", "paused", "escalated", "completed", "cancelled", "archived")
+COUNTS = {
+    "total_work_orders": 12,
+    **{f"{status}_count": index for index, status in enumerate(STATUSES)},
+    "sla_at_risk_count": 2,
+    "active_technicians_count": 3,
+    "total_technicians_count": 5,
+}
+
+
+def test_metrics_are_one_aggregate_query_scoped_by_organization():
+    with patch("repositories.work_orders.fetch_one", return_value=dict(COUNTS)) as query:
+        counts = work_orders_repo.dashboard_counts(42)
+
+    sql, params = query.call_args.args
+    assert sql.count("WHERE organization_id = :organization_id") == 1
+    assert "WHERE t.organization_id = :organization_id" in sql
+    assert "COUNT(*) FILTER (WHERE status = 'escalated') AS escalated_count" in sql
+    assert "sla_due_at <= :soon" in sql
+    assert params["organization_id"] == 42
+    assert counts == COUNTS
+
+
+def test_metrics_are_cached_per_organization():
+    with patch("services.dashboard_metrics_service.work_orders_repo.dashboard_counts", return_value=COUNTS) as counts:
+        first = dashboard_metrics_service.get_metrics(6)
+        assert dashboard_metrics_service.get_metrics(6) is first
+        dashboard_metrics_service.get_metrics(7)
+
+    assert [call.args for call in counts.call_args_list] == [(6,), (7,)]
+    assert (first.escalated_count, first.sla_at_risk_count, first.active_technicians_count) == (3, 2, 3)
+
+
+def test_concurrent_misses_share_one_query():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_counts(organization_id):
+        started.set()
+        release.wait(5)
+        return COUNTS
+
+    results = []
+    load = patch("services.dashboard_metrics_service.work_orders_repo.dashboard_counts", side_effect=slow_counts)
+    with load as counts:
+        leader = threading.Thread(target=lambda: results.append(dashboard_metrics_service.get_metrics(6)))
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(dashboard_metrics_service.get_metrics(6))) for _ in range(4)
+        ]
+        for follower in followers:
+            follower.start()
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+    counts.assert_called_once_with(6)
+    assert len(results) == 5 and all(result is results[0] for result in results)
+
+
+def test_single_flight_shares_the_leaders_error():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def failing_load():
+        release.wait(5)
+        raise RuntimeError("database unavailable")
+
+    def call():
+        try:
+            flight.do("key", failing_load)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 3
+    assert flight.do("key", lambda: "recovered") == "recovered"
@@ -0,0 +1,43 @@
+from datetime import date
+from unittest.mock import patch
+
+from repositories import dashboard_rollups as rollups_repo
+from services import dashboard_rollup_service
+
+
+def test_report_readers_scope_by_organization_and_whole_days():
+    for reader in (rollups_repo.list_property_hotspots, rollups_repo.list_completion_cycles, rollups_repo.list_cost_summary):
+        with patch("repositories.dashboard_rollups.fetch_all", return_value=[]) as query:
+            reader(organization_id=42, since_days=30, limit=5)
+
+        sql, params = query.call_args.args
+        assert "organization_id = :organization_id" in sql
+        assert "day >= :since_day" in sql
+        assert "FROM work_orders" not in sql
+        assert params["organization_id"] == 42
+        assert isinstance(params["since_day"], date)
+        assert params["limit"] == 5
+
+
+def test_refresher_claims_with_skip_locked_and_rebuilds_claimed_days():
+    claimed = [{"organization_id": 6, "day": date(2026, 10, 16)}, {"organization_id": 6, "day": date(2026, 10, 17)}]
+    with patch("repositories.dashboard_rollups.fetch_all_in_transaction", return_value=claimed) as claim, \
+            patch("repositories.dashboard_rollups.execute") as statements:
+        assert dashboard_rollup_service.refresh_dirty_days(organization_id=6, limit=31) is True
+
+    sql, params = claim.call_args.args
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "WHERE organization_id = :organization_id" in sql
+    assert params == {"organization_id": 6, "limit": 31}
+    rebuilds = [call.args for call in statements.call_args_list]
+    assert [params["days"] for _sql, params in rebuilds] == [[date(2026, 10, 16), date(2026, 10, 17)]] * 4
+    assert "FULL OUTER JOIN cycles" in rebuilds[2][0]
+    assert "INSERT INTO work_order_property_daily_rollups" in rebuilds[3][0]
+
+
+def test_refresher_does_nothing_without_dirty_days():
+    with patch("repositories.dashboard_rollups.fetch_all_in_transaction", return_value=[]), \
+            patch("repositories.dashboard_rollups.execute") as statements:
+        assert dashboard_rollup_service.refresh_dirty_days() is False
+
+    statements.assert_not_called()
@@ -0,0 +1,266 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, event
+
+import database
+from dependencies import database_unit_of_work
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'techsync.db'}", future=True)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE notes (id INTEGER PRIMARY KEY, organization_id INTEGER, body TEXT)")
+
+    engine.checkouts = 0
+    engine.commits = 0
+
+    def count_checkout(*_args):
+        engine.checkouts += 1
+
+    def count_commit(_conn):
+        engine.commits += 1
+
+    event.listen(engine, "checkout", count_checkout)
+    event.listen(engine, "commit", count_commit)
+    monkeypatch.setattr(database, "get_engine", lambda: engine)
+    return engine
+
+
+def test_helpers_outside_a_unit_of_work_commit_each_write(engine):
+    database.insert_row("notes", {"organization_id": 1, "body": "first"})
+    database.insert_row("notes", {"organization_id": 1, "body": "second"})
+
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 2
+    assert engine.commits == 2
+    assert engine.checkouts == 3
+
+
+def test_returning_writes_outside_a_unit_of_work_commit(engine):
+    database.insert_rows("notes", [{"organization_id": 1, "body": "a"}, {"organization_id": 1, "body": "b"}])
+
+    rows = database.fetch_all_in_transaction(
+        "UPDATE notes SET body = upper(body) WHERE organization_id = :org RETURNING id, body", {"org": 1}
+    )
+
+    assert sorted(row["body"] for row in rows) == ["A", "B"]
+    assert database.fetch_all("SELECT body FROM notes ORDER BY id") == [{"body": "A"}, {"body": "B"}]
+
+
+def test_unit_of_work_shares_one_connection_and_commits_once(engine):
+    with database.unit_of_work():
+        created = database.insert_row("notes", {"organization_id": 1, "body": "first"})
+        database.update_row("notes", {"body": "edited"}, {"id": created["id"], "organization_id": 1})
+        assert database.fetch_one("SELECT body FROM notes WHERE id = :id", {"id": created["id"]}) == {"body": "edited"}
+        database.execute("INSERT INTO notes (organization_id, body) VALUES (2, 'other')")
+
+    assert engine.checkouts == 1
+    assert engine.commits == 1
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 2
+
+
+def test_unit_of_work_rolls_back_every_write_when_the_block_raises(engine):
+    with pytest.raises(RuntimeError):
+        with database.unit_of_work():
+            database.insert_row("notes", {"organization_id": 1, "body": "first"})
+            raise RuntimeError("boom")
+
+    assert engine.commits == 0
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 0
+    assert database.current_unit_of_work() is None
+
+
+def test_nested_unit_of_work_joins_the_outer_transaction(engine):
+    with database.unit_of_work() as outer:
+        with database.unit_of_work() as inner:
+            database.insert_row("notes", {"organization_id": 1, "body": "first"})
+        assert inner is outer
+        assert engine.commits == 0
+
+    assert engine.commits == 1
+
+
+def test_failing_after_commit_callback_does_not_skip_the_rest_or_fail_the_commit(engine, caplog):
+    ran = []
+
+    def broken_invalidation():
+        raise RuntimeError("cache unavailable")
+
+    with database.unit_of_work():
+        database.insert_row("notes", {"organization_id": 1, "body": "first"})
+        database.after_commit(broken_invalidation)
+        database.after_commit(lambda: ran.append("second"))
+
+    assert ran == ["second"]
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 1
+    assert [record.message for record in caplog.records] == ["database.after_commit_failed"]
+
+
+def test_insert_rows_batches_statements_and_returns_rows_in_order(engine, monkeypatch):
+    monkeypatch.setattr(database, "MAX_ROWS_PER_INSERT", 2)
+
+    with database.unit_of_work():
+        rows = database.insert_rows(
+            "notes", [{"organization_id": 1, "body": f"note {index}"} for index in range(5)]
+        )
+
+    assert [row["body"] for row in rows] == [f"note {index}" for index in range(5)]
+    assert engine.checkouts == 1
+    assert engine.commits == 1
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 5
+
+
+def test_insert_rows_on_conflict_skips_existing_rows(engine):
+    database.execute("CREATE UNIQUE INDEX uq_notes_body ON notes(organization_id, body)")
+    database.insert_row("notes", {"organization_id": 1, "body": "existing"})
+
+    rows = database.insert_rows(
+        "notes",
+        [{"organization_id": 1, "body": "existing"}, {"organization_id": 1, "body": "new"}],
+        on_conflict="ON CONFLICT (organization_id, body) DO NOTHING",
+    )
+
+    assert [row["body"] for row in rows] == ["new"]
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 2
+
+
+def test_fetch_iter_runs_lazily_on_its_own_connection(engine):
+    database.insert_rows("notes", [{"organization_id": 1, "body": f"note {index}"} for index in range(5)])
+    checkouts = engine.checkouts
+
+    with database.unit_of_work():
+        rows = database.fetch_iter("SELECT body FROM notes ORDER BY id", batch_size=2)
+    assert engine.checkouts == checkouts
+
+    assert [row["body"] for row in rows] == [f"note {index}" for index in range(5)]
+    assert engine.checkouts == checkouts + 1
+
+
+def test_savepoint_keeps_the_unit_of_work_usable_after_a_failed_statement(engine):
+    with database.unit_of_work():
+        database.insert_row("notes", {"organization_id": 1, "body": "kept"})
+        with pytest.raises(Exception):
+            with database.savepoint():
+                database.execute("INSERT INTO missing_table (id) VALUES (1)")
+        database.insert_row("notes", {"organization_id": 1, "body": "also kept"})
+
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 2
+
+
+def test_request_dependency_commits_on_success_and_rolls_back_on_error(engine):
+    async def run_request(fail: bool):
+        dependency = database_unit_of_work()
+        unit = await dependency.__anext__()
+        database.insert_row("notes", {"organization_id": 1, "body": "request"})
+        assert database.current_unit_of_work() is unit
+        if fail:
+            with pytest.raises(ValueError):
+                await dependency.athrow(ValueError("endpoint failed"))
+        else:
+            with pytest.raises(StopAsyncIteration):
+                await dependency.__anext__()
+        assert unit.closed is True
+
+    asyncio.run(run_request(fail=True))
+    asyncio.run(run_request(fail=False))
+
+    assert engine.commits == 1
+    assert database.fetch_scalar("SELECT COUNT(*) FROM notes") == 1
+
+
+@pytest.fixture
+def audit_engine(engine, monkeypatch):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE work_order_events (id INTEGER PRIMARY KEY, organization_id INTEGER, work_order_id INTEGER,"
+            " event_type TEXT, actor_user_id INTEGER, from_status TEXT, to_status TEXT, notes TEXT,"
+            " created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+    engine.inserts = 0
+
+    def count_insert(_conn, _cursor, statement, *_args):
+        if statement.startswith("INSERT INTO work_order_events"):
+            engine.inserts += 1
+
+    event.listen(engine, "before_cursor_execute", count_insert)
+    return engine
+
+
+def test_audit_events_are_written_as_one_insert_when_the_unit_commits(audit_engine):
+    from repositories import work_order_events as events_repo
+
+    with database.unit_of_work():
+        for work_order_id in (1, 2, 3):
+            events_repo.create_event(6, work_order_id, "status_changed", actor_user_id=9)
+        assert audit_engine.inserts == 0
+
+    assert audit_engine.inserts == 1
+    assert database.fetch_scalar("SELECT COUNT(*) FROM work_order_events") == 3
+
+
+def test_buffered_audit_events_roll_back_with_the_unit_and_are_readable_inside_it(audit_engine):
+    from repositories import work_order_events as events_repo
+
+    with pytest.raises(RuntimeError):
+        with database.unit_of_work():
+            events_repo.create_event(6, 1, "created")
+            assert [row["event_type"] for row in events_repo.list_for_work_order(6, 1)] == ["created"]
+            raise RuntimeError("boom")
+
+    assert database.fetch_scalar("SELECT COUNT(*) FROM work_order_events") == 0
+
+
+def test_async_audit_mode_queues_after_commit_and_pushes_back_when_full(audit_engine, monkeypatch):
+    import queue
+
+    from repositories import work_order_events as events_repo
+
+    monkeypatch.setattr(events_repo.settings, "AUDIT_WRITE_MODE", "async")
+    monkeypatch.setattr(events_repo.settings, "AUDIT_QUEUE_PUT_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(events_repo, "_queue", queue.Queue(maxsize=2))
+
+    with database.unit_of_work():
+        for work_order_id in (1, 2, 3):
+            events_repo.create_event(6, work_order_id, "created")
+
+    # Two events fit in the queue; the third was written directly.
+    assert events_repo._queue.qsize() == 2
+    assert database.fetch_scalar("SELECT COUNT(*) FROM work_order_events") == 1
+
+    assert events_repo.drain() is True
+    assert events_repo.drain() is False
+    assert database.fetch_scalar("SELECT COUNT(*) FROM work_order_events") == 3
+    assert audit_engine.inserts == 2
+
+
+def test_audit_drain_drops_rows_that_keep_failing_instead_of_stalling(audit_engine, monkeypatch):
+    import queue
+
+    from repositories import work_order_events as events_repo
+
+    monkeypatch.setattr(events_repo.settings, "AUDIT_DRAIN_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(events_repo, "_queue", queue.Queue())
+    monkeypatch.setattr(events_repo, "_unwritten", [])
+    write = events_repo._write
+
+    def reject_deleted_work_order(events):
+        if any(event["work_order_id"] == 3 for event in events):
+            raise RuntimeError("violates foreign key constraint")
+        write(events)
+
+    monkeypatch.setattr(events_repo, "_write", reject_deleted_work_order)
+    for work_order_id in range(1, 7):
+        events_repo._queue.put(events_repo.event_row(6, work_order_id, "created"))
+
+    for _attempt in range(2):
+        with pytest.raises(RuntimeError):
+            events_repo.drain(max_events=4)
+    assert database.fetch_scalar("SELECT COUNT(*) FROM work_order_events") == 0
+
+    assert events_repo.drain(max_events=4) is True
+    events_repo.drain_all()
+
+    written = database.fetch_all("SELECT work_order_id FROM work_order_events ORDER BY work_order_id")
+    assert [row["work_order_id"] for row in written] == [1, 2, 4, 5, 6]
+    assert events_repo._unwritten == []
@@ -0,0 +1,149 @@
+import asyncio
+from unittest.mock import patch
+
+import database
+from core.change_bus import bus as change_bus
+from repositories import work_orders as work_orders_repo
+from routers import dashboard as dashboard_router
+from services import dispatch_board_service
+
+TECHNICIANS = [
+    {
+        "id": 8,
+        "availability_status": "available",
+        "max_daily_jobs": 4,
+        "users": {"full_name": "Tech One", "email": "tech@example.com"},
+    }
+]
+
+
+def board_row(id, status="open", assigned_technician_id=None, priority="medium"):
+    return {
+        "id": id,
+        "title": f"Work order {id}",
+        "status": status,
+        "priority": priority,
+        "assigned_technician_id": assigned_technician_id,
+        "created_at": "2026-10-17T00:00:00Z",
+        "sla_due_at": None,
+    }
+
+
+class FakeBoard:
+    """Stands in for list_dispatch_board_work_orders over a mutable table."""
+
+    def __init__(self, *rows):
+        self.rows = {row["id"]: row for row in rows}
+        self.calls = []
+
+    def __call__(self, organization_id, work_order_ids=None):
+        self.calls.append(work_order_ids)
+        ids = self.rows if work_order_ids is None else [id for id in work_order_ids if id in self.rows]
+        return [dict(self.rows[id]) for id in ids]
+
+
+def run_stream(table, after_snapshot, count):
+    """Collect ``count`` events, calling ``after_snapshot()`` (a write made by
+    another thread) once the snapshot is out."""
+
+    async def collect():
+        events = []
+        stream = dispatch_board_service.stream_board(6)
+        async for event, data in stream:
+            events.append((event, data))
+            if event == "snapshot" and len(events) == 1:
+                await asyncio.to_thread(after_snapshot)
+            if len(events) == count:
+                break
+        await stream.aclose()
+        return events
+
+    with patch("services.dispatch_board_service.work_orders_repo.list_dispatch_board_work_orders", side_effect=table), \
+            patch("services.roster_service.technicians_repo.list_by_org", return_value=TECHNICIANS):
+        return asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+
+def test_stream_sends_a_snapshot_then_deltas_for_the_changed_card_only():
+    table = FakeBoard(board_row(1), board_row(2, status="in_progress", assigned_technician_id=8))
+
+    def assign_first_card():
+        table.rows[1] = board_row(1, assigned_technician_id=8)
+        with patch("repositories.work_orders.update_row", return_value={"id": 1}):
+            work_orders_repo.update(1, 6, {"assigned_technician_id": 8})
+
+    events = run_stream(table, assign_first_card, count=4)
+
+    assert [event for event, _data in events] == ["snapshot", "card", "lane", "summary"]
+    snapshot = events[0][1]
+    assert [card.id for card in snapshot.unassigned_work_orders] == [1]
+    card = events[1][1]
+    assert (card.work_order_id, card.technician_id, card.work_order.id) == (1, 8, 1)
+    lane = events[2][1]
+    assert (lane.technician_id, lane.active_work_order_count, lane.utilization_percent) == (8, 2, 50.0)
+    assert events[3][1].unassigned_count == 0
+    assert table.calls == [None, [1]]
+    assert change_bus.subscriber_count(6) == 0
+
+
+def test_card_that_leaves_the_board_is_removed():
+    table = FakeBoard(board_row(1, status="in_progress", assigned_technician_id=8))
+
+    def complete_it():
+        del table.rows[1]
+        transition = {"transition_current_status": "in_progress", "transition_has_proof": True, "id": 1}
+        with patch("repositories.work_orders.fetch_one_in_transaction", return_value=transition):
+            work_orders_repo.transition_status(6, 1, "in_progress", "completed", actor_user_id=3, event_notes=None)
+
+    events = run_stream(table, complete_it, count=2)
+
+    card = events[1][1]
+    assert events[1][0] == "card"
+    assert (card.work_order_id, card.technician_id, card.work_order) == (1, None, None)
+
+
+def test_changes_are_published_only_after_commit():
+    published = []
+    with patch.object(change_bus, "publish", side_effect=published.append), \
+            patch("repositories.work_orders.update_row", return_value={"id": 1}):
+        unit = database.UnitOfWork()
+        database.bind_unit_of_work(unit)
+        work_orders_repo.update(1, 6, {"priority": "high"})
+        assert published == []
+        unit.rollback()
+        unit.close()
+
+        with database.unit_of_work():
+            work_orders_repo.update(2, 6, {"priority": "high"})
+
+    assert [(change.organization_id, change.work_order_ids) for change in published] == [(6, (2,))]
+
+
+def test_stream_endpoint_wraps_deltas_as_server_sent_events():
+    async def fake_stream(organization_id):
+        yield "snapshot", {"organization_id": organization_id}
+        yield "summary", {"open_count": 1}
+
+    async def collect():
+        stream = dashboard_router.stream_dispatch_board(current_user=None, organization={"id": 6})
+        return [event async for event in stream]
+
+    with patch.object(dispatch_board_service, "stream_board", fake_stream):
+        events = asyncio.run(collect())
+
+    assert [(event.event, event.id, event.data) for event in events] == [
+        ("snapshot", "1", {"organization_id": 6}),
+        ("summary", "2", {"open_count": 1}),
+    ]
+
+
+def test_board_counts_its_own_rows_without_filling_the_workload_cache():
+    from services import workload_service
+
+    table = FakeBoard(board_row(1, assigned_technician_id=8), board_row(2, "in_progress", assigned_technician_id=8))
+    with patch("services.dispatch_board_service.work_orders_repo.list_dispatch_board_work_orders", side_effect=table), \
+            patch("services.roster_service.technicians_repo.list_by_org", return_value=TECHNICIANS):
+        board = dispatch_board_service.get_board(6)
+
+    [lane] = board.technician_lanes
+    assert lane.active_work_order_count == 2
+    assert workload_service._snapshots.get(6) is workload_service.MISSING
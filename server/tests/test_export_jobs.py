@@ -0,0 +1,190 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from core.config import settings
+from models.export_job import ExportJobCreate
+from models.user import User
+from repositories import export_jobs as export_jobs_repo
+from routers import organizations as organizations_router
+from services import export_job_service, export_storage_service
+
+ADMIN = User(id=5, organization_id=6, email="admin@example.com", full_name="Admin", role="org_admin", is_active=True)
+
+JOB_ROW = {
+    "id": 9,
+    "organization_id": 6,
+    "created_by": 5,
+    "kind": "clients",
+    "status": "queued",
+    "file_name": "techsync-clients.csv",
+    "content_type": "text/csv",
+    "storage_backend": None,
+    "storage_key": None,
+    "bytes_written": 0,
+    "size_bytes": None,
+    "error": None,
+    "attempts": 0,
+    "created_at": datetime(2026, 10, 17, tzinfo=timezone.utc),
+    "started_at": None,
+    "finished_at": None,
+}
+
+
+@pytest.fixture
+def local_exports(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_STORAGE_BACKEND", "local")
+    monkeypatch.setattr(settings, "EXPORT_LOCAL_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "EXPORT_PART_BYTES", 40)
+    return tmp_path
+
+
+def _run_clients_export(chunks, record_progress_result={"id": 9}):
+    kinds = {"clients": export_job_service.ExportKind("techsync-clients.csv", "text/csv", lambda org: iter(chunks))}
+    with patch.dict(export_job_service.EXPORT_KINDS, kinds), patch(
+        "services.export_job_service.organizations_repo.get_by_id", return_value={"id": 6}
+    ), patch(
+        "services.export_job_service.export_jobs_repo.record_progress", return_value=record_progress_result
+    ) as progress, patch("services.export_job_service.export_jobs_repo.finish", return_value={"id": 9}) as finish:
+        export_job_service.process_job({**JOB_ROW, "status": "running", "attempts": 1}, "worker-a")
+    return progress, finish
+
+
+def test_claims_are_serialized_and_limited_per_tenant():
+    calls = []
+    with patch("services.export_job_service.export_jobs_repo.fail_abandoned", return_value=None), patch(
+        "services.export_job_service.export_jobs_repo.lock_claims", side_effect=lambda: calls.append("lock")
+    ), patch(
+        "services.export_job_service.export_jobs_repo.claim_next",
+        side_effect=lambda *args: calls.append(("claim", args)),
+    ), patch("services.export_job_service.unit_of_work"):
+        assert export_job_service.run_next_job("worker-a") is False
+
+    assert calls == ["lock", ("claim", ("worker-a", 300, 3, settings.EXPORT_JOB_MAX_RUNNING_PER_ORG))]
+
+    with patch("repositories.export_jobs.fetch_one_in_transaction", return_value=None) as query:
+        export_jobs_repo.claim_next("worker-a", lease_seconds=300, max_attempts=3, max_running_per_org=1)
+    sql, params = query.call_args.args
+    assert "FOR UPDATE OF job SKIP LOCKED" in sql
+    assert "COALESCE(live.running, 0) < :max_running_per_org" in sql
+    assert params["max_running_per_org"] == 1
+
+
+def test_process_job_writes_the_artifact_in_parts_and_reports_progress(local_exports):
+    chunks = ["id,display_name\r\n", *[f"{index},Client {index}\r\n" for index in range(10)]]
+
+    progress, finish = _run_clients_export(chunks)
+
+    [(job_id, worker_id, status, backend, key, size)] = [call.args for call in finish.call_args_list]
+    assert (job_id, worker_id, status, backend) == (9, "worker-a", "succeeded", "local")
+    assert key.startswith("exports/org-6/export-9-") and key.endswith("-techsync-clients.csv")
+    artifact = export_storage_service.local_path(key)
+    assert artifact.read_bytes() == "".join(chunks).encode()
+    assert size == artifact.stat().st_size
+    written = [call.args[2] for call in progress.call_args_list]
+    assert written == sorted(written) and len(written) >= 3 and written[-1] <= size
+    assert not list(local_exports.rglob("*.part"))
+
+
+def test_lost_lease_discards_the_partial_artifact(local_exports):
+    progress, finish = _run_clients_export(["x" * 100, "y" * 100], record_progress_result=None)
+
+    progress.assert_called_once()
+    finish.assert_not_called()
+    assert not [path for path in local_exports.rglob("*") if path.is_file()]
+
+
+def test_failing_export_is_marked_failed_without_leaving_a_file(local_exports):
+    def broken(organization):
+        yield "id\r\n"
+        raise RuntimeError("cursor closed")
+
+    kinds = {"clients": export_job_service.ExportKind("techsync-clients.csv", "text/csv", broken)}
+    with patch.dict(export_job_service.EXPORT_KINDS, kinds), patch(
+        "services.export_job_service.organizations_repo.get_by_id", return_value={"id": 6}
+    ), patch("services.export_job_service.export_jobs_repo.finish") as finish:
+        export_job_service.process_job({**JOB_ROW, "status": "running"}, "worker-a")
+
+    finish.assert_called_once_with(9, "worker-a", "failed", error="cursor closed")
+    assert not [path for path in local_exports.rglob("*") if path.is_file()]
+
+
+def test_s3_exports_are_multipart_uploads(monkeypatch):
+    monkeypatch.setattr(settings, "STORAGE_BUCKET", "exports-bucket")
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "u-1"}
+    client.upload_part.side_effect = [{"ETag": "e-1"}, {"ETag": "e-2"}]
+    monkeypatch.setattr(export_storage_service, "get_storage_client", lambda: client)
+
+    writer = export_storage_service.S3ExportWriter("exports/org-6/a.json", "application/json")
+    writer.write_part(b"first")
+    writer.write_part(b"second")
+    writer.complete()
+
+    client.complete_multipart_upload.assert_called_once_with(
+        Bucket="exports-bucket",
+        Key="exports/org-6/a.json",
+        UploadId="u-1",
+        MultipartUpload={"Parts": [{"ETag": "e-1", "PartNumber": 1}, {"ETag": "e-2", "PartNumber": 2}]},
+    )
+
+
+def test_enqueue_is_limited_per_tenant(local_exports, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_JOB_MAX_PENDING_PER_ORG", 2)
+
+    with patch("services.export_job_service.export_jobs_repo.lock_org_queue") as lock, patch(
+        "services.export_job_service.export_jobs_repo.count_pending", side_effect=[1, 2]
+    ), patch("services.export_job_service.export_jobs_repo.create", return_value=JOB_ROW) as create, patch(
+        "services.export_job_service.unit_of_work"
+    ):
+        accepted = organizations_router.create_export(
+            ExportJobCreate(kind="clients"), current_user=ADMIN, organization={"id": 6}
+        )
+        with pytest.raises(HTTPException) as rejected:
+            organizations_router.create_export(
+                ExportJobCreate(kind="clients"), current_user=ADMIN, organization={"id": 6}
+            )
+
+    assert (accepted.id, accepted.status, accepted.download_url) == (9, "queued", None)
+    assert create.call_args.args == (6, 5, "clients", "techsync-clients.csv", "text/csv")
+    assert rejected.value.status_code == 429
+    assert [call.args for call in lock.call_args_list] == [(6,), (6,)]
+
+
+def test_finished_local_export_downloads_with_range_support(local_exports):
+    key = "exports/org-6/export-9-abc-techsync-clients.csv"
+    path = export_storage_service.local_path(key)
+    path.parent.mkdir(parents=True)
+    path.write_text("id,display_name\r\n9,Riverside HOA\r\n")
+    finished = {**JOB_ROW, "status": "succeeded", "storage_backend": "local", "storage_key": key, "size_bytes": 33}
+
+    with patch("services.export_job_service.export_jobs_repo.get_by_id_in_org", return_value=finished):
+        job = organizations_router.get_export(9, current_user=ADMIN, organization={"id": 6})
+        response = organizations_router.download_export(9, current_user=ADMIN, organization={"id": 6})
+
+    assert job.download_url == "/organizations/me/exports/9/download"
+
+    async def fetch_range():
+        messages = []
+        scope = {
+            "type": "http",
+            "asgi": {"spec_version": "2.4"},
+            "method": "GET",
+            "headers": [(b"range", b"bytes=17-")],
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await response(scope, receive, send)
+        return messages
+
+    messages = asyncio.run(fetch_range())
+    assert messages[0]["status"] == 206
+    assert b"".join(message.get("body", b"") for message in messages[1:]) == b"9,Riverside HOA\r\n"
@@ -0,0 +1,196 @@
+import asyncio
+import io
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi import Response, UploadFile
+
+from core.config import settings
+from core.worker import PollingWorker
+from repositories import ingestion_jobs as ingestion_jobs_repo
+from routers import ingestion as ingestion_router
+from services import ingestion_service
+
+JOB_ROW = {
+    "id": 9,
+    "organization_id": 6,
+    "created_by": 5,
+    "source": "csv",
+    "status": "queued",
+    "total_rows": 3,
+    "processed_rows": 0,
+    "created_count": 0,
+    "created_work_order_ids": [],
+    "row_errors": [],
+    "duplicate_rows": [],
+    "error": None,
+    "attempts": 0,
+    "created_at": datetime(2026, 10, 17, tzinfo=timezone.utc),
+    "started_at": None,
+    "finished_at": None,
+}
+
+
+def _claimed_job(processed_rows=0):
+    titles = ["Row one", "Row two", "Row three"]
+    return {
+        **JOB_ROW,
+        "status": "running",
+        "attempts": 1,
+        "processed_rows": processed_rows,
+        "payload": {"rows": [{"title": title, "service_type": "general", "priority": "medium"} for title in titles]},
+    }
+
+
+def test_claim_uses_skip_locked_so_workers_never_share_a_job():
+    with patch("repositories.ingestion_jobs.fetch_one_in_transaction", return_value=None) as query:
+        assert ingestion_jobs_repo.claim_next("worker-a", lease_seconds=300, max_attempts=3) is None
+
+    sql, params = query.call_args.args
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert params == {"worker_id": "worker-a", "lease_seconds": 300, "max_attempts": 3}
+
+
+def test_process_job_commits_each_batch_with_its_progress(monkeypatch):
+    monkeypatch.setattr(settings, "INGESTION_BATCH_SIZE", 2)
+    batches = []
+
+    def fake_persist(organization_id, created_by, rows, source, forced_priorities):
+        batches.append([row.title for row in rows])
+        return [100 + len(batches)], []
+
+    with patch("services.ingestion_service._forced_priorities", return_value={}), patch(
+        "services.ingestion_service._persist_rows", side_effect=fake_persist
+    ), patch("services.ingestion_service.unit_of_work"), patch(
+        "services.ingestion_service.ingestion_jobs_repo.record_progress", return_value={"id": 9}
+    ) as progress, patch("services.ingestion_service.ingestion_jobs_repo.finish") as finish:
+        ingestion_service.process_job(_claimed_job(), "worker-a")
+
+    assert batches == [["Row one", "Row two"], ["Row three"]]
+    assert [call.args for call in progress.call_args_list] == [
+        (9, "worker-a", 2, [101], []),
+        (9, "worker-a", 3, [102], []),
+    ]
+    finish.assert_called_once_with(9, "worker-a", "succeeded")
+
+
+def test_reclaimed_job_resumes_after_the_last_committed_batch(monkeypatch):
+    monkeypatch.setattr(settings, "INGESTION_BATCH_SIZE", 2)
+
+    with patch("services.ingestion_service._forced_priorities", return_value={}), patch(
+        "services.ingestion_service._persist_rows", return_value=([103], [])
+    ) as persist, patch("services.ingestion_service.unit_of_work"), patch(
+        "services.ingestion_service.ingestion_jobs_repo.record_progress", return_value={"id": 9}
+    ), patch("services.ingestion_service.ingestion_jobs_repo.finish"):
+        ingestion_service.process_job(_claimed_job(processed_rows=2), "worker-a")
+
+    persist.assert_called_once()
+    assert [row.title for row in persist.call_args.args[2]] == ["Row three"]
+
+
+def test_lost_lease_rolls_back_the_batch_and_leaves_the_job_to_its_new_owner():
+    with patch("services.ingestion_service._forced_priorities", return_value={}), patch(
+        "services.ingestion_service._persist_rows", return_value=([101], [])
+    ), patch("services.ingestion_service.unit_of_work") as unit, patch(
+        "services.ingestion_service.ingestion_jobs_repo.record_progress", return_value=None
+    ), patch("services.ingestion_service.ingestion_jobs_repo.finish") as finish:
+        ingestion_service.process_job(_claimed_job(), "worker-a")
+
+    exc_type = unit.return_value.__exit__.call_args.args[0]
+    assert exc_type is ingestion_service.LostJobLease
+    finish.assert_not_called()
+
+
+def test_failing_job_is_marked_failed_with_the_error():
+    with patch("services.ingestion_service._forced_priorities", return_value={}), patch(
+        "services.ingestion_service._persist_rows", side_effect=RuntimeError("database went away")
+    ), patch("services.ingestion_service.unit_of_work"), patch(
+        "services.ingestion_service.ingestion_jobs_repo.finish"
+    ) as finish:
+        ingestion_service.process_job(_claimed_job(), "worker-a")
+
+    finish.assert_called_once_with(9, "worker-a", "failed", error="database went away")
+
+
+def test_run_next_job_reports_an_empty_queue():
+    with patch("services.ingestion_service.ingestion_jobs_repo.fail_abandoned", return_value=None), patch(
+        "services.ingestion_service.ingestion_jobs_repo.claim_next", return_value=None
+    ) as claim:
+        assert ingestion_service.run_next_job("worker-a") is False
+
+    claim.assert_called_once_with("worker-a", settings.INGESTION_JOB_LEASE_SECONDS, settings.INGESTION_JOB_MAX_ATTEMPTS)
+
+
+def test_async_csv_upload_is_validated_queued_and_accepted():
+    upload = UploadFile(file=io.BytesIO(b"title\nRow one\nx\n"), filename="jobs.csv")
+    response = Response()
+
+    with patch(
+        "services.ingestion_service.ingestion_jobs_repo.create", return_value={**JOB_ROW, "total_rows": 1}
+    ) as create, patch("services.ingestion_service.ingest_csv") as ingest_now:
+        accepted = asyncio.run(
+            ingestion_router.ingest_csv(
+                file=upload,
+                response=response,
+                run_async=True,
+                current_user=SimpleNamespace(id=5),
+                organization={"id": 6},
+            )
+        )
+
+    ingest_now.assert_not_called()
+    organization_id, created_by, source, rows, row_errors = create.call_args.args
+    assert (organization_id, created_by, source) == (6, 5, "csv")
+    assert [row["title"] for row in rows] == ["Row one"]
+    assert row_errors[0]["row_number"] == 2
+    assert response.status_code == 202
+    assert accepted.job_id == 9
+    assert accepted.status == "queued"
+
+
+def test_webhook_delivery_is_queued_durably():
+    with patch(
+        "services.ingestion_service.ingestion_jobs_repo.create", return_value={**JOB_ROW, "source": "webhook"}
+    ) as create:
+        accepted = ingestion_router.ingest_webhook(payload={"title": "Broken gate"}, organization={"id": 6})
+
+    assert create.call_args.args[:3] == (6, None, "webhook")
+    assert accepted.job_id == 9
+
+
+def test_job_status_exposes_progress_and_row_errors():
+    row = {
+        **JOB_ROW,
+        "status": "running",
+        "processed_rows": 2,
+        "created_count": 2,
+        "created_work_order_ids": [101, 102],
+        "row_errors": [{"row_number": 4, "errors": ["title: Field required"]}],
+        "duplicate_rows": [{"external_ref": "A-1", "work_order_id": 55}],
+    }
+    with patch("services.ingestion_service.ingestion_jobs_repo.get_by_id_in_org", return_value=row) as lookup:
+        job = ingestion_router.get_ingestion_job(9, current_user=SimpleNamespace(id=5), organization={"id": 6})
+
+    lookup.assert_called_once_with(9, 6)
+    assert (job.processed_rows, job.total_rows, job.failed_count) == (2, 3, 1)
+    assert job.failed_rows[0].row_number == 4
+    assert (job.duplicate_count, job.duplicate_rows[0].work_order_id) == (1, 55)
+
+
+def test_polling_worker_survives_poll_errors_and_stops():
+    calls = []
+
+    def poll():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return False
+
+    worker = PollingWorker("test", poll, interval_seconds=0.01)
+    assert worker.run_once() is False
+    worker.start()
+    worker.stop(timeout=1)
+
+    assert not worker.running
+    assert len(calls) >= 2
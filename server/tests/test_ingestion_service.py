@@ -1,6 +1,17 @@
+import io
+from unittest.mock import patch
+
 import pytest
 
-from services.ingestion_service import parse_csv_rows
+from core.config import settings
+from models.ingestion import WorkOrderIngestRow
+from services.ingestion_service import (
+    ingest_csv,
+    ingest_rows,
+    ingest_webhook_batch,
+    iter_csv_batches,
+    parse_csv_rows,
+)
 
 
 def test_valid_csv_parses_all_rows():
@@ -57,3 +68,169 @@ def test_invalid_priority_reported_as_row_error():
     assert len(rows) == 0
     assert len(errors) == 1
     assert "priority" in errors[0].errors[0]
+
+
+def test_ingest_rows_uses_set_based_writes_and_one_assignment_snapshot():
+    rows = [
+        WorkOrderIngestRow(title="Leak one", service_type="plumbing", priority="low"),
+        WorkOrderIngestRow(title="Leak two", service_type="plumbing", priority="medium"),
+        WorkOrderIngestRow(title="Breaker trip", service_type="electrical", priority="low"),
+    ]
+    technicians = [
+        {"id": 4, "skills": ["plumbing"], "availability_status": "available", "max_daily_jobs": 8},
+        {"id": 5, "skills": ["electrical"], "availability_status": "available", "max_daily_jobs": 8},
+    ]
+
+    def fake_create_many(organization_id, patches):
+        return [{"id": 100 + index, "organization_id": organization_id, **patch} for index, patch in enumerate(patches)]
+
+    def fake_assign_many(organization_id, assignments):
+        return [
+            {"id": work_order_id, "organization_id": organization_id, "status": "open", "assigned_technician_id": tech}
+            for work_order_id, tech in assignments.items()
+        ]
+
+    with patch(
+        "services.priority_rule_service.priority_rules_repo.list_by_org",
+        return_value=[{"service_type": "electrical", "forced_priority": "emergency"}],
+    ) as rules, patch(
+        "services.ingestion_service.work_orders_repo.create_many", side_effect=fake_create_many
+    ) as create_many, patch(
+        "services.work_order_service.technicians_repo.list_by_org", return_value=technicians
+    ) as roster, patch(
+        "services.workload_service.work_orders_repo.active_counts_by_technician", return_value=[]
+    ) as counts, patch(
+        "services.work_order_service.work_orders_repo.assign_many", side_effect=fake_assign_many
+    ) as assign_many, patch(
+        "services.work_order_service.events_repo.create_events"
+    ) as create_events:
+        result = ingest_rows(6, 5, rows, source="csv")
+
+    rules.assert_called_once_with(6)
+    roster.assert_called_once_with(6)
+    counts.assert_called_once_with(6)
+    create_many.assert_called_once()
+    assign_many.assert_called_once()
+    create_events.assert_called_once()
+
+    patches = create_many.call_args.args[1]
+    assert [patch["priority"] for patch in patches] == ["low", "medium", "emergency"]
+    assert assign_many.call_args.args[1] == {100: 4, 101: 4, 102: 5}
+    events = create_events.call_args.args[0]
+    assert [event["work_order_id"] for event in events] == [102, 101, 100]
+    assert {event["event_type"] for event in events} == {"assigned"}
+    assert result.created_count == 3
+    assert result.created_work_order_ids == [100, 101, 102]
+
+
+def test_ingest_rows_reports_rows_skipped_on_an_existing_external_ref():
+    rows = [
+        WorkOrderIngestRow(title="Known leak", external_ref="A-1"),
+        WorkOrderIngestRow(title="New leak", external_ref="B-2"),
+        WorkOrderIngestRow(title="New leak again", external_ref="B-2"),
+        WorkOrderIngestRow(title="No reference"),
+    ]
+    # create_many skips A-1 (already imported) and the second B-2 (ON CONFLICT DO NOTHING).
+    created = [{"id": 101, "external_ref": "B-2"}, {"id": 102, "external_ref": None}]
+
+    with patch("services.ingestion_service._forced_priorities", return_value={}), patch(
+        "services.ingestion_service._create_rows", return_value=created
+    ), patch(
+        "services.ingestion_service.work_orders_repo.ids_by_external_ref", return_value={"A-1": 55}
+    ) as lookup, patch("services.ingestion_service.unit_of_work"):
+        result = ingest_rows(6, 5, rows, source="csv")
+
+    lookup.assert_called_once_with(6, ["A-1"])
+    assert (result.created_count, result.duplicate_count, result.failed_count) == (2, 2, 0)
+    assert result.created_work_order_ids == [101, 102]
+    assert [(row.external_ref, row.work_order_id) for row in result.duplicate_rows] == [("A-1", 55), ("B-2", 101)]
+
+
+def test_csv_stream_is_validated_in_fixed_size_batches():
+    stream = io.BytesIO(("\ufefftitle,priority\n" + "Row one,high\n,low\nRow three,low\nRow four,low\n").encode("utf-8"))
+
+    batches = list(iter_csv_batches(stream, batch_size=2))
+
+    assert [([row.title for row in rows], [error.row_number for error in errors]) for rows, errors in batches] == [
+        (["Row one"], [2]),
+        (["Row three", "Row four"], []),
+    ]
+    assert not stream.closed
+
+
+def test_csv_stream_over_the_row_cap_is_rejected():
+    stream = io.BytesIO("title\nRow one\nRow two\nRow three\n".encode("utf-8"))
+
+    with pytest.raises(ValueError, match="maximum of 2 rows"):
+        list(iter_csv_batches(stream, batch_size=10, max_rows=2))
+
+
+def test_ingest_csv_persists_each_batch_inside_one_transaction(monkeypatch):
+    monkeypatch.setattr(settings, "INGESTION_BATCH_SIZE", 2)
+    stream = io.BytesIO("title\nRow one\nRow two\nx\nRow four\n".encode("utf-8"))
+    batches = []
+
+    def fake_persist(organization_id, created_by, rows, source, forced_priorities):
+        batches.append([row.title for row in rows])
+        return [len(batches) * 10 + index for index in range(len(rows))], []
+
+    with patch("services.ingestion_service._forced_priorities", return_value={}) as rules, patch(
+        "services.ingestion_service._persist_rows", side_effect=fake_persist
+    ), patch("services.ingestion_service.unit_of_work") as unit:
+        result = ingest_csv(6, 5, stream)
+
+    rules.assert_called_once_with(6)
+    unit.assert_called_once_with()
+    assert batches == [["Row one", "Row two"], ["Row four"]]
+    assert result.created_work_order_ids == [10, 11, 20]
+    assert result.failed_count == 1
+    assert result.failed_rows[0].row_number == 3
+
+
+def test_webhook_batch_dedupes_on_external_ref_and_reports_each_item():
+    items = [
+        {"title": "Known leak", "external_ref": "A-1"},
+        {"title": "New leak", "external_ref": "B-2"},
+        {"title": "New leak (retry)", "external_ref": "B-2"},
+        {"title": "No reference"},
+        {"title": ""},
+    ]
+
+    def fake_create_many(organization_id, patches):
+        return [{"id": 200 + index, **patch} for index, patch in enumerate(patches)]
+
+    with patch(
+        "services.ingestion_service.work_orders_repo.ids_by_external_ref", side_effect=[{"A-1": 50}, {}]
+    ) as lookup, patch("services.priority_rule_service.priority_rules_repo.list_by_org", return_value=[]), patch(
+        "services.ingestion_service.work_orders_repo.create_many", side_effect=fake_create_many
+    ) as create_many, patch("services.ingestion_service.auto_assign_batch") as assign:
+        result = ingest_webhook_batch(6, items)
+
+    assert lookup.call_args_list[0].args == (6, ["A-1", "B-2"])
+    assert [patch["title"] for patch in create_many.call_args.args[1]] == ["New leak", "No reference"]
+    assign.assert_called_once()
+    assert [(item.status, item.work_order_id) for item in result.results] == [
+        ("duplicate", 50),
+        ("created", 200),
+        ("duplicate", 200),
+        ("created", 201),
+        ("invalid", None),
+    ]
+    assert (result.created_count, result.duplicate_count, result.failed_count) == (2, 2, 1)
+    assert result.results[4].errors
+
+
+def test_retried_webhook_batch_is_a_single_lookup():
+    items = [{"title": "Known leak", "external_ref": "A-1"}, {"title": "Other leak", "external_ref": "A-2"}]
+
+    with patch(
+        "services.ingestion_service.work_orders_repo.ids_by_external_ref", side_effect=[{"A-1": 50, "A-2": 51}, {}]
+    ), patch("services.priority_rule_service.priority_rules_repo.list_by_org") as rules, patch(
+        "services.ingestion_service.work_orders_repo.create_many"
+    ) as create_many:
+        result = ingest_webhook_batch(6, items)
+
+    rules.assert_not_called()
+    create_many.assert_not_called()
+    assert [item.work_order_id for item in result.results] == [50, 51]
+    assert result.duplicate_count == 2
@@ -1,4 +1,4 @@
-from services.matching_service import find_best_technician, score_technician
+from services.matching_service import assign_batch, find_best_technician, score_technician
 
 
 def make_technician(id, skills=None, zone=None, lat=None, lon=None, availability="available", max_daily_jobs=8):
@@ -13,8 +13,8 @@ def make_technician(id, skills=None, zone=None, lat=None, lon=None, availability
     }
 
 
-def make_work_order(service_type="plumbing", lat=None, lon=None, address=None):
-    return {"service_type": service_type, "latitude": lat, "longitude": lon, "address": address}
+def make_work_order(service_type="plumbing", lat=None, lon=None, address=None, id=None):
+    return {"id": id, "service_type": service_type, "latitude": lat, "longitude": lon, "address": address}
 
 
 def test_off_duty_technician_is_excluded():
@@ -83,3 +83,125 @@ def test_zone_fallback_used_when_no_coordinates():
     wo = make_work_order(service_type="general", address="123 North Ave")
     score = score_technician(tech, wo, active_count=0)
     assert score is not None and score > 0
+
+
+def test_batch_assignment_beats_first_come_greedy_picks():
+    generalist = make_technician(1, skills=["hvac", "plumbing"], max_daily_jobs=1)
+    hvac_only = make_technician(2, skills=["hvac"], max_daily_jobs=1)
+    hvac_job = make_work_order(service_type="hvac", id=10)
+    plumbing_job = make_work_order(service_type="plumbing", id=11)
+
+    # Greedy hands the generalist to whichever order comes first.
+    assert find_best_technician([generalist, hvac_only], hvac_job, {}) is generalist
+
+    assignments = assign_batch([generalist, hvac_only], [[hvac_job, plumbing_job]], {})
+
+    assert {work_order_id: tech["id"] for work_order_id, tech in assignments.items()} == {10: 2, 11: 1}
+
+
+def test_batch_assignment_serves_higher_priority_tiers_first():
+    plumber = make_technician(1, skills=["plumbing"], max_daily_jobs=1)
+    electrician = make_technician(2, skills=["electrical"], max_daily_jobs=1)
+    routine_leak = make_work_order(service_type="plumbing", id=10)
+    burst_pipe = make_work_order(service_type="plumbing", id=11)
+
+    assignments = assign_batch([plumber, electrician], [[burst_pipe], [routine_leak]], {})
+
+    assert assignments[11] is plumber
+    assert assignments[10] is electrician
+
+
+def test_batch_assignment_respects_remaining_capacity():
+    busy = make_technician(1, skills=["plumbing"], max_daily_jobs=2)
+    off_duty = make_technician(2, skills=["plumbing"], availability="off_duty")
+    work_orders = [make_work_order(id=work_order_id) for work_order_id in (10, 11, 12)]
+
+    assignments = assign_batch([busy, off_duty], [work_orders], {1: 1})
+
+    assert len(assignments) == 1
+    assert list(assignments.values()) == [busy]
+
+
+def test_batch_assignment_spreads_load_like_the_scalar_workload_term():
+    first = make_technician(1, skills=["plumbing"], max_daily_jobs=4)
+    second = make_technician(2, skills=["plumbing"], max_daily_jobs=4)
+    work_orders = [make_work_order(id=work_order_id) for work_order_id in range(10, 14)]
+
+    assignments = assign_batch([first, second], [work_orders], {1: 2})
+
+    assert sorted(tech["id"] for tech in assignments.values()) == [1, 2, 2, 2]
+
+
+def test_vectorized_scores_match_the_scalar_scorer():
+    import math
+    import random
+
+    from services.matching_service import RosterMatrix, score_matrix
+
+    rng = random.Random(7)
+    skills = ["plumbing", "hvac", "electrical", "roofing"]
+    zones = [None, "Downtown", "Harbor", "north side"]
+
+    def maybe(value):
+        return value if rng.random() > 0.3 else None
+
+    technicians = [
+        make_technician(
+            id,
+            skills=rng.sample(skills, rng.randint(0, 3)),
+            zone=rng.choice(zones),
+            lat=maybe(rng.uniform(39, 42)),
+            lon=maybe(rng.uniform(-75, -71)),
+            availability=rng.choice(["available", "available", "available", "off_duty"]),
+            max_daily_jobs=rng.choice([0, 2, 5, 8]),
+        )
+        for id in range(60)
+    ]
+    work_orders = [
+        make_work_order(
+            service_type=rng.choice(skills + ["general", None]),
+            lat=maybe(rng.uniform(39, 42)),
+            lon=maybe(rng.uniform(-75, -71)),
+            address=rng.choice([None, "12 Harbor Rd", "Downtown loft", "1 North Side Ave", "Elsewhere"]),
+        )
+        for _ in range(40)
+    ]
+    active_counts = {technician["id"]: rng.randint(0, 8) for technician in technicians}
+
+    scores = score_matrix(RosterMatrix.from_technicians(technicians), work_orders, active_counts)
+
+    for row, work_order in enumerate(work_orders):
+        for column, technician in enumerate(technicians):
+            expected = score_technician(technician, work_order, active_counts[technician["id"]])
+            if expected is None:
+                assert scores[row, column] == -math.inf
+            else:
+                assert math.isclose(scores[row, column], expected, rel_tol=1e-12, abs_tol=1e-9)
+
+
+def test_rows_taken_from_a_matrix_score_like_a_matrix_built_from_them():
+    import numpy as np
+
+    from services.matching_service import RosterMatrix, score_matrix
+
+    technicians = [
+        make_technician(1, skills=["hvac"], lat=40.78, lon=-73.97),
+        make_technician(2, zone="Harbor"),
+        make_technician(3, skills=["plumbing"], zone="Harbor", lat=40.68, lon=-73.94),
+        make_technician(4, skills=["plumbing"], zone="Downtown"),
+        make_technician(5, lat=39.95, lon=-75.17, max_daily_jobs=2),
+    ]
+    work_orders = [
+        make_work_order(lat=40.75, lon=-73.99, address="12 Harbor Rd"),
+        make_work_order(service_type="hvac", address="Downtown loft"),
+    ]
+    active_counts = {3: 4, 5: 1}
+    positions = [1, 3, 4]
+
+    taken = RosterMatrix.from_technicians(technicians).take(positions)
+
+    assert [technician["id"] for technician in taken.technicians] == [2, 4, 5]
+    np.testing.assert_array_equal(
+        score_matrix(taken, work_orders, active_counts),
+        score_matrix(RosterMatrix.from_technicians([technicians[p] for p in positions]), work_orders, active_counts),
+    )
@@ -0,0 +1,95 @@
+import threading
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from core.config import settings
+from services import dashboard_export_service, operations_report_service
+
+FRESHNESS = datetime(2026, 10, 17, 9, 30, tzinfo=timezone.utc)
+COST_ROW = {
+    "service_type": "plumbing",
+    "work_order_count": 2,
+    "estimated_cost_cents": 80000,
+    "actual_cost_cents": 94000,
+    "variance_cents": 14000,
+    "average_actual_cost_cents": 47000,
+    "invoice_reference_count": 1,
+}
+
+
+@pytest.fixture
+def report_pool(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=5)
+    monkeypatch.setattr(operations_report_service, "_executor", executor)
+    with patch("services.operations_report_service.dashboard_rollup_service.refresh_for_report"), \
+            patch("services.operations_report_service.rollups_repo.freshness", return_value=FRESHNESS), \
+            patch("services.operations_report_service.set_statement_timeout"):
+        yield
+    executor.shutdown(wait=True)
+
+
+def _patch_sections(**loaders):
+    targets = {
+        "stale_work_orders": "services.operations_report_service.work_orders_repo.list_stale_work_orders",
+        "overloaded_technicians": "services.operations_report_service.workload_service.list_overloaded_technicians",
+        "property_hotspots": "services.operations_report_service.rollups_repo.list_property_hotspots",
+        "completion_cycles": "services.operations_report_service.rollups_repo.list_completion_cycles",
+        "cost_summary": "services.operations_report_service.rollups_repo.list_cost_summary",
+    }
+    stack = ExitStack()
+    for name, loader in loaders.items():
+        stack.enter_context(patch(targets[name], side_effect=loader))
+    return stack
+
+
+def test_sections_run_concurrently(report_pool):
+    # Every section waits for all five to be in flight at once.
+    barrier = threading.Barrier(5, timeout=5)
+
+    def section(*_args, **_kwargs):
+        barrier.wait()
+        return []
+
+    names = ("stale_work_orders", "overloaded_technicians", "property_hotspots", "completion_cycles", "cost_summary")
+    with _patch_sections(**{name: section for name in names}):
+        report = operations_report_service.build_operations_report(6)
+
+    assert report.unavailable_sections == []
+    assert report.freshness == FRESHNESS
+
+
+def test_failed_and_slow_sections_are_reported_without_failing_the_report(report_pool, monkeypatch):
+    monkeypatch.setattr(settings, "OPERATIONS_REPORT_SECTION_TIMEOUT_SECONDS", 0.2)
+    release = threading.Event()
+
+    def slow(*_args, **_kwargs):
+        release.wait(5)
+        return []
+
+    def broken(*_args, **_kwargs):
+        raise RuntimeError("relation does not exist")
+
+    with _patch_sections(
+        stale_work_orders=lambda *args, **kwargs: [],
+        overloaded_technicians=lambda *args, **kwargs: [],
+        property_hotspots=slow,
+        completion_cycles=broken,
+        cost_summary=lambda *args, **kwargs: [COST_ROW],
+    ):
+        try:
+            report = operations_report_service.build_operations_report(6)
+        finally:
+            release.set()
+
+    assert [(item.section, item.reason) for item in report.unavailable_sections] == [
+        ("property_hotspots", "timeout"),
+        ("completion_cycles", "error"),
+    ]
+    assert report.property_hotspots == [] and report.completion_cycles == []
+    assert report.cost_summary[0].actual_cost_cents == 94000
+    body = "".join(dashboard_export_service.iter_operations_report_csv(report))
+    assert "unavailable_section,,property_hotspots,timeout" in body
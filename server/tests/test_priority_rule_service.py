@@ -0,0 +1,62 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from core import change_feed
+from core.cache import publish_invalidation
+from repositories import priority_rules as priority_rules_repo
+from services import priority_rule_service, work_order_service
+
+RULES = [{"service_type": "electrical", "forced_priority": "emergency"}]
+
+
+def test_rules_are_loaded_once_per_org():
+    with patch("services.priority_rule_service.priority_rules_repo.list_by_org", return_value=RULES) as rules:
+        assert work_order_service.apply_priority_rule(6, "electrical", "low") == "emergency"
+        assert work_order_service.apply_priority_rule(6, "plumbing", "low") == "low"
+        assert work_order_service.apply_priority_rule(6, "electrical", "medium") == "emergency"
+
+    rules.assert_called_once_with(6)
+
+
+def test_upsert_invalidates_after_commit():
+    with patch("services.priority_rule_service.priority_rules_repo.list_by_org", return_value=RULES) as rules:
+        priority_rule_service.rules_for_org(6)
+        with patch("repositories.priority_rules.fetch_one_in_transaction", return_value={"id": 1}):
+            priority_rules_repo.upsert_rule(6, "electrical", "high")
+        priority_rule_service.rules_for_org(6)
+
+    assert rules.call_count == 2
+
+
+def test_a_rule_saved_during_load_is_not_cached_stale():
+    def load_while_someone_saves(organization_id):
+        publish_invalidation("priority_rules", organization_id=organization_id)
+        return RULES
+
+    with patch(
+        "services.priority_rule_service.priority_rules_repo.list_by_org", side_effect=load_while_someone_saves
+    ) as rules:
+        priority_rule_service.rules_for_org(6)
+        priority_rule_service.rules_for_org(6)
+
+    assert rules.call_count == 2
+
+
+def test_listener_replays_notifications_from_other_workers():
+    payload = json.dumps(
+        {"table": "org_priority_rules", "op": "UPDATE", "organization_id": 6, "ids": [1], "fields": ["forced_priority"]}
+    )
+    connection = MagicMock(notifies=[SimpleNamespace(payload=payload), SimpleNamespace(payload="not json")])
+    listener = change_feed.ChangeFeedListener()
+    listener._connection = connection
+
+    with patch("services.priority_rule_service.priority_rules_repo.list_by_org", return_value=RULES) as rules:
+        priority_rule_service.rules_for_org(6)
+        with patch("core.change_feed.select.select", return_value=([connection], [], [])):
+            assert listener.poll() is True
+        priority_rule_service.rules_for_org(6)
+
+    connection.poll.assert_called_once()
+    assert connection.notifies == []
+    assert rules.call_count == 2
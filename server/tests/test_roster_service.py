@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+import pytest
+
+from models.user import User
+from repositories import technicians as technicians_repo
+from repositories import users as users_repo
+from routers import dashboard as dashboard_router
+from services import roster_service
+
+TECHNICIAN_ROWS = [
+    {
+        "id": 8,
+        "user_id": 108,
+        "skills": ["plumbing"],
+        "availability_status": "available",
+        "max_daily_jobs": 4,
+        "users": {"full_name": "Tech One", "email": "tech@example.com", "is_active": True},
+    },
+    {
+        "id": 9,
+        "user_id": 109,
+        "skills": ["hvac"],
+        "availability_status": "off_duty",
+        "max_daily_jobs": 4,
+        "users": {"full_name": "Tech Two", "email": "tech2@example.com", "is_active": True},
+    },
+]
+
+ADMIN = User(id=1, organization_id=6, email="admin@example.com", full_name="Admin", role="org_admin", is_active=True)
+
+
+def test_dispatch_board_loads_the_roster_once_and_metrics_skip_it():
+    statuses = ("open", "in_progress", "paused", "escalated", "completed", "cancelled", "archived")
+    counts = {f"{status}_count": 0 for status in statuses}
+    counts.update(total_work_orders=0, sla_at_risk_count=0, active_technicians_count=1, total_technicians_count=2)
+    with patch("services.roster_service.technicians_repo.list_by_org", return_value=TECHNICIAN_ROWS) as roster, patch(
+        "services.dashboard_metrics_service.work_orders_repo.dashboard_counts", return_value=counts
+    ), patch("services.dispatch_board_service.work_orders_repo.list_dispatch_board_work_orders", return_value=[]):
+        metrics = dashboard_router.get_metrics(current_user=ADMIN, organization={"id": 6})
+        board = dashboard_router.get_dispatch_board(current_user=ADMIN, organization={"id": 6})
+        dashboard_router.get_dispatch_board(current_user=ADMIN, organization={"id": 6})
+
+    roster.assert_called_once_with(6)
+    assert (metrics.active_technicians_count, metrics.total_technicians_count) == (1, 2)
+    assert [lane.technician_id for lane in board.technician_lanes] == [8, 9]
+
+
+def test_snapshot_rows_are_read_only():
+    with patch("services.roster_service.technicians_repo.list_by_org", return_value=TECHNICIAN_ROWS):
+        snapshot = roster_service.get_snapshot(6)
+
+    with pytest.raises(TypeError):
+        snapshot.technicians[0]["availability_status"] = "busy"
+    with pytest.raises(TypeError):
+        snapshot.by_id[8]["users"]["full_name"] = "Renamed"
+    assert TECHNICIAN_ROWS[0]["availability_status"] == "available"
+
+
+def test_technician_and_user_changes_bump_the_version_and_reload():
+    with patch("services.roster_service.technicians_repo.list_by_org", return_value=TECHNICIAN_ROWS) as roster:
+        first = roster_service.get_snapshot(6)
+        assert roster_service.get_snapshot(6) is first
+
+        with patch("repositories.technicians.update_row", return_value={}):
+            technicians_repo.update(8, 6, {"skills": ["plumbing", "hvac"]})
+        second = roster_service.get_snapshot(6)
+
+        with patch("repositories.users.update_row", return_value={}):
+            users_repo.update_role_and_status(108, 6, {"is_active": False})
+        third = roster_service.get_snapshot(6)
+
+    assert roster.call_count == 3
+    assert first.version < second.version < third.version
+
+
+def test_a_bump_during_load_is_not_hidden_by_the_stale_snapshot():
+    def load_while_someone_edits(organization_id):
+        roster_service.bump_version(organization_id)
+        return TECHNICIAN_ROWS
+
+    with patch("services.roster_service.technicians_repo.list_by_org", side_effect=load_while_someone_edits) as roster:
+        roster_service.get_snapshot(6)
+        roster_service.get_snapshot(6)
+
+    assert roster.call_count == 2
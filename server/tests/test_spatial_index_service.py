@@ -0,0 +1,158 @@
+import math
+import random
+from unittest.mock import patch
+
+from repositories import technicians as technicians_repo
+from services import matching_service, roster_service, spatial_index_service, work_order_service
+from services.matching_service import _haversine_km
+from services.spatial_index_service import TechnicianSpatialIndex
+
+
+def make_technician(id, lat=None, lon=None, availability="available", max_daily_jobs=8, skills=("plumbing",)):
+    return {
+        "id": id,
+        "skills": list(skills),
+        "zone": None,
+        "latitude": lat,
+        "longitude": lon,
+        "availability_status": availability,
+        "max_daily_jobs": max_daily_jobs,
+    }
+
+
+# Manhattan, Brooklyn, Newark, Philadelphia, Boston
+ROSTER = [
+    make_technician(1, 40.7831, -73.9712),
+    make_technician(2, 40.6782, -73.9442),
+    make_technician(3, 40.7357, -74.1724),
+    make_technician(4, 39.9526, -75.1652),
+    make_technician(5, 42.3601, -71.0589),
+    make_technician(6, 40.7300, -73.9900, availability="off_duty"),
+    make_technician(7),
+]
+
+
+def test_nearest_returns_closest_available_technicians_within_radius():
+    index = TechnicianSpatialIndex.build(6, ROSTER)
+
+    nearby = index.nearest(40.7484, -73.9857, k=10, radius_km=50)
+
+    assert [technician_id for technician_id, _distance in nearby] == [1, 2, 3]
+    for technician_id, distance_km in nearby:
+        technician = ROSTER[technician_id - 1]
+        expected = _haversine_km(technician["latitude"], technician["longitude"], 40.7484, -73.9857)
+        assert math.isclose(distance_km, expected, rel_tol=1e-9)
+
+
+def test_nearest_widens_the_search_past_ineligible_technicians():
+    index = TechnicianSpatialIndex.build(6, ROSTER)
+
+    nearby = index.nearest(40.7484, -73.9857, k=2, radius_km=500, eligible=lambda technician_id: technician_id > 2)
+
+    assert [technician_id for technician_id, _distance in nearby] == [3, 4]
+
+
+def test_location_or_availability_changes_rebuild_the_index():
+    with patch("services.spatial_index_service.technicians_repo.list_by_org", return_value=ROSTER) as roster:
+        first = spatial_index_service.get_index(6)
+        with patch("repositories.technicians.update_row", return_value={}):
+            technicians_repo.update(1, 6, {"skills": ["hvac"]})
+        assert spatial_index_service.get_index(6) is first
+
+        with patch("repositories.technicians.update_row", return_value={}):
+            technicians_repo.update(1, 6, {"availability_status": "busy"})
+        rebuilt = spatial_index_service.get_index(6)
+
+    assert rebuilt is not first
+    assert roster.call_count == 2
+
+
+def test_auto_assign_only_scores_nearby_and_unlocated_technicians(monkeypatch):
+    monkeypatch.setattr(work_order_service.settings, "MATCHING_CANDIDATE_COUNT", 2)
+    work_order = {"id": 1, "service_type": "hvac", "latitude": 40.7484, "longitude": -73.9857}
+
+    positions = work_order_service.matching_candidates(6, ROSTER, work_order, {1: 8})
+
+    assert [ROSTER[position]["id"] for position in positions] == [2, 3, 7]
+
+
+def test_pruning_keeps_far_technicians_who_win_on_skills():
+    # Times Square; the only electrician is in Philadelphia (~120 km away).
+    roster = [
+        make_technician(1, 40.7831, -73.9712),
+        make_technician(2, 40.6782, -73.9442),
+        make_technician(3, 40.7357, -74.1724),
+        make_technician(4, 39.9526, -75.1652, skills=("electrical",)),
+    ]
+    work_order = {"id": 1, "service_type": "electrical", "latitude": 40.7484, "longitude": -73.9857}
+
+    with patch.object(work_order_service.settings, "MATCHING_CANDIDATE_COUNT", 2), patch(
+        "services.work_order_service.roster_service.get_snapshot"
+    ) as roster_snapshot, patch("services.work_order_service.workload_service") as workload, patch(
+        "services.work_order_service.work_orders_repo.update", side_effect=lambda *args: work_order
+    ), patch(
+        "services.work_order_service.events_repo.create_event"
+    ), patch(
+        "services.work_order_service.notification_service.notify_technician_assigned"
+    ), patch(
+        "services.work_order_service.spatial_index_service.get_index",
+        side_effect=lambda organization_id, technicians: TechnicianSpatialIndex.build(organization_id, technicians),
+    ):
+        roster_snapshot.return_value = roster_service.RosterSnapshot.from_rows(6, 0, roster)
+        workload.get_snapshot.return_value.active_counts.return_value = {}
+        positions = work_order_service.matching_candidates(6, roster, work_order, {})
+        work_order_service.auto_assign(6, work_order)
+
+    assert [roster[position]["id"] for position in positions] == [1, 2, 3, 4]
+    unpruned = matching_service.find_best_technician(roster, work_order, {})
+    assert unpruned["id"] == 4
+    assert workload.record_change.call_args.kwargs["to_technician_id"] == unpruned["id"]
+
+
+def test_unlocated_work_orders_consider_the_whole_roster():
+    work_order = {"id": 1, "service_type": "plumbing", "latitude": None, "longitude": None}
+
+    assert work_order_service.matching_candidates(6, ROSTER, work_order, {}) is None
+
+
+def test_pruned_matching_picks_the_same_technician_as_a_full_scan(monkeypatch):
+    monkeypatch.setattr(work_order_service.settings, "MATCHING_CANDIDATE_COUNT", 1)
+    monkeypatch.setattr(
+        work_order_service.spatial_index_service,
+        "get_index",
+        lambda organization_id, technicians: TechnicianSpatialIndex.build(organization_id, technicians),
+    )
+    rng = random.Random(17)
+    pruned_rounds = 0
+    for _round in range(200):
+        roster = []
+        for id in range(1, rng.randint(2, 40)):
+            located = rng.random() < 0.9
+            technician = make_technician(
+                id,
+                40.75 + rng.uniform(-0.5, 0.5) if located else None,
+                -73.98 + rng.uniform(-0.6, 0.6) if located else None,
+                availability=rng.choice(["available", "available", "available", "off_duty"]),
+                max_daily_jobs=rng.randint(1, 8),
+                skills=rng.sample(["plumbing", "hvac", "electrical"], rng.randint(0, 2)),
+            )
+            technician["zone"] = rng.choice([None, "queens", "bronx"])
+            roster.append(technician)
+        active_counts = {technician["id"]: rng.randint(0, technician["max_daily_jobs"]) for technician in roster}
+        work_order = {
+            "id": 1,
+            "service_type": rng.choice(["plumbing", "hvac", "electrical", "roofing"]),
+            "latitude": 40.75 + rng.uniform(-0.3, 0.3),
+            "longitude": -73.98 + rng.uniform(-0.3, 0.3),
+            "address": rng.choice(["12 Main St, Queens", "4 Elm Ave, Brooklyn"]),
+        }
+
+        positions = work_order_service.matching_candidates(6, roster, work_order, active_counts)
+        matrix = matching_service.RosterMatrix.from_technicians(roster)
+        candidates = matrix if positions is None else matrix.take(positions)
+        pruned_rounds += len(candidates.technicians) < len(roster)
+
+        assert matching_service.find_best_technician(
+            candidates, work_order, active_counts
+        ) == matching_service.find_best_technician(roster, work_order, active_counts)
+    assert pruned_rounds > 50
@@ -6,6 +6,8 @@ calls carry the caller's organization_id.
 """
 
 import asyncio
+import json
+from datetime import datetime, timezone
 
 from unittest.mock import patch
 
@@ -27,7 +29,7 @@ from routers import organizations as organizations_router
 from routers import properties as properties_router
 from routers import vendors as vendors_router
 from routers import work_orders as work_orders_router
-from services import tenant_export_service
+from services import entity_export_service, tenant_export_service
 from models.client import ClientUpdate
 from models.property import PropertyUpdate
 from models.user import User
@@ -42,6 +44,13 @@ from models.work_order import (
 from models.work_order_message import WorkOrderMessageCreate
 
 
+def _streamed_body(response) -> str:
+    async def collect():
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(collect())
+
+
 def _work_order_row(**overrides):
     row = {
         "id": 1,
@@ -92,6 +101,27 @@ def test_list_filtered_scopes_by_organization_id():
     assert params["organization_id"] == 42
 
 
+def test_work_order_keyset_page_is_org_scoped_limited_and_projected():
+    with patch("repositories.work_orders.fetch_all", return_value=[]) as mock_fetch:
+        work_orders_repo.list_filtered_page(
+            organization_id=42,
+            limit=25,
+            after=(datetime(2026, 7, 28, tzinfo=timezone.utc), 90),
+            columns=["title", "status"],
+            client_id=10,
+        )
+
+    sql, params = mock_fetch.call_args.args
+    assert "SELECT id, created_at, title, status" in sql
+    assert "organization_id = :organization_id" in sql
+    assert "client_id = :client_id" in sql
+    assert "(created_at, id) < (:after_created_at, :after_id)" in sql
+    assert "ORDER BY created_at DESC, id DESC" in sql
+    assert params["organization_id"] == 42
+    assert params["after_id"] == 90
+    assert params["limit"] == 26
+
+
 def test_work_order_filters_keep_property_client_and_vendor_inside_org_scope():
     with patch("repositories.work_orders.fetch_all", return_value=[]) as mock_fetch:
         work_orders_repo.list_filtered(
@@ -125,50 +155,14 @@ def test_stale_work_order_report_scopes_by_organization_id():
     assert params["limit"] == 5
 
 
-def test_overloaded_technician_report_scopes_by_organization_id():
+def test_technician_workload_counts_scope_by_organization_id():
     with patch("repositories.work_orders.fetch_all", return_value=[]) as mock_fetch:
-        work_orders_repo.list_overloaded_technicians(organization_id=42, limit=5)
-
-    sql, params = mock_fetch.call_args.args
-    assert "WHERE t.organization_id = :organization_id" in sql
-    assert "wo.organization_id = t.organization_id" in sql
-    assert params == {"organization_id": 42, "limit": 5}
-
-
-def test_property_hotspot_report_scopes_by_organization_id():
-    with patch("repositories.work_orders.fetch_all", return_value=[]) as mock_fetch:
-        work_orders_repo.list_property_hotspots(organization_id=42, since_days=30, limit=5)
-
-    sql, params = mock_fetch.call_args.args
-    assert "WHERE p.organization_id = :organization_id" in sql
-    assert "wo.organization_id = p.organization_id" in sql
-    assert params["organization_id"] == 42
-    assert params["limit"] == 5
-
-
-def test_completion_cycle_report_scopes_by_organization_id():
-    with patch("repositories.work_orders.fetch_all", return_value=[]) as mock_fetch:
-        work_orders_repo.list_completion_cycles(organization_id=42, since_days=90, limit=5)
-
-    sql, params = mock_fetch.call_args.args
-    assert "WHERE organization_id = :organization_id" in sql
-    assert "status = 'completed'" in sql
-    assert "completed_at IS NOT NULL" in sql
-    assert params["organization_id"] == 42
-    assert params["limit"] == 5
-
-
-def test_cost_summary_report_scopes_by_organization_id_and_omits_empty_cost_rows():
-    with patch("repositories.work_orders.fetch_all", return_value=[]) as mock_fetch:
-        work_orders_repo.list_cost_summary(organization_id=42, since_days=90, limit=5)
+        work_orders_repo.active_counts_by_technician(organization_id=42)
 
     sql, params = mock_fetch.call_args.args
     assert "WHERE organization_id = :organization_id" in sql
-    assert "created_at >= :cutoff" in sql
-    assert "estimated_cost_cents IS NOT NULL OR actual_cost_cents IS NOT NULL" in sql
-    assert "GROUP BY COALESCE(NULLIF(service_type, ''), 'general')" in sql
-    assert params["organization_id"] == 42
-    assert params["limit"] == 5
+    assert "GROUP BY assigned_technician_id, status" in sql
+    assert params == {"organization_id": 42}
 
 
 def test_dispatch_board_work_orders_scope_and_join_by_organization_id():
@@ -341,15 +335,13 @@ def test_work_order_property_client_link_must_match_inside_org():
 
 
 def test_events_are_written_with_org_id():
-    with patch("repositories.work_order_events.insert_row") as mock_insert:
-        mock_insert.side_effect = lambda table, payload: payload
-        event = events_repo.create_event(organization_id=6, work_order_id=1, event_type="created")
+    with patch("repositories.work_order_events.insert_rows") as mock_insert:
+        events_repo.create_event(organization_id=6, work_order_id=1, event_type="created")
 
-    table, payload = mock_insert.call_args.args
+    table, payloads = mock_insert.call_args.args
     assert table == "work_order_events"
-    assert payload["organization_id"] == 6
-    assert payload["work_order_id"] == 1
-    assert event["organization_id"] == 6
+    assert payloads[0]["organization_id"] == 6
+    assert payloads[0]["work_order_id"] == 1
 
 
 def test_messages_list_for_work_order_scopes_by_org_and_work_order():
@@ -500,6 +492,100 @@ def test_unfiltered_technician_work_order_list_uses_active_assigned_queue():
     generic_list.assert_not_called()
 
 
+def test_paginated_technician_list_stays_scoped_and_skips_priority_queue():
+    technician_user = User(
+        id=8,
+        organization_id=6,
+        email="lena.tech@example.com",
+        full_name="Lena Torres",
+        role="technician",
+        is_active=True,
+    )
+
+    with patch(
+        "routers.work_orders.technicians_repo.get_by_user_id",
+        return_value={"id": 4, "user_id": 8},
+    ):
+        with patch("routers.work_orders.work_orders_repo.list_for_technician") as active_list:
+            with patch(
+                "routers.work_orders.work_orders_repo.list_filtered_page", return_value=[]
+            ) as page_list:
+                page = work_orders_router.list_work_orders(
+                    status_filter=None,
+                    technician_id=999,
+                    limit=20,
+                    current_user=technician_user,
+                    organization={"id": 6},
+                )
+
+    assert page.items == []
+    assert page.next_cursor is None
+    active_list.assert_not_called()
+    assert page_list.call_args.args == (6,)
+    assert page_list.call_args.kwargs["technician_id"] == 4
+    assert page_list.call_args.kwargs["limit"] == 20
+
+
+def test_work_order_page_cursor_round_trips_and_projects_fields():
+    manager = User(
+        id=5,
+        organization_id=6,
+        email="coord@example.com",
+        full_name="Coordinator",
+        role="coordinator",
+        is_active=True,
+    )
+    rows = [
+        {"id": 30, "created_at": datetime(2026, 7, 30, 9, 15, 1, 250, tzinfo=timezone.utc), "title": "C"},
+        {"id": 20, "created_at": datetime(2026, 7, 29, tzinfo=timezone.utc), "title": "B"},
+        {"id": 10, "created_at": datetime(2026, 7, 28, tzinfo=timezone.utc), "title": "A"},
+    ]
+
+    with patch("routers.work_orders.work_orders_repo.list_filtered_page", return_value=rows) as page_list:
+        first = work_orders_router.list_work_orders(
+            status_filter=None, limit=2, fields="title", current_user=manager, organization={"id": 6}
+        )
+        work_orders_router.list_work_orders(
+            status_filter=None,
+            limit=2,
+            fields="title",
+            cursor=first.next_cursor,
+            current_user=manager,
+            organization={"id": 6},
+        )
+
+    assert [item["id"] for item in first.items] == [30, 20]
+    assert first.next_cursor is not None
+    assert page_list.call_args_list[0].kwargs["columns"] == ["title"]
+    assert page_list.call_args_list[0].kwargs["after"] is None
+    assert page_list.call_args_list[1].kwargs["after"] == (datetime(2026, 7, 29, tzinfo=timezone.utc), 20)
+
+
+def test_work_order_page_rejects_unknown_fields_and_bad_cursors():
+    manager = User(
+        id=5,
+        organization_id=6,
+        email="coord@example.com",
+        full_name="Coordinator",
+        role="coordinator",
+        is_active=True,
+    )
+
+    with patch("routers.work_orders.work_orders_repo.list_filtered_page") as page_list:
+        with pytest.raises(HTTPException) as unknown_field:
+            work_orders_router.list_work_orders(
+                status_filter=None, fields="title,password_hash", current_user=manager, organization={"id": 6}
+            )
+        with pytest.raises(HTTPException) as bad_cursor:
+            work_orders_router.list_work_orders(
+                status_filter=None, cursor="not-a-cursor", current_user=manager, organization={"id": 6}
+            )
+
+    assert unknown_field.value.status_code == 400
+    assert bad_cursor.value.status_code == 400
+    page_list.assert_not_called()
+
+
 def test_client_cannot_view_other_client_work_order():
     client_user = User(
         id=5,
@@ -1209,6 +1295,9 @@ def test_client_can_decline_pending_approval_for_own_work_order():
     assert "declined" in mock_message.call_args.args[3]["body"]
 
 
+ROLLUP_FRESHNESS = datetime(2026, 10, 17, 9, 30, tzinfo=timezone.utc)
+
+
 def test_operations_report_uses_tenant_scoped_repository_calls():
     admin_user = User(
         id=5,
@@ -1219,11 +1308,14 @@ def test_operations_report_uses_tenant_scoped_repository_calls():
         is_active=True,
     )
 
-    with patch("routers.dashboard.work_orders_repo.list_stale_work_orders", return_value=[]) as stale:
-        with patch("routers.dashboard.work_orders_repo.list_overloaded_technicians", return_value=[]) as overloaded:
-            with patch("routers.dashboard.work_orders_repo.list_property_hotspots", return_value=[]) as hotspots:
-                with patch("routers.dashboard.work_orders_repo.list_completion_cycles", return_value=[]) as cycles:
-                    with patch("routers.dashboard.work_orders_repo.list_cost_summary", return_value=[]) as costs:
+    with patch("services.operations_report_service.work_orders_repo.list_stale_work_orders", return_value=[]) as stale, \
+            patch("services.operations_report_service.dashboard_rollup_service.refresh_for_report") as refresh, \
+            patch("services.operations_report_service.rollups_repo.freshness", return_value=ROLLUP_FRESHNESS), \
+            patch("services.operations_report_service.set_statement_timeout"):
+        with patch("services.operations_report_service.workload_service.list_overloaded_technicians", return_value=[]) as overloaded:
+            with patch("services.operations_report_service.rollups_repo.list_property_hotspots", return_value=[]) as hotspots:
+                with patch("services.operations_report_service.rollups_repo.list_completion_cycles", return_value=[]) as cycles:
+                    with patch("services.operations_report_service.rollups_repo.list_cost_summary", return_value=[]) as costs:
                         report = dashboard_router.get_operations_report(
                             stale_days=14,
                             hotspot_days=60,
@@ -1234,6 +1326,8 @@ def test_operations_report_uses_tenant_scoped_repository_calls():
                             organization={"id": 6},
                         )
 
+    refresh.assert_called_once_with(6)
+    assert report.freshness == ROLLUP_FRESHNESS
     assert report.stale_work_orders == []
     assert report.overloaded_technicians == []
     assert report.property_hotspots == []
@@ -1301,8 +1395,8 @@ def test_dispatch_board_uses_tenant_scoped_repository_calls_and_summarizes():
         }
     ]
 
-    with patch("routers.dashboard.work_orders_repo.list_dispatch_board_work_orders", return_value=work_rows) as work_list:
-        with patch("routers.dashboard.technicians_repo.list_by_org", return_value=technician_rows) as tech_list:
+    with patch("services.dispatch_board_service.work_orders_repo.list_dispatch_board_work_orders", return_value=work_rows) as work_list:
+        with patch("services.roster_service.technicians_repo.list_by_org", return_value=technician_rows) as tech_list:
             board = dashboard_router.get_dispatch_board(
                 current_user=admin_user,
                 organization={"id": 6},
@@ -1365,11 +1459,14 @@ def test_operations_report_export_returns_downloadable_csv():
         }
     ]
 
-    with patch("routers.dashboard.work_orders_repo.list_stale_work_orders", return_value=stale_rows) as stale:
-        with patch("routers.dashboard.work_orders_repo.list_overloaded_technicians", return_value=[]):
-            with patch("routers.dashboard.work_orders_repo.list_property_hotspots", return_value=[]):
-                with patch("routers.dashboard.work_orders_repo.list_completion_cycles", return_value=cycle_rows):
-                    with patch("routers.dashboard.work_orders_repo.list_cost_summary", return_value=cost_rows):
+    with patch("services.operations_report_service.work_orders_repo.list_stale_work_orders", return_value=stale_rows) as stale, \
+            patch("services.operations_report_service.dashboard_rollup_service.refresh_for_report"), \
+            patch("services.operations_report_service.rollups_repo.freshness", return_value=ROLLUP_FRESHNESS), \
+            patch("services.operations_report_service.set_statement_timeout"):
+        with patch("services.operations_report_service.workload_service.list_overloaded_technicians", return_value=[]):
+            with patch("services.operations_report_service.rollups_repo.list_property_hotspots", return_value=[]):
+                with patch("services.operations_report_service.rollups_repo.list_completion_cycles", return_value=cycle_rows):
+                    with patch("services.operations_report_service.rollups_repo.list_cost_summary", return_value=cost_rows):
                         response = dashboard_router.export_operations_report(
                             stale_days=14,
                             hotspot_days=60,
@@ -1383,7 +1480,7 @@ def test_operations_report_export_returns_downloadable_csv():
     assert stale.call_args.args == (6,)
     assert response.media_type == "text/csv"
     assert "techsync-operations-report.csv" in response.headers["content-disposition"]
-    body = response.body.decode("utf-8")
+    body = _streamed_body(response)
     assert "section,id,title" in body
     assert "stale_work_order,1,Old leak" in body
     assert "completion_cycle" in body
@@ -1427,8 +1524,8 @@ def test_dispatch_board_export_returns_summary_and_lane_csv():
         }
     ]
 
-    with patch("routers.dashboard.work_orders_repo.list_dispatch_board_work_orders", return_value=work_rows) as work_list:
-        with patch("routers.dashboard.technicians_repo.list_by_org", return_value=technician_rows):
+    with patch("services.dispatch_board_service.work_orders_repo.list_dispatch_board_work_orders", return_value=work_rows) as work_list:
+        with patch("services.roster_service.technicians_repo.list_by_org", return_value=technician_rows):
             response = dashboard_router.export_dispatch_board(
                 current_user=admin_user,
                 organization={"id": 6},
@@ -1437,7 +1534,7 @@ def test_dispatch_board_export_returns_summary_and_lane_csv():
     assert work_list.call_args.args == (6,)
     assert response.media_type == "text/csv"
     assert "techsync-dispatch-board.csv" in response.headers["content-disposition"]
-    body = response.body.decode("utf-8")
+    body = _streamed_body(response)
     assert "summary,open_count,1" in body
     assert "unassigned_work_order" in body
     assert "technician_lane" in body
@@ -1584,7 +1681,7 @@ def test_clients_export_returns_tenant_scoped_csv():
         }
     ]
 
-    with patch("routers.clients.clients_repo.list_by_org", return_value=rows) as list_by_org:
+    with patch("routers.clients.clients_repo.iter_by_org", return_value=rows) as list_by_org:
         response = clients_router.export_clients(
             active_only=True,
             current_user=admin_user,
@@ -1595,7 +1692,7 @@ def test_clients_export_returns_tenant_scoped_csv():
     assert list_by_org.call_args.kwargs == {"active_only": True}
     assert response.media_type == "text/csv"
     assert "techsync-clients.csv" in response.headers["content-disposition"]
-    body = response.body.decode("utf-8")
+    body = _streamed_body(response)
     assert "id,display_name,contact_name,email" in body
     assert "9,Riverside HOA,Casey Owner,owner@example.com" in body
 
@@ -1631,7 +1728,7 @@ def test_properties_export_returns_tenant_scoped_csv_with_client_filter():
         }
     ]
 
-    with patch("routers.properties.properties_repo.list_by_org", return_value=rows) as list_by_org:
+    with patch("routers.properties.properties_repo.iter_by_org", return_value=rows) as list_by_org:
         response = properties_router.export_properties(
             client_id=9,
             active_only=True,
@@ -1643,7 +1740,7 @@ def test_properties_export_returns_tenant_scoped_csv_with_client_filter():
     assert list_by_org.call_args.kwargs == {"client_id": 9, "active_only": True}
     assert response.media_type == "text/csv"
     assert "techsync-properties.csv" in response.headers["content-disposition"]
-    body = response.body.decode("utf-8")
+    body = _streamed_body(response)
     assert "id,client_id,name,address_line1" in body
     assert "3,9,Riverside Tower,1300 Demo Ridge" in body
 
@@ -1674,7 +1771,7 @@ def test_vendors_export_returns_tenant_scoped_csv_and_flattens_services():
         }
     ]
 
-    with patch("routers.vendors.vendors_repo.list_by_org", return_value=rows) as list_by_org:
+    with patch("routers.vendors.vendors_repo.iter_by_org", return_value=rows) as list_by_org:
         response = vendors_router.export_vendors(
             active_only=True,
             current_user=admin_user,
@@ -1685,12 +1782,23 @@ def test_vendors_export_returns_tenant_scoped_csv_and_flattens_services():
     assert list_by_org.call_args.kwargs == {"active_only": True}
     assert response.media_type == "text/csv"
     assert "techsync-vendors.csv" in response.headers["content-disposition"]
-    body = response.body.decode("utf-8")
+    body = _streamed_body(response)
     assert "id,name,contact_name,email" in body
     assert "11,Apex Demo Plumbing,Jordan Vendor,vendor@example.com" in body
     assert "plumbing; emergency" in body
 
 
+def test_entity_export_sends_the_header_first_and_then_bounded_chunks(monkeypatch):
+    monkeypatch.setattr(entity_export_service, "CSV_CHUNK_CHARS", 100)
+    rows = ({"id": index, "display_name": f"Client {index}"} for index in range(50))
+
+    chunks = list(entity_export_service.iter_clients_csv(rows))
+
+    assert chunks[0] == "id,display_name,contact_name,email,phone,client_type,notes,is_active,created_at,updated_at\r\n"
+    assert all(len(chunk) < 150 for chunk in chunks[1:])
+    assert "".join(chunks).count("\r\n") == 51
+
+
 def test_work_order_update_can_clear_entity_links_for_frontend_form():
     admin_user = User(
         id=5,
@@ -1754,12 +1862,12 @@ def test_work_order_update_can_clear_entity_links_for_frontend_form():
 
 
 def test_org_wide_event_message_and_attachment_export_reads_are_scoped():
-    with patch("repositories.work_order_events.fetch_all", return_value=[]) as events_fetch:
-        events_repo.list_by_org(organization_id=42)
-    with patch("repositories.work_order_messages.fetch_all", return_value=[]) as messages_fetch:
-        messages_repo.list_by_org(organization_id=42)
-    with patch("repositories.attachments.fetch_all", return_value=[]) as attachments_fetch:
-        attachments_repo.list_metadata_by_org(organization_id=42)
+    with patch("repositories.work_order_events.fetch_iter", return_value=iter([])) as events_fetch:
+        events_repo.iter_by_org(organization_id=42)
+    with patch("repositories.work_order_messages.fetch_iter", return_value=iter([])) as messages_fetch:
+        messages_repo.iter_by_org(organization_id=42)
+    with patch("repositories.attachments.fetch_iter", return_value=iter([])) as attachments_fetch:
+        attachments_repo.iter_metadata_by_org(organization_id=42)
 
     events_sql, events_params = events_fetch.call_args.args
     messages_sql, messages_params = messages_fetch.call_args.args
@@ -1813,19 +1921,19 @@ def test_tenant_export_bundle_uses_scoped_repositories_and_omits_secrets():
         }
     ]
 
-    with patch("services.tenant_export_service.users_repo.list_by_org", return_value=users) as users_list:
-        with patch("services.tenant_export_service.technicians_repo.list_by_org", return_value=[]) as tech_list:
-            with patch("services.tenant_export_service.clients_repo.list_by_org", return_value=[]) as clients_list:
-                with patch("services.tenant_export_service.properties_repo.list_by_org", return_value=[]) as props_list:
-                    with patch("services.tenant_export_service.vendors_repo.list_by_org", return_value=[]) as vendors_list:
-                        with patch("services.tenant_export_service.work_orders_repo.list_filtered", return_value=[]) as work_list:
-                            with patch("services.tenant_export_service.messages_repo.list_by_org", return_value=[]) as msg_list:
-                                with patch("services.tenant_export_service.events_repo.list_by_org", return_value=[]) as event_list:
+    with patch("services.tenant_export_service.users_repo.iter_by_org", return_value=users) as users_list:
+        with patch("services.tenant_export_service.technicians_repo.iter_by_org", return_value=[]) as tech_list:
+            with patch("services.tenant_export_service.clients_repo.iter_by_org", return_value=[]) as clients_list:
+                with patch("services.tenant_export_service.properties_repo.iter_by_org", return_value=[]) as props_list:
+                    with patch("services.tenant_export_service.vendors_repo.iter_by_org", return_value=[]) as vendors_list:
+                        with patch("services.tenant_export_service.work_orders_repo.iter_by_org", return_value=[]) as work_list:
+                            with patch("services.tenant_export_service.messages_repo.iter_by_org", return_value=[]) as msg_list:
+                                with patch("services.tenant_export_service.events_repo.iter_by_org", return_value=[]) as event_list:
                                     with patch(
-                                        "services.tenant_export_service.attachments_repo.list_metadata_by_org",
+                                        "services.tenant_export_service.attachments_repo.iter_metadata_by_org",
                                         return_value=attachments,
                                     ) as attachment_list:
-                                        bundle = tenant_export_service.build_tenant_export(organization)
+                                        bundle = json.loads("".join(tenant_export_service.iter_tenant_export(organization)))
 
     assert users_list.call_args.args == (6,)
     assert tech_list.call_args.args == (6,)
@@ -1856,15 +1964,9 @@ def test_tenant_export_route_returns_downloadable_json():
         role="org_admin",
         is_active=True,
     )
-    bundle = {
-        "schema_version": "techsync_ops_tenant_export.v1",
-        "organization": {"id": 6, "name": "Riverside Demo"},
-        "record_counts": {},
-        "data": {},
-        "omitted_sensitive_fields": [],
-    }
+    chunks = ['{"schema_version":"techsync_ops_tenant_export.v1",', '"data":{},"record_counts":{}}']
 
-    with patch("routers.organizations.tenant_export_service.build_tenant_export", return_value=bundle) as build:
+    with patch("routers.organizations.tenant_export_service.iter_tenant_export", return_value=iter(chunks)) as build:
         response = organizations_router.export_my_organization(
             current_user=admin_user,
             organization={"id": 6, "name": "Riverside Demo"},
@@ -1873,3 +1975,41 @@ def test_tenant_export_route_returns_downloadable_json():
     assert build.call_args.args == ({"id": 6, "name": "Riverside Demo"},)
     assert response.media_type == "application/json"
     assert "techsync-tenant-export.json" in response.headers["content-disposition"]
+    assert json.loads(_streamed_body(response))["schema_version"] == "techsync_ops_tenant_export.v1"
+
+
+def test_tenant_export_streams_rows_in_chunks_and_counts_them_on_the_way(monkeypatch):
+    monkeypatch.setattr(tenant_export_service, "EXPORT_CHUNK_CHARS", 200)
+    created_at = datetime(2026, 7, 28, tzinfo=timezone.utc)
+    work_orders = ({"id": index, "title": f"Leak {index}", "created_at": created_at} for index in range(40))
+    sections_read = []
+
+    def source(name, rows=()):
+        def read(organization_id):
+            sections_read.append(name)
+            return rows
+
+        return read
+
+    monkeypatch.setattr(tenant_export_service.users_repo, "iter_by_org", source("users"))
+    monkeypatch.setattr(tenant_export_service.technicians_repo, "iter_by_org", source("technicians"))
+    monkeypatch.setattr(tenant_export_service.clients_repo, "iter_by_org", source("clients"))
+    monkeypatch.setattr(tenant_export_service.properties_repo, "iter_by_org", source("properties"))
+    monkeypatch.setattr(tenant_export_service.vendors_repo, "iter_by_org", source("vendors"))
+    monkeypatch.setattr(tenant_export_service.work_orders_repo, "iter_by_org", source("work_orders", work_orders))
+    monkeypatch.setattr(tenant_export_service.messages_repo, "iter_by_org", source("messages"))
+    monkeypatch.setattr(tenant_export_service.events_repo, "iter_by_org", source("events"))
+    monkeypatch.setattr(tenant_export_service.attachments_repo, "iter_metadata_by_org", source("attachments"))
+
+    stream = tenant_export_service.iter_tenant_export({"id": 6, "name": "Riverside Demo"})
+    first = next(stream)
+    assert sections_read == []
+    chunks = [first, *stream]
+
+    bundle = json.loads("".join(chunks))
+    assert len(chunks) > 5
+    assert max(len(chunk) for chunk in chunks[:-1]) < 300
+    assert bundle["record_counts"]["work_orders"] == 40
+    assert bundle["record_counts"]["users"] == 0
+    assert bundle["data"]["work_orders"][0] == {"id": 0, "title": "Leak 0", "created_at": "2026-07-28T00:00:00+00:00"}
+    assert bundle["organization"] == {"id": 6, "name": "Riverside Demo"}
@@ -1,6 +1,10 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 
 from models.work_order import ALLOWED_STATUS_TRANSITIONS
+from repositories import work_orders as work_orders_repo
 from services import work_order_service
 
 
@@ -58,13 +62,38 @@ def test_archived_is_terminal():
     assert ALLOWED_STATUS_TRANSITIONS["archived"] == set()
 
 
-def test_completion_requires_proof_or_override(monkeypatch):
+def _fake_transition(monkeypatch, status, has_proof=False):
+    """Stand-in for work_orders_repo.transition_status over one row in ``status``."""
+    calls = []
+
+    def fake(organization_id, work_order_id, from_status, to_status, actor_user_id, event_notes, **completion):
+        calls.append({"from_status": from_status, "to_status": to_status, "event_notes": event_notes, **completion})
+        if from_status != status:
+            return {"current_status": status, "has_proof": has_proof, "work_order": None}
+        patch = {"status": to_status}
+        if to_status == "completed":
+            if not has_proof and completion["override_reason"] is None:
+                return {"current_status": status, "has_proof": False, "work_order": None}
+            patch["completion_proof_verified_at"] = "now" if has_proof else None
+            patch["completion_override_reason"] = None if has_proof else completion["override_reason"]
+            patch["completion_notes"] = completion["completion_notes"]
+        return {
+            "current_status": status,
+            "has_proof": has_proof,
+            "work_order": {"id": work_order_id, "organization_id": organization_id, **patch},
+        }
+
+    monkeypatch.setattr(work_order_service.work_orders_repo, "transition_status", fake)
     monkeypatch.setattr(
         work_order_service.work_orders_repo,
         "get_by_id_in_org",
-        lambda work_order_id, organization_id: {"id": work_order_id, "status": "in_progress"},
+        lambda work_order_id, organization_id: {"id": work_order_id, "status": status},
     )
-    monkeypatch.setattr(work_order_service.attachments_repo, "has_for_work_order", lambda *_: False)
+    return calls
+
+
+def test_completion_requires_proof_or_override(monkeypatch):
+    _fake_transition(monkeypatch, "in_progress", has_proof=False)
 
     with pytest.raises(work_order_service.CompletionProofRequired):
         work_order_service.transition_status(
@@ -78,21 +107,7 @@ def test_completion_requires_proof_or_override(monkeypatch):
 
 
 def test_completion_with_attachment_sets_proof_timestamp(monkeypatch):
-    updated_patch = {}
-
-    monkeypatch.setattr(
-        work_order_service.work_orders_repo,
-        "get_by_id_in_org",
-        lambda work_order_id, organization_id: {"id": work_order_id, "status": "in_progress"},
-    )
-    monkeypatch.setattr(work_order_service.attachments_repo, "has_for_work_order", lambda *_: True)
-
-    def fake_update(work_order_id, organization_id, patch):
-        updated_patch.update(patch)
-        return {"id": work_order_id, "organization_id": organization_id, **patch}
-
-    monkeypatch.setattr(work_order_service.work_orders_repo, "update", fake_update)
-    monkeypatch.setattr(work_order_service.events_repo, "create_event", lambda *args, **kwargs: {})
+    _fake_transition(monkeypatch, "in_progress", has_proof=True)
 
     row = work_order_service.transition_status(
         organization_id=1,
@@ -104,34 +119,15 @@ def test_completion_with_attachment_sets_proof_timestamp(monkeypatch):
     )
 
     assert row["status"] == "completed"
-    assert updated_patch["completion_proof_verified_at"]
-    assert updated_patch["completion_override_reason"] is None
-    assert updated_patch["completion_notes"] == "done"
+    assert row["completion_proof_verified_at"]
+    assert row["completion_override_reason"] is None
+    assert row["completion_notes"] == "done"
 
 
 def test_manager_override_allows_completion_without_attachment(monkeypatch):
-    updated_patch = {}
-    event_payload = {}
-
-    monkeypatch.setattr(
-        work_order_service.work_orders_repo,
-        "get_by_id_in_org",
-        lambda work_order_id, organization_id: {"id": work_order_id, "status": "in_progress"},
-    )
-    monkeypatch.setattr(work_order_service.attachments_repo, "has_for_work_order", lambda *_: False)
-
-    def fake_update(work_order_id, organization_id, patch):
-        updated_patch.update(patch)
-        return {"id": work_order_id, "organization_id": organization_id, **patch}
-
-    def fake_event(*args, **kwargs):
-        event_payload.update(kwargs)
-        return {}
-
-    monkeypatch.setattr(work_order_service.work_orders_repo, "update", fake_update)
-    monkeypatch.setattr(work_order_service.events_repo, "create_event", fake_event)
+    calls = _fake_transition(monkeypatch, "in_progress", has_proof=False)
 
-    work_order_service.transition_status(
+    row = work_order_service.transition_status(
         organization_id=1,
         work_order_id=2,
         new_status="completed",
@@ -141,18 +137,13 @@ def test_manager_override_allows_completion_without_attachment(monkeypatch):
         completion_override_reason="Technician completed in person before photo policy existed",
     )
 
-    assert updated_patch["completion_override_reason"].startswith("Technician completed")
-    assert updated_patch["completion_proof_verified_at"] is None
-    assert event_payload["notes"].startswith("Completion override:")
+    assert row["completion_override_reason"].startswith("Technician completed")
+    assert row["completion_proof_verified_at"] is None
+    assert calls[0]["event_notes"].startswith("Completion override:")
 
 
 def test_technician_override_is_not_allowed(monkeypatch):
-    monkeypatch.setattr(
-        work_order_service.work_orders_repo,
-        "get_by_id_in_org",
-        lambda work_order_id, organization_id: {"id": work_order_id, "status": "in_progress"},
-    )
-    monkeypatch.setattr(work_order_service.attachments_repo, "has_for_work_order", lambda *_: False)
+    calls = _fake_transition(monkeypatch, "in_progress", has_proof=False)
 
     with pytest.raises(work_order_service.CompletionOverrideNotAllowed):
         work_order_service.transition_status(
@@ -165,13 +156,11 @@ def test_technician_override_is_not_allowed(monkeypatch):
             completion_override_reason="No photo available",
         )
 
+    assert calls[0]["override_reason"] is None
+
 
 def test_archive_requires_manager_role(monkeypatch):
-    monkeypatch.setattr(
-        work_order_service.work_orders_repo,
-        "get_by_id_in_org",
-        lambda work_order_id, organization_id: {"id": work_order_id, "status": "completed"},
-    )
+    calls = _fake_transition(monkeypatch, "completed")
 
     with pytest.raises(work_order_service.ArchiveNotAllowed):
         work_order_service.transition_status(
@@ -183,29 +172,13 @@ def test_archive_requires_manager_role(monkeypatch):
             notes=None,
         )
 
+    assert calls == []
 
-def test_manager_can_archive_completed_work(monkeypatch):
-    updated_patch = {}
-    event_payload = {}
 
-    monkeypatch.setattr(
-        work_order_service.work_orders_repo,
-        "get_by_id_in_org",
-        lambda work_order_id, organization_id: {"id": work_order_id, "status": "completed"},
-    )
-
-    def fake_update(work_order_id, organization_id, patch):
-        updated_patch.update(patch)
-        return {"id": work_order_id, "organization_id": organization_id, **patch}
-
-    def fake_event(*args, **kwargs):
-        event_payload.update(kwargs)
-        return {}
-
-    monkeypatch.setattr(work_order_service.work_orders_repo, "update", fake_update)
-    monkeypatch.setattr(work_order_service.events_repo, "create_event", fake_event)
+def test_manager_can_archive_completed_work(monkeypatch):
+    calls = _fake_transition(monkeypatch, "completed")
 
-    work_order_service.transition_status(
+    row = work_order_service.transition_status(
         organization_id=1,
         work_order_id=2,
         new_status="archived",
@@ -214,5 +187,98 @@ def test_manager_can_archive_completed_work(monkeypatch):
         notes="Retained for historical record",
     )
 
-    assert updated_patch["status"] == "archived"
-    assert event_payload["to_status"] == "archived"
+    assert row["status"] == "archived"
+    assert calls[0]["to_status"] == "archived"
+
+
+def test_losing_a_race_revalidates_against_the_committed_status(monkeypatch):
+    # Another technician completed the order between our read and our update.
+    calls = _fake_transition(monkeypatch, "completed")
+
+    with pytest.raises(work_order_service.InvalidStatusTransition) as exc_info:
+        work_order_service.transition_status(
+            organization_id=1,
+            work_order_id=2,
+            new_status="paused",
+            actor_user_id=3,
+            actor_role="technician",
+            notes=None,
+            work_order={"id": 2, "status": "in_progress"},
+        )
+
+    assert exc_info.value.from_status == "completed"
+    assert [call["from_status"] for call in calls] == ["in_progress"]
+
+
+def test_transition_is_one_conditional_statement_with_its_audit_event():
+    row = {"transition_current_status": "open", "transition_has_proof": False, "id": 2, "status": "in_progress"}
+    with patch("repositories.work_orders.fetch_one_in_transaction", return_value=dict(row)) as query:
+        result = work_orders_repo.transition_status(1, 2, "open", "in_progress", actor_user_id=3, event_notes=None)
+
+    sql, params = query.call_args.args
+    assert "AND wo.status = :from_status" in sql
+    assert "INSERT INTO work_order_events" in sql
+    assert "SELECT EXISTS" in sql and "COUNT(" not in sql
+    assert params["from_status"] == "open"
+    assert result == {"current_status": "open", "has_proof": False, "work_order": {"id": 2, "status": "in_progress"}}
+
+
+def test_bulk_status_reports_an_outcome_per_work_order():
+    from models.work_order import WorkOrderBulkStatusUpdate
+    from routers import work_orders as work_orders_router
+
+    def result(work_order_id, previous_status, has_proof=False, updated=False):
+        row = {"id": work_order_id, "status": "completed", "assigned_technician_id": 4} if updated else None
+        return {"work_order_id": work_order_id, "previous_status": previous_status, "has_proof": has_proof, "updated": row}
+
+    results = [
+        result(1, "in_progress", has_proof=True, updated=True),
+        result(2, "in_progress"),
+        result(3, "open"),
+        result(4, "completed"),
+        result(5, None),
+        result(6, "escalated", has_proof=True),
+    ]
+    payload = WorkOrderBulkStatusUpdate(work_order_ids=[1, 2, 3, 4, 5, 6], status="completed", notes="Week 42")
+
+    with patch.object(work_order_service.work_orders_repo, "transition_status_many", return_value=results) as bulk:
+        response = work_orders_router.bulk_update_status(
+            payload, current_user=SimpleNamespace(id=3), organization={"id": 1}
+        )
+
+    kwargs = bulk.call_args.kwargs
+    assert bulk.call_args.args == (1, [1, 2, 3, 4, 5, 6])
+    assert sorted(kwargs["from_statuses"]) == ["escalated", "in_progress"]
+    assert kwargs["completion_notes"] == "Week 42"
+    assert response.updated_count == 1
+    assert [(item.work_order_id, item.outcome, item.status) for item in response.results] == [
+        (1, "updated", "completed"),
+        (2, "proof_required", "in_progress"),
+        (3, "invalid_transition", "open"),
+        (4, "unchanged", "completed"),
+        (5, "not_found", None),
+        (6, "conflict", "escalated"),
+    ]
+
+
+def test_bulk_status_is_one_set_based_statement():
+    updated_columns = {"id": 7, "status": "archived", "transition_previous_status": "completed"}
+    missing_columns = {"id": None, "status": None, "transition_previous_status": None}
+    rows = [
+        {"requested_id": 7, "requested_previous_status": "completed", "requested_has_proof": False, **updated_columns},
+        {"requested_id": 8, "requested_previous_status": None, "requested_has_proof": None, **missing_columns},
+    ]
+    with patch("repositories.work_orders.fetch_all_in_transaction", return_value=rows) as query:
+        results = work_orders_repo.transition_status_many(
+            1, [7, 8, 7], "archived", ["completed", "cancelled"], actor_user_id=3, event_notes=None
+        )
+
+    sql, params = query.call_args.args
+    assert "unnest(CAST(:work_order_ids AS BIGINT[])) WITH ORDINALITY" in sql
+    assert "checked.status = ANY(CAST(:from_statuses AS TEXT[]))" in sql
+    assert "INSERT INTO work_order_events" in sql
+    assert params["organization_id"] == 1
+    assert results == [
+        {"work_order_id": 7, "previous_status": "completed", "has_proof": False, "updated": {"id": 7, "status": "archived"}},
+        {"work_order_id": 8, "previous_status": None, "has_proof": None, "updated": None},
+    ]
@@ -0,0 +1,199 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import database
+from services import work_order_service, workload_service
+
+
+def make_technician(id, max_daily_jobs=8, skills=None):
+    return {
+        "id": id,
+        "user_id": 100 + id,
+        "skills": skills or ["plumbing"],
+        "zone": None,
+        "latitude": None,
+        "longitude": None,
+        "availability_status": "available",
+        "max_daily_jobs": max_daily_jobs,
+        "users": {"full_name": f"Tech {id}", "email": f"tech{id}@example.com"},
+    }
+
+
+def test_snapshot_is_loaded_with_one_grouped_query_and_cached():
+    rows = [
+        {"technician_id": 4, "status": "open", "count": 2},
+        {"technician_id": 4, "status": "paused", "count": 1},
+        {"technician_id": 5, "status": "in_progress", "count": 3},
+    ]
+    with patch("services.workload_service.work_orders_repo.active_counts_by_technician", return_value=rows) as counts:
+        first = workload_service.get_snapshot(6)
+        second = workload_service.get_snapshot(6)
+
+    counts.assert_called_once_with(6)
+    assert second is first
+    assert first.active_counts() == {4: 2, 5: 3}
+    assert first.active_count(4, workload_service.WORKLOAD_STATUSES) == 3
+
+
+def test_record_change_is_private_to_the_unit_until_it_commits():
+    with patch("services.workload_service.work_orders_repo.active_counts_by_technician", return_value=[]):
+        shared = workload_service.get_snapshot(6)
+
+    for outcome in ("rollback", "commit"):
+        unit = database.UnitOfWork()
+        database.bind_unit_of_work(unit)
+        workload_service.record_change(6, None, "open", 4, "open")
+        workload_service.record_change(6, 4, "open", 4, "in_progress")
+        with patch("services.workload_service.work_orders_repo.active_counts_by_technician") as counts:
+            snapshot = workload_service.get_snapshot(6)
+            with database.outside_unit_of_work():
+                elsewhere = workload_service.get_snapshot(6)
+            counts.assert_not_called()
+        assert snapshot.counts == {4: {"open": 0, "in_progress": 1}}
+        assert elsewhere is shared
+
+        getattr(unit, outcome)()
+        unit.close()
+        if outcome == "rollback":
+            assert workload_service.get_snapshot(6) is shared
+
+    committed = [{"technician_id": 4, "status": "in_progress", "count": 1}]
+    with patch(
+        "services.workload_service.work_orders_repo.active_counts_by_technician", return_value=committed
+    ) as counts:
+        assert workload_service.get_snapshot(6).counts == {4: {"in_progress": 1}}
+    counts.assert_called_once_with(6)
+
+
+def test_counts_that_overlap_a_committed_change_are_not_cached():
+    def count_while_another_request_commits(organization_id):
+        workload_service.record_change(organization_id, None, "open", 4, "open")
+        return [{"technician_id": 4, "status": "open", "count": 1}]
+
+    with patch(
+        "services.workload_service.work_orders_repo.active_counts_by_technician",
+        side_effect=count_while_another_request_commits,
+    ):
+        workload_service.get_snapshot(6)
+
+    with patch("services.workload_service.work_orders_repo.active_counts_by_technician", return_value=[]) as counts:
+        workload_service.get_snapshot(6)
+    counts.assert_called_once_with(6)
+
+
+def test_overloaded_technicians_are_read_from_the_snapshot():
+    rows = [
+        {"technician_id": 4, "status": "open", "count": 2},
+        {"technician_id": 4, "status": "escalated", "count": 1},
+        {"technician_id": 4, "status": "paused", "count": 5},
+        {"technician_id": 5, "status": "open", "count": 1},
+    ]
+    with patch("services.workload_service.work_orders_repo.active_counts_by_technician", return_value=rows):
+        with patch(
+            "services.roster_service.technicians_repo.list_by_org",
+            return_value=[make_technician(4, max_daily_jobs=2), make_technician(5, max_daily_jobs=2)],
+        ):
+            overloaded = workload_service.list_overloaded_technicians(6, limit=5)
+
+    assert overloaded == [
+        {
+            "technician_id": 4,
+            "user_id": 104,
+            "full_name": "Tech 4",
+            "email": "tech4@example.com",
+            "availability_status": "available",
+            "max_daily_jobs": 2,
+            "active_work_order_count": 3,
+        }
+    ]
+
+
+def test_sequential_auto_assignments_see_each_others_workload():
+    technicians = [make_technician(4, max_daily_jobs=8), make_technician(5, max_daily_jobs=8)]
+    assigned = []
+
+    def fake_update(work_order_id, organization_id, patch):
+        assigned.append(patch["assigned_technician_id"])
+        return {"id": work_order_id, "organization_id": organization_id, "status": "open", **patch}
+
+    with patch("services.workload_service.work_orders_repo.active_counts_by_technician", return_value=[]) as counts, \
+            patch.object(work_order_service.technicians_repo, "list_by_org", return_value=technicians), \
+            patch.object(work_order_service.work_orders_repo, "update", side_effect=fake_update), \
+            patch.object(work_order_service.events_repo, "create_event"), \
+            patch.object(work_order_service.notification_service, "notify_technician_assigned"), \
+            database.unit_of_work():
+        for work_order_id in (1, 2):
+            work_order_service.auto_assign(
+                6, {"id": work_order_id, "status": "open", "service_type": "plumbing", "assigned_technician_id": None}
+            )
+
+    counts.assert_called_once_with(6)
+    assert sorted(assigned) == [4, 5]
+
+
+def test_auto_assign_batch_endpoint_reports_assigned_unassigned_and_skipped():
+    from models.work_order import WorkOrderAutoAssignBatch
+    from routers import work_orders as work_orders_router
+
+    candidates = [
+        {"id": 1, "status": "open", "priority": "low", "service_type": "plumbing", "assigned_technician_id": None},
+        {"id": 2, "status": "open", "priority": "emergency", "service_type": "plumbing", "assigned_technician_id": None},
+    ]
+
+    def fake_assign_many(organization_id, assignments):
+        return [
+            {"id": work_order_id, "status": "open", "assigned_technician_id": technician_id}
+            for work_order_id, technician_id in assignments.items()
+        ]
+
+    with patch.object(work_orders_router.work_orders_repo, "list_assignable", return_value=candidates) as assignable, \
+            patch("services.workload_service.work_orders_repo.active_counts_by_technician", return_value=[]), \
+            patch.object(work_order_service.technicians_repo, "list_by_org", return_value=[make_technician(4, max_daily_jobs=1)]), \
+            patch.object(work_order_service.work_orders_repo, "assign_many", side_effect=fake_assign_many), \
+            patch.object(work_order_service.events_repo, "create_events"), \
+            patch.object(work_order_service.notification_service, "notify_technician_assigned"):
+        result = work_orders_router.auto_assign_batch(
+            WorkOrderAutoAssignBatch(work_order_ids=[1, 2, 3]), current_user=None, organization={"id": 6}
+        )
+
+    assignable.assert_called_once_with(6, [1, 2, 3])
+    assert [(item.work_order_id, item.technician_id) for item in result.assignments] == [(2, 4)]
+    assert result.unassigned_work_order_ids == [1]
+    assert result.skipped_work_order_ids == [3]
+
+
+def test_bulk_assign_moves_workload_and_reports_each_order():
+    from models.work_order import WorkOrderBulkAssign
+    from routers import work_orders as work_orders_router
+
+    workload_service._snapshots.set(6, workload_service.WorkloadSnapshot(6, {4: {"open": 2}}))
+    results = [
+        {
+            "work_order_id": 1,
+            "previous_status": "open",
+            "previous_technician_id": 4,
+            "updated": {"id": 1, "status": "open", "assigned_technician_id": 5},
+        },
+        {"work_order_id": 2, "previous_status": "open", "previous_technician_id": 5, "updated": None},
+        {"work_order_id": 3, "previous_status": None, "previous_technician_id": None, "updated": None},
+    ]
+
+    with patch.object(work_order_service.technicians_repo, "get_by_id_in_org", return_value=make_technician(5)), \
+            patch.object(work_order_service.work_orders_repo, "reassign_many", return_value=results) as bulk, \
+            patch.object(work_order_service.notification_service, "notify_technician_assigned") as notify, \
+            database.unit_of_work():
+        response = work_orders_router.bulk_assign(
+            WorkOrderBulkAssign(work_order_ids=[1, 2, 3], technician_id=5, notes="Covering sick leave"),
+            current_user=SimpleNamespace(id=9),
+            organization={"id": 6},
+        )
+        active_counts = workload_service.get_snapshot(6).active_counts()
+
+    bulk.assert_called_once_with(6, [1, 2, 3], 5, 9, "Covering sick leave")
+    notify.assert_called_once()
+    assert [(item.work_order_id, item.outcome) for item in response.results] == [
+        (1, "updated"),
+        (2, "unchanged"),
+        (3, "not_found"),
+    ]
+    assert active_counts == {4: 1, 5: 1}